@@ -1,16 +1,27 @@
 import asyncio
+import importlib.util
 import logging
 import random
 from contextlib import asynccontextmanager
+from typing import AsyncIterator, Sequence
 import httpx
 
 from openproject_mcp.config import Settings
 from openproject_mcp.errors import AuthError, NotFound, ValidationError
+from openproject_mcp.utils.attachment_cache import AttachmentCache
+from openproject_mcp.utils.project_index import ProjectIndex
+from openproject_mcp.utils.projection import collection_select
+from openproject_mcp.utils.reference_data import ReferenceDataCache
+from openproject_mcp.utils.rate_limit import RateLimiter, parse_retry_after
+from openproject_mcp.utils.singleflight import SingleFlight
 
 log = logging.getLogger(__name__)
 
 RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
 
+# GET kwargs that are part of the coalescing key; any other kwarg bypasses it
+COALESCABLE_KWARGS = {"params", "headers"}
+
 
 def _build_timeout(settings: Settings) -> httpx.Timeout:
     # You only have connect/read in Settings. Provide all four explicitly to httpx.
@@ -22,6 +33,14 @@ def _build_timeout(settings: Settings) -> httpx.Timeout:
     )
 
 
+def _build_limits(settings: Settings) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.pool_max_connections,
+        max_keepalive_connections=settings.pool_max_keepalive,
+        keepalive_expiry=settings.pool_keepalive_expiry,
+    )
+
+
 def _raise_mapped(res: httpx.Response) -> None:
     # Map to the exceptions your tests expect
     sc = res.status_code
@@ -38,10 +57,25 @@ def _raise_mapped(res: httpx.Response) -> None:
     res.raise_for_status()
 
 
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
 class OpenProjectClient:
     def __init__(self, settings: Settings):
         self.settings = settings
         self._client: httpx.AsyncClient | None = None
+        # Shared by every request so throttling from one tool slows them all
+        self.limiter = RateLimiter(
+            rate=settings.rate_limit_per_second,
+            burst=settings.rate_limit_burst,
+            min_rate=settings.rate_limit_min_per_second,
+            max_pause=settings.max_retry_after,
+        )
+        self.singleflight = SingleFlight()
+        self.reference_data = ReferenceDataCache(self, settings)
+        self.project_index = ProjectIndex(self, settings)
+        self.attachments = AttachmentCache(self, settings)
         # Ensure no double slashes in base_url
         base = str(self.settings.url).rstrip("/")
         self.base_url = f"{base}/api/v3"
@@ -54,31 +88,96 @@ class OpenProjectClient:
             "Accept": "application/json",
         }
 
+    def open(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=_build_timeout(self.settings),
+                limits=_build_limits(self.settings),
+                http2=self._use_http2(),
+            )
+        return self._client
+
+    def _use_http2(self) -> bool:
+        if not self.settings.http2:
+            return False
+        if not _http2_available():
+            log.warning(
+                "http2 is enabled but the 'h2' package is not installed; "
+                "using HTTP/1.1 (install openproject-mcp-server[http2])"
+            )
+            return False
+        # httpx offers h2 via ALPN and falls back to HTTP/1.1 per connection
+        return True
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "OpenProjectClient":
+        self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     @asynccontextmanager
     async def session(self):
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            timeout=_build_timeout(self.settings),
-        ) as s:
-            yield s
-
-    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        # Connections are kept alive between requests; the pool is only
+        # torn down by aclose() (normally at server shutdown).
+        yield self.open()
+
+    async def _request(
+        self, method: str, path: str, *, stream: bool = False, **kwargs
+    ) -> httpx.Response:
         retries = self.settings.max_retries
         backoff = 0.5
 
         for attempt in range(retries):
+            await self.limiter.acquire()
             async with self.session() as s:
                 try:
-                    res = await s.request(method, path, **kwargs)
+                    if stream:
+                        res = await s.send(
+                            s.build_request(method, path, **kwargs), stream=True
+                        )
+                    else:
+                        res = await s.request(method, path, **kwargs)
+                    log.debug(
+                        "%s %s -> %s (%s)",
+                        method,
+                        path,
+                        res.status_code,
+                        res.http_version,
+                    )
+
+                    self.limiter.observe(res.headers)
 
                     if res.is_success:
+                        self.limiter.on_success()
                         return res
+                    if stream:
+                        # Error bodies are small; read them so they can be reported
+                        await res.aread()
+
+                    retry_after = parse_retry_after(
+                        res.headers.get("Retry-After"), self.settings.max_retry_after
+                    )
+                    if res.status_code == 429:
+                        # Slows every caller and, with Retry-After, pauses them
+                        self.limiter.on_throttled(retry_after)
 
                     # Retry transient server/limit errors
                     if res.status_code in RETRYABLE_STATUSES and attempt < retries - 1:
-                        await asyncio.sleep(backoff + random.random() * 0.2)
-                        backoff *= 2
+                        if retry_after is None:
+                            await asyncio.sleep(backoff + random.random() * 0.2)
+                            backoff *= 2
+                        elif not self.limiter.enabled or res.status_code != 429:
+                            await asyncio.sleep(retry_after)
                         continue
 
                     # Non-retryable: raise mapped domain errors
@@ -87,15 +186,52 @@ class OpenProjectClient:
                     )  # will raise or fall through to res.raise_for_status()
                     return res
 
-                except (httpx.ConnectError, httpx.ReadTimeout):
+                except (
+                    httpx.ConnectError,
+                    httpx.ReadTimeout,
+                    httpx.RemoteProtocolError,
+                ):
+                    # RemoteProtocolError covers a pooled keep-alive connection
+                    # that the server closed while it sat idle.
                     if attempt < retries - 1:
                         await asyncio.sleep(backoff)
                         backoff *= 2
                         continue
                     raise
 
+    def _flight_key(self, path: str, kwargs: dict) -> tuple | None:
+        if not self.settings.coalesce_gets or not set(kwargs) <= COALESCABLE_KWARGS:
+            return None
+        # Normalise params so dict ordering / inline query strings compare equal
+        url = httpx.URL(path).copy_merge_params(kwargs.get("params") or {})
+        params = tuple(sorted(url.params.multi_items()))
+        headers = tuple(
+            sorted((k.lower(), v) for k, v in (kwargs.get("headers") or {}).items())
+        )
+        return (url.path, params, headers)
+
     async def get(self, path: str, **kwargs):
-        return await self._request("GET", path, **kwargs)
+        key = self._flight_key(path, kwargs)
+        if key is None:
+            return await self._request("GET", path, **kwargs)
+        return await self.singleflight.do(
+            key, lambda: self._request("GET", path, **kwargs)
+        )
+
+    @asynccontextmanager
+    async def stream(self, method: str, path: str, **kwargs):
+        """
+        Send a request and yield the response before its body is read.
+
+        Status handling, retries and rate limiting match the other methods,
+        but only up to the response headers; once the body is being consumed
+        the caller owns recovery. The response is closed on exit.
+        """
+        res = await self._request(method, path, stream=True, **kwargs)
+        try:
+            yield res
+        finally:
+            await res.aclose()
 
     async def post(self, path: str, **kwargs):
         return await self._request("POST", path, **kwargs)
@@ -105,3 +241,73 @@ class OpenProjectClient:
 
     async def delete(self, path: str, **kwargs):
         return await self._request("DELETE", path, **kwargs)
+
+    async def iter_collection(
+        self,
+        path: str,
+        params: dict | None = None,
+        *,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        select: str | Sequence[str] | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield the elements of a paginated HAL collection one at a time.
+
+        Pages are requested lazily. With prefetch, the next page is requested
+        while the caller is still consuming the current one. Iteration stops
+        after max_items elements without fetching further pages.
+
+        select may be a raw OpenProject select string or a list of element
+        fields, e.g. ["id", "subject"] -> "total,pageSize,elements/id,...".
+        """
+        params = dict(params or {})
+        page_size = page_size or self.settings.page_size_max
+        if select:
+            if not isinstance(select, str):
+                select = collection_select(select, ("total", "pageSize"))
+            params["select"] = select
+
+        def fetch(offset: int) -> asyncio.Future:
+            return asyncio.ensure_future(
+                self.get(
+                    path, params={**params, "pageSize": page_size, "offset": offset}
+                )
+            )
+
+        offset = 1
+        yielded = 0
+        pending: asyncio.Future | None = fetch(offset)
+        try:
+            while pending is not None:
+                data = (await pending).json()
+                pending = None
+                elements = data.get("_embedded", {}).get("elements", [])
+                size = data.get("pageSize") or page_size
+                total = data.get("total")
+                has_more = bool(elements) and (
+                    offset * size < total
+                    if total is not None
+                    else len(elements) >= size
+                )
+                more_wanted = max_items is None or yielded + len(elements) < max_items
+                if has_more and more_wanted and prefetch:
+                    pending = fetch(offset + 1)
+
+                for element in elements:
+                    if max_items is not None and yielded >= max_items:
+                        return
+                    yield element
+                    yielded += 1
+
+                if not (has_more and more_wanted):
+                    return
+                offset += 1
+                if pending is None:
+                    pending = fetch(offset)
+        finally:
+            # The read-ahead page is no longer wanted; don't leak its errors
+            if pending is not None:
+                pending.cancel()
+                pending.add_done_callback(lambda f: f.cancelled() or f.exception())
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, AnyHttpUrl
 import os
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -34,6 +35,93 @@ class Settings(BaseSettings):
     max_retries: int = Field(
         default=3, description="Maximum number of retries for failed requests"
     )
+    pool_max_connections: int = Field(
+        default=20, description="Maximum number of concurrent HTTP connections"
+    )
+    pool_max_keepalive: int = Field(
+        default=10, description="Maximum number of idle keep-alive connections"
+    )
+    pool_keepalive_expiry: float = Field(
+        default=30.0, description="Seconds an idle keep-alive connection is kept"
+    )
+    rate_limit_per_second: float = Field(
+        default=10.0,
+        description=(
+            "Client-wide request rate applied once the server throttles"
+            " (0 disables the limiter)"
+        ),
+    )
+    rate_limit_burst: int = Field(
+        default=20, description="Requests allowed in a burst above the rate"
+    )
+    rate_limit_min_per_second: float = Field(
+        default=0.5, description="Lowest rate the limiter backs off to on 429"
+    )
+    max_retry_after: float = Field(
+        default=60.0, description="Upper bound in seconds for honoring Retry-After"
+    )
+    coalesce_gets: bool = Field(
+        default=True,
+        description="Share one upstream request between identical concurrent GETs",
+    )
+    status_cache_ttl: float = Field(
+        default=3600.0, description="Seconds to cache /statuses (0 disables)"
+    )
+    type_cache_ttl: float = Field(
+        default=3600.0, description="Seconds to cache work package types"
+    )
+    max_concurrency: int = Field(
+        default=8, description="Maximum concurrent requests a single tool issues"
+    )
+    search_source_timeout: float = Field(
+        default=15.0,
+        description="Seconds search_content waits for each attachment filter",
+    )
+    download_inline_max_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        description="Largest attachment download_attachment returns inline (base64)",
+    )
+    parallel_download_threshold: int = Field(
+        default=64 * 1024 * 1024,
+        description="Attachments at least this large are downloaded in parallel ranges",
+    )
+    parallel_download_segments: int = Field(
+        default=4, description="Byte ranges fetched concurrently for large downloads"
+    )
+    attachment_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for cached attachment content "
+        "(default: $XDG_CACHE_HOME/openproject-mcp/attachments)",
+    )
+    attachment_cache_max_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        description="Size bound for cached attachment content; 0 disables it",
+    )
+    attachment_metadata_ttl: float = Field(
+        default=3600.0, description="Seconds to cache attachment metadata"
+    )
+    output_mode: Literal["compact", "full"] = Field(
+        default="full",
+        description="Default tool output: raw HAL JSON (full) or lean "
+        "projections of work packages, projects, users, memberships and "
+        "time entries (compact)",
+    )
+    project_index_page_size: int = Field(
+        default=500, description="Page size used when loading the project index"
+    )
+    project_index_refresh_interval: float = Field(
+        default=300.0,
+        description="Seconds before the project index pulls recently updated projects",
+    )
+    project_index_rebuild_interval: float = Field(
+        default=3600.0,
+        description="Seconds before the project index is fully rebuilt",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 (requires the 'h2' package); "
+        "falls back to HTTP/1.1 if the server does not support it",
+    )
     page_size_default: int = Field(
         default=25, description="Default page size for paginated requests"
     )
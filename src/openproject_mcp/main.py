@@ -6,8 +6,8 @@ from openproject_mcp.server import build_server
 def run():
     # print("Server is confgured and running!")
     configure_logging()
-    _ = Settings()
-    server = build_server()
+    settings = Settings()
+    server = build_server(settings)
     server.run()
 
 
@@ -1,17 +1,150 @@
 from pydantic import BaseModel, HttpUrl
-from typing import Optional
+from typing import ClassVar, List, Optional
 from datetime import datetime
 
+from openproject_mcp.utils.hal import link_id, link_title, link_titles, raw
+
 
 class PaginatedOut(BaseModel):
     items: list
     next_cursor: Optional[str] = None
     truncated: bool = False
+    total: Optional[int] = None
+
+
+# Lean projections used by output="compact". `select` lists the HAL
+# properties each one reads, so the upstream response can be narrowed too.
 
 
 class WorkPackageLite(BaseModel):
+    select: ClassVar[List[str]] = [
+        "id",
+        "subject",
+        "status",
+        "type",
+        "assignee",
+        "project",
+        "dueDate",
+        "updatedAt",
+    ]
+
     id: int
     subject: str
     status: Optional[str] = None
+    type: Optional[str] = None
+    assignee: Optional[str] = None
+    project: Optional[str] = None
+    due_date: Optional[str] = None
     updated_at: Optional[datetime] = None
     url: Optional[HttpUrl] = None
+
+    @classmethod
+    def from_hal(cls, wp: dict, base_url: str | None = None) -> "WorkPackageLite":
+        return cls(
+            id=wp["id"],
+            subject=wp.get("subject") or "",
+            status=link_title(wp, "status"),
+            type=link_title(wp, "type"),
+            assignee=link_title(wp, "assignee"),
+            project=link_title(wp, "project"),
+            due_date=wp.get("dueDate"),
+            updated_at=wp.get("updatedAt"),
+            url=HttpUrl(f"{base_url}/work_packages/{wp['id']}") if base_url else None,
+        )
+
+
+class ProjectLite(BaseModel):
+    select: ClassVar[List[str]] = ["id", "identifier", "name", "active"]
+
+    id: int
+    identifier: Optional[str] = None
+    name: Optional[str] = None
+    active: Optional[bool] = None
+    url: Optional[HttpUrl] = None
+
+    @classmethod
+    def from_hal(cls, project: dict, base_url: str | None = None) -> "ProjectLite":
+        slug = project.get("identifier") or project["id"]
+        return cls(
+            id=project["id"],
+            identifier=project.get("identifier"),
+            name=project.get("name"),
+            active=project.get("active"),
+            url=HttpUrl(f"{base_url}/projects/{slug}") if base_url else None,
+        )
+
+
+class UserLite(BaseModel):
+    select: ClassVar[List[str]] = ["id", "name", "login", "email", "status"]
+
+    id: int
+    name: Optional[str] = None
+    login: Optional[str] = None
+    email: Optional[str] = None
+    status: Optional[str] = None
+
+    @classmethod
+    def from_hal(cls, user: dict, base_url: str | None = None) -> "UserLite":
+        return cls(
+            id=user["id"],
+            name=user.get("name"),
+            login=user.get("login"),
+            email=user.get("email"),
+            status=user.get("status"),
+        )
+
+
+class MembershipLite(BaseModel):
+    select: ClassVar[List[str]] = ["id", "project", "principal", "roles"]
+
+    id: int
+    project: Optional[str] = None
+    principal_id: Optional[int] = None
+    principal: Optional[str] = None
+    roles: List[str] = []
+
+    @classmethod
+    def from_hal(
+        cls, membership: dict, base_url: str | None = None
+    ) -> "MembershipLite":
+        return cls(
+            id=membership["id"],
+            project=link_title(membership, "project"),
+            principal_id=link_id(membership, "principal"),
+            principal=link_title(membership, "principal"),
+            roles=link_titles(membership, "roles"),
+        )
+
+
+class TimeEntryLite(BaseModel):
+    select: ClassVar[List[str]] = [
+        "id",
+        "hours",
+        "spentOn",
+        "comment",
+        "workPackage",
+        "user",
+        "activity",
+    ]
+
+    id: int
+    hours: Optional[str] = None  # ISO 8601 duration, e.g. "PT1H30M"
+    spent_on: Optional[str] = None
+    work_package_id: Optional[int] = None
+    work_package: Optional[str] = None
+    user: Optional[str] = None
+    activity: Optional[str] = None
+    comment: Optional[str] = None
+
+    @classmethod
+    def from_hal(cls, entry: dict, base_url: str | None = None) -> "TimeEntryLite":
+        return cls(
+            id=entry["id"],
+            hours=entry.get("hours"),
+            spent_on=entry.get("spentOn"),
+            work_package_id=link_id(entry, "workPackage"),
+            work_package=link_title(entry, "workPackage"),
+            user=link_title(entry, "user"),
+            activity=link_title(entry, "activity"),
+            comment=raw(entry, "comment"),
+        )
@@ -1,4 +1,8 @@
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
+from openproject_mcp.client import OpenProjectClient
+from openproject_mcp.config import Settings
 from openproject_mcp.tools import (
     work_packages,
     attachments,
@@ -10,19 +14,40 @@ from openproject_mcp.tools import (
 )
 
 
-def build_server() -> FastMCP:
-    server = FastMCP("openproject")
+def build_server(settings: Settings | None = None) -> FastMCP:
+    settings = settings or Settings()
+    # One pooled client shared by every tool module for the server's lifetime
+    client = OpenProjectClient(settings)
+
+    @asynccontextmanager
+    async def lifespan(_server: FastMCP):
+        client.open()
+        try:
+            yield {}
+        finally:
+            await client.aclose()
+
+    server = FastMCP("openproject", lifespan=lifespan)
 
     @server.tool("system_ping", description="Connectivity check")
     async def ping() -> dict:
         return {"ok": True}
 
+    @server.tool("system_stats", description="Client cache and coalescing counters")
+    async def stats() -> dict:
+        return {
+            "get_coalescing": client.singleflight.stats(),
+            "reference_data": client.reference_data.stats(),
+            "project_index": client.project_index.stats(),
+            "attachments": client.attachments.stats(),
+        }
+
     # Register stubs
-    work_packages.register(server)
-    attachments.register(server)
-    queries.register(server)
-    time_entries.register(server)
-    users.register(server)
-    wiki.register(server)
-    projects.register(server)
+    work_packages.register(server, settings, client)
+    attachments.register(server, settings, client)
+    queries.register(server, settings, client)
+    time_entries.register(server, settings, client)
+    users.register(server, settings, client)
+    wiki.register(server, settings, client)
+    projects.register(server, settings, client)
     return server
@@ -1,14 +1,49 @@
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import httpx
+import glob
 import os
 import base64
-import mimetypes
+import time
 
 from openproject_mcp.config import Settings
 from openproject_mcp.client import OpenProjectClient
 from openproject_mcp.errors import map_http_error
+from openproject_mcp.utils.bulk import bulk_semaphore, run_bounded
+from openproject_mcp.utils.cursor import page_from_collection, start_page
+from openproject_mcp.utils.download import (
+    PART_SUFFIX,
+    DigestMismatch,
+    DownloadIncomplete,
+    DownloadTooLarge,
+    can_split,
+    digest_algorithm,
+    download_prefix,
+    download_segmented,
+    download_to_file,
+    download_to_memory,
+)
+from openproject_mcp.utils.projection import fields_description, fields_select
+from openproject_mcp.utils.upload import (
+    MultipartFileUpload,
+    ProgressCallback,
+    file_digests,
+    progress_notifier,
+)
+
+# Properties list_attachments selects unless the caller asks for others
+DEFAULT_ATTACHMENT_FIELDS = [
+    "id",
+    "fileName",
+    "fileSize",
+    "contentType",
+    "description",
+    "digest",
+    "createdAt",
+    "author",
+    "_links/downloadLocation",
+]
 
 # ============================================================================
 # Input Models (Request Parameters)
@@ -23,12 +58,53 @@ class AttachFileToWpIn(BaseModel):
     description: Optional[str] = Field(
         None, description="Optional description for the attachment"
     )
+    skip_if_exists: bool = Field(
+        False,
+        description="Skip the upload and return the existing attachment if the "
+        "work package already has one with identical content",
+    )
+
+
+class AttachFilesToWpIn(BaseModel):
+    """Input parameters for attaching several files to a work package"""
+
+    wp_id: int = Field(..., description="Work package ID", gt=0)
+    file_paths: List[str] = Field(
+        default_factory=list, description="Local file paths to attach"
+    )
+    glob: Optional[str] = Field(
+        None,
+        description="Glob pattern selecting files to attach, e.g. 'reports/**/*.xml'",
+    )
+    description: Optional[str] = Field(
+        None, description="Optional description applied to every attachment"
+    )
+    skip_if_exists: bool = Field(
+        False,
+        description="Skip files whose content is already attached to the work package",
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        description="Concurrent uploads (defaults to and is capped at max_concurrency)",
+        gt=0,
+    )
 
 
 class ListAttachmentsIn(BaseModel):
     """Input parameters for listing attachments"""
 
     wp_id: int = Field(..., description="Work package ID", gt=0)
+    page_size: Optional[int] = Field(
+        None,
+        description="Results per page (defaults to page_size_default, capped at page_size_max)",
+        gt=0,
+    )
+    cursor: Optional[str] = Field(
+        None, description="Opaque next_cursor from a previous call to continue listing"
+    )
+    fields: Optional[List[str]] = Field(
+        None, description=fields_description(DEFAULT_ATTACHMENT_FIELDS)
+    )
 
 
 class DownloadAttachmentIn(BaseModel):
@@ -81,6 +157,9 @@ class AttachmentContentResponse(BaseModel):
     content_length: Optional[int] = None
     truncated: bool = False
     bytes_retrieved: int = 0
+    range_requested: bool = False
+    range_honored: Optional[bool] = None
+    cached: bool = False
     # Note: actual bytes data is returned separately as it's binary
 
 
@@ -93,23 +172,102 @@ class AttachmentCollection(BaseModel):
     _embedded: Dict = {"elements": []}
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+async def _wp_attachments(client: OpenProjectClient, wp_id: int) -> list[dict]:
+    return [
+        att
+        async for att in client.iter_collection(f"/work_packages/{wp_id}/attachments")
+    ]
+
+
+async def _find_identical(attachments: list[dict], file_path: str) -> dict | None:
+    """
+    Return the attachment with the same content as file_path, if any.
+
+    Only attachments of the same size are candidates, so the local file is
+    hashed at most once (per digest algorithm in use) and usually not at all.
+    """
+    size = os.path.getsize(file_path)
+    # (attachment, hashlib algorithm) for same-size attachments we can verify
+    candidates: list[tuple[dict, str]] = []
+    for att in attachments:
+        algorithm = digest_algorithm(att.get("digest"))
+        if att.get("fileSize") == size and algorithm is not None:
+            candidates.append((att, algorithm))
+    if not candidates:
+        return None
+    local = await file_digests(file_path, {algorithm for _, algorithm in candidates})
+    for att, algorithm in candidates:
+        if local[algorithm] == att["digest"]["hash"].lower():
+            return att
+    return None
+
+
+async def _attach_to_wp(
+    client: OpenProjectClient,
+    wp_id: int,
+    file_path: str,
+    description: str | None = None,
+    existing: list[dict] | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> dict:
+    """
+    Stream one file to a work package; with `existing` attachments given,
+    return an identical one (deduplicated=True) instead of uploading.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if existing is not None:
+        identical = await _find_identical(existing, file_path)
+        if identical is not None:
+            return {**identical, "deduplicated": True}
+
+    # Stream the multipart body from disk instead of reading it whole
+    upload = MultipartFileUpload(file_path, description, on_progress=on_progress)
+    res = await client.post(
+        f"/work_packages/{wp_id}/attachments",
+        content=upload,
+        headers=upload.headers,
+    )
+    return res.json()
+
+
 # ============================================================================
 # Tool Registration
 # ============================================================================
 
 
-def register(server: FastMCP, settings: Settings | None = None):
+def register(
+    server: FastMCP,
+    settings: Settings | None = None,
+    client: OpenProjectClient | None = None,
+):
     """Register all attachment tools with the MCP server"""
     settings = settings or Settings()
-    client = OpenProjectClient(settings)
+    client = client or OpenProjectClient(settings)
 
     @server.tool("attach_file_to_wp", description="Attach a file to a work package")
-    async def attach_file_to_wp(params: AttachFileToWpIn) -> dict:
+    async def attach_file_to_wp(params: AttachFileToWpIn, ctx: Context) -> dict:
         """
         Upload and attach a local file to a work package.
 
+        The file is streamed from disk in chunks, so memory use does not grow
+        with file size. Upload progress is sent as MCP progress notifications
+        when the caller supplied a progress token.
+
+        With skip_if_exists, the local file's digest is compared against the
+        work package's existing attachments first; on a match nothing is
+        uploaded and the existing attachment is returned with
+        deduplicated=True.
+
         Args:
             params: Validated input with wp_id, file_path, and optional description
+            ctx: MCP request context used for progress notifications
 
         Returns:
             dict: Attachment metadata from API response
@@ -119,45 +277,123 @@ def register(server: FastMCP, settings: Settings | None = None):
             Exception: If upload fails
         """
         try:
-            # Check if file exists
-            if not os.path.exists(params.file_path):
-                raise FileNotFoundError(f"File not found: {params.file_path}")
-
-            # Detect MIME type
-            content_type, _ = mimetypes.guess_type(params.file_path)
-            if not content_type:
-                content_type = "application/octet-stream"
-
-            # Prepare metadata
-            metadata = {"fileName": os.path.basename(params.file_path)}
-
-            if params.description:
-                metadata["description"] = {"raw": params.description}
-
-            # Read file content
-            with open(params.file_path, "rb") as f:
-                file_content = f.read()
-
-            # Upload using multipart/form-data
-            files = {
-                "metadata": (None, str(metadata), "application/json"),
-                "file": (
-                    os.path.basename(params.file_path),
-                    file_content,
-                    content_type,
-                ),
-            }
-
-            res = await client.post(
-                f"/work_packages/{params.wp_id}/attachments", files=files
+            existing = (
+                await _wp_attachments(client, params.wp_id)
+                if params.skip_if_exists and os.path.exists(params.file_path)
+                else None
+            )
+            return await _attach_to_wp(
+                client,
+                params.wp_id,
+                params.file_path,
+                params.description,
+                existing=existing,
+                on_progress=progress_notifier(ctx),
             )
-            return res.json()
 
         except FileNotFoundError as e:
             return {"error": str(e)}
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
+    @server.tool(
+        "attach_files_to_wp",
+        description="Attach several files (paths and/or a glob) to a work package",
+    )
+    async def attach_files_to_wp(params: AttachFilesToWpIn, ctx: Context) -> dict:
+        """
+        Upload and attach many local files to a work package in one call.
+
+        Files are streamed concurrently (at most `concurrency` at a time)
+        with the same multipart upload as attach_file_to_wp. A failing file
+        is reported in its result and does not stop the others. Progress
+        notifications cover the combined size of all files.
+
+        Args:
+            params: Validated input with wp_id, file_paths and/or glob,
+                optional description, skip_if_exists and concurrency
+            ctx: MCP request context used for progress notifications
+
+        Returns:
+            dict: Per-file results in input order (status uploaded,
+                deduplicated or failed), counts, and aggregate throughput
+        """
+        paths = list(params.file_paths)
+        if params.glob:
+            paths.extend(
+                sorted(
+                    p
+                    for p in glob.glob(params.glob, recursive=True)
+                    if os.path.isfile(p)
+                )
+            )
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return {"error": "No files to attach (give file_paths or a matching glob)"}
+
+        try:
+            existing = (
+                await _wp_attachments(client, params.wp_id)
+                if params.skip_if_exists
+                else None
+            )
+        except httpx.HTTPStatusError as e:
+            map_http_error(e.response.status_code, e.response.text[:300])
+
+        sizes = {p: os.path.getsize(p) for p in paths if os.path.isfile(p)}
+        total = sum(sizes.values())
+        sent: dict[str, int] = {}
+        notify = progress_notifier(ctx)
+        sem = bulk_semaphore(params.concurrency, settings.max_concurrency)
+
+        def tracker(path: str) -> ProgressCallback | None:
+            if notify is None:
+                return None
+
+            async def on_progress(done: int, _size: int) -> None:
+                sent[path] = done
+                await notify(sum(sent.values()), total)
+
+            return on_progress
+
+        async def attach_one(path: str) -> dict:
+            started = time.monotonic()
+            attachment = await _attach_to_wp(
+                client,
+                params.wp_id,
+                path,
+                params.description,
+                existing=existing,
+                on_progress=tracker(path),
+            )
+            deduplicated = attachment.pop("deduplicated", False)
+            return {
+                "status": "deduplicated" if deduplicated else "uploaded",
+                "bytes": 0 if deduplicated else sizes.get(path, 0),
+                "seconds": round(time.monotonic() - started, 3),
+                "attachment": attachment,
+            }
+
+        started = time.monotonic()
+        outcomes = await run_bounded(paths, attach_one, sem)
+        results = [{"file_path": p, **r} for p, r in zip(paths, outcomes)]
+        elapsed = time.monotonic() - started
+
+        uploaded = sum(r.get("bytes", 0) for r in results)
+        counts = {"uploaded": 0, "deduplicated": 0, "failed": 0}
+        for r in results:
+            counts[r["status"]] += 1
+        return {
+            "wp_id": params.wp_id,
+            "results": results,
+            **counts,
+            "bytes_uploaded": uploaded,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_bytes_per_second": (
+                round(uploaded / elapsed) if elapsed > 0 else None
+            ),
+        }
+
     @server.tool(
         "list_attachments", description="List all attachments for a work package"
     )
@@ -169,11 +405,24 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with wp_id
 
         Returns:
-            dict: Collection of attachment objects
+            dict: PaginatedOut with attachment objects in items and an opaque
+                next_cursor when more results exist
         """
         try:
-            res = await client.get(f"/work_packages/{params.wp_id}/attachments")
-            return res.json()
+            offset, page_size, skip = start_page(
+                params.cursor,
+                params.page_size,
+                settings.page_size_default,
+                settings.page_size_max,
+            )
+            page_params: Dict[str, Any] = {"pageSize": page_size, "offset": offset}
+            select = fields_select(params.fields, DEFAULT_ATTACHMENT_FIELDS)
+            if select:
+                page_params["select"] = select
+            res = await client.get(
+                f"/work_packages/{params.wp_id}/attachments", params=page_params
+            )
+            return page_from_collection(res.json(), offset, page_size, skip)
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
@@ -191,13 +440,23 @@ def register(server: FastMCP, settings: Settings | None = None):
             dict: Download status and file information
 
         Note:
-            When save_path is provided, the file is saved to disk.
-            Otherwise, raw bytes are returned (base64 encoded for JSON transport).
+            When save_path is provided, the file is streamed to disk through a
+            temporary ".part" file that is renamed into place once complete;
+            an existing ".part" file is resumed with an HTTP Range request.
+            Attachments of parallel_download_threshold bytes or more are
+            fetched as concurrent byte ranges written in place, falling back
+            to a single stream if the server does not answer with 206. The
+            result reports throughput and, for split downloads, per-segment
+            timings.
+            Otherwise, raw bytes are returned (base64 encoded for JSON
+            transport), up to download_inline_max_bytes. Either way the
+            attachment digest is verified while streaming when available.
+            Verified content is kept in a local store keyed by digest, so
+            repeat downloads of the same bytes skip the network (cached).
         """
         try:
-            # Get attachment metadata first
-            metadata_res = await client.get(f"/attachments/{params.attachment_id}")
-            metadata = metadata_res.json()
+            # Get attachment metadata first (cached; attachments are immutable)
+            metadata = await client.attachments.metadata(params.attachment_id)
 
             # Get download URL from links
             download_url = (
@@ -207,28 +466,94 @@ def register(server: FastMCP, settings: Settings | None = None):
             if not download_url:
                 return {"error": "Download URL not found in attachment metadata"}
 
-            # Download the file content
-            # Note: download_url is relative, need to construct full URL
-            download_res = await client.get(download_url)
-            content = download_res.content
-
             result = {
                 "fileName": metadata.get("fileName"),
-                "fileSize": len(content),
+                "fileSize": metadata.get("fileSize"),
                 "contentType": metadata.get("contentType"),
             }
+            digest = metadata.get("digest")
+            cached = await client.attachments.content_path(metadata)
+            result["cached"] = cached is not None
 
             if params.save_path:
-                # Save to disk
-                with open(params.save_path, "wb") as f:
-                    f.write(content)
+                size = metadata.get("fileSize") or 0
+                segments = min(
+                    settings.parallel_download_segments, settings.max_concurrency
+                )
+                started = time.monotonic()
+                saved: dict[str, Any]
+                if cached:
+                    saved = {
+                        "bytes": await client.attachments.copy_to(
+                            cached, params.save_path
+                        ),
+                        "resumed_from": 0,
+                        "digest_verified": True,
+                        "mode": "cache",
+                    }
+                elif (
+                    segments > 1
+                    and size >= settings.parallel_download_threshold
+                    and can_split()
+                    # A leftover part file is resumed sequentially instead
+                    and not os.path.exists(params.save_path + PART_SUFFIX)
+                ):
+                    saved = await download_segmented(
+                        client,
+                        download_url,
+                        params.save_path,
+                        size,
+                        segments,
+                        digest=digest,
+                        attempts=settings.max_retries,
+                    )
+                else:
+                    saved = await download_to_file(
+                        client,
+                        download_url,
+                        params.save_path,
+                        digest=digest,
+                        attempts=settings.max_retries,
+                        size=metadata.get("fileSize"),
+                    )
+                elapsed = time.monotonic() - started
+                if not cached and saved["digest_verified"]:
+                    await client.attachments.add_file(metadata, params.save_path)
+                transferred = saved["bytes"] - saved["resumed_from"]
+                result["fileSize"] = saved["bytes"]
                 result["saved_to"] = params.save_path
+                result["resumed_from"] = saved["resumed_from"]
+                result["digest_verified"] = saved["digest_verified"]
+                result["mode"] = saved["mode"]
+                result["network_bytes"] = 0 if cached else transferred
+                result["elapsed_seconds"] = round(elapsed, 3)
+                result["throughput_bytes_per_second"] = (
+                    round(transferred / elapsed) if elapsed > 0 else None
+                )
+                if "segments" in saved:
+                    result["segments"] = saved["segments"]
             else:
-                # Return base64 encoded content
+                limit = settings.download_inline_max_bytes
+                if (metadata.get("fileSize") or 0) > limit:
+                    raise DownloadTooLarge(
+                        f"Attachment is larger than {limit} bytes; "
+                        "use save_path to download it to disk"
+                    )
+                content: bytes | bytearray
+                if cached:
+                    content = await client.attachments.read(cached)
+                else:
+                    content = await download_to_memory(
+                        client, download_url, limit, digest=digest
+                    )
+                    await client.attachments.add_bytes(metadata, content)
+                result["fileSize"] = len(content)
                 result["content_base64"] = base64.b64encode(content).decode("utf-8")
 
             return result
 
+        except (DigestMismatch, DownloadIncomplete, DownloadTooLarge) as e:
+            return {"error": str(e)}
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
@@ -240,7 +565,11 @@ def register(server: FastMCP, settings: Settings | None = None):
         """
         Retrieve attachment metadata plus a preview of the content.
 
-        Uses HTTP Range header when possible to limit bandwidth usage.
+        Uses HTTP Range header when possible to limit bandwidth usage. The
+        body is streamed and the connection closed once max_bytes have been
+        read, so servers that ignore Range (200 instead of 206) never send
+        the whole file either. range_honored reports which one happened
+        (None when the preview came from the local content cache).
         Useful for previewing text files, images, etc. without downloading
         the entire file.
 
@@ -252,8 +581,7 @@ def register(server: FastMCP, settings: Settings | None = None):
         """
         try:
             # Get attachment metadata
-            metadata_res = await client.get(f"/attachments/{params.attachment_id}")
-            metadata = metadata_res.json()
+            metadata = await client.attachments.metadata(params.attachment_id)
 
             # Get download URL
             download_url = (
@@ -263,19 +591,27 @@ def register(server: FastMCP, settings: Settings | None = None):
             if not download_url:
                 return {"error": "Download URL not found in attachment metadata"}
 
-            # Download with range header if preferred
-            headers = {}
-            if params.prefer_range:
-                headers["Range"] = f"bytes=0-{params.max_bytes - 1}"
-
-            download_res = await client.get(download_url, headers=headers)
-            content = download_res.content
-
-            # Limit content if range not supported
-            truncated = False
-            if len(content) > params.max_bytes:
-                content = content[: params.max_bytes]
-                truncated = True
+            cached = await client.attachments.content_path(metadata)
+            preview: dict[str, Any]
+            if cached:
+                content = await client.attachments.read(cached, params.max_bytes + 1)
+                preview = {
+                    "content": content[: params.max_bytes],
+                    "truncated": len(content) > params.max_bytes,
+                    "range_honored": None,
+                }
+            else:
+                # Stream the preview and stop at max_bytes even if Range is ignored
+                preview = await download_prefix(
+                    client,
+                    download_url,
+                    params.max_bytes,
+                    use_range=params.prefer_range,
+                )
+                if not preview["truncated"]:
+                    # The preview is the whole file; keep it if it matches the digest
+                    await client.attachments.add_bytes(metadata, preview["content"])
+            content = preview["content"]
 
             return {
                 "metadata": {
@@ -288,7 +624,10 @@ def register(server: FastMCP, settings: Settings | None = None):
                 "content_type": metadata.get("contentType"),
                 "content_length": metadata.get("fileSize"),
                 "bytes_retrieved": len(content),
-                "truncated": truncated,
+                "truncated": preview["truncated"],
+                "range_requested": params.prefer_range,
+                "range_honored": preview["range_honored"],
+                "cached": cached is not None,
                 "content_base64": base64.b64encode(content).decode("utf-8"),
             }
 
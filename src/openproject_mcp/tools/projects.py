@@ -1,11 +1,43 @@
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import asyncio
+import json
+import math
 import httpx
 
 from openproject_mcp.config import Settings
 from openproject_mcp.client import OpenProjectClient
 from openproject_mcp.errors import map_http_error
+from openproject_mcp.models import MembershipLite, PaginatedOut
+from openproject_mcp.utils.cursor import (
+    encode_cursor,
+    page_from_collection,
+    start_page,
+)
+from openproject_mcp.utils.projection import (
+    ALL_FIELDS,
+    OutputMode,
+    collection_select,
+    compact,
+    fields_description,
+    fields_select,
+    use_compact,
+)
+
+# Properties get_project_memberships selects unless the caller asks for others
+DEFAULT_MEMBERSHIP_FIELDS = [
+    "id",
+    "createdAt",
+    "updatedAt",
+    "project",
+    "principal",
+    "roles",
+]
+
+# resolve_project fetches fields for at most this many matches, so a broad
+# term cannot turn into an unbounded id filter
+RESOLVE_FIELDS_MAX_MATCHES = 25
 
 # ============================================================================
 # Input Models (Request Parameters)
@@ -19,11 +51,25 @@ class GetProjectMembershipsIn(BaseModel):
     filters: Optional[Dict[str, Any]] = Field(
         None, description="Optional additional filters to apply"
     )
-    page_size: int = Field(100, description="Number of results per page", gt=0, le=1000)
-    offset: int = Field(1, description="Page offset for pagination", gt=0)
+    page_size: Optional[int] = Field(
+        None,
+        description="Results per page (defaults to page_size_default, capped at page_size_max)",
+        gt=0,
+    )
+    cursor: Optional[str] = Field(
+        None, description="Opaque next_cursor from a previous call to continue listing"
+    )
     follow: Optional[int] = Field(
         None, description="Optional: collect across pages up to this many results", gt=0
     )
+    fields: Optional[List[str]] = Field(
+        None, description=fields_description(DEFAULT_MEMBERSHIP_FIELDS)
+    )
+    output: Optional[OutputMode] = Field(
+        None,
+        description="compact: lean projection; full: OpenProject HAL JSON "
+        "(defaults to the server's output_mode; ignored when fields are given)",
+    )
 
 
 class ResolveProjectIn(BaseModel):
@@ -34,6 +80,12 @@ class ResolveProjectIn(BaseModel):
         description="Project identifier or display name to search for",
         min_length=1,
     )
+    fields: Optional[List[str]] = Field(
+        None,
+        description="Optional: project properties to return for the matches "
+        "instead of the summary (OpenProject select: properties, links or "
+        "nested paths like '_links/parent'); ['*'] returns full representations",
+    )
 
 
 # ============================================================================
@@ -74,15 +126,69 @@ class ProjectResolution(BaseModel):
     error: Optional[str] = None
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _project_summary(project: dict) -> dict:
+    return {
+        "id": project.get("id"),
+        "identifier": project.get("identifier"),
+        "name": project.get("name"),
+        "href": project.get("_links", {}).get("self", {}).get("href"),
+    }
+
+
+def _matches_in(table, search_term: str) -> list[dict]:
+    """
+    Match against the project index in precedence order.
+
+    1. Exact identifier (case-insensitive)
+    2. Partial name
+    3. Partial identifier
+
+    Returns the matches of the first rule that finds any.
+    """
+    for matches in (
+        lambda: table.exact_identifier(search_term),
+        lambda: table.contains("name", search_term),
+        lambda: table.contains("identifier", search_term),
+    ):
+        found = matches()
+        if found:
+            return found
+    return []
+
+
+async def _project_fields(
+    client: OpenProjectClient, ids: list[int], fields: list[str]
+) -> list[dict]:
+    """The projects with these ids (in this order) reduced to fields, in one request."""
+    filters = [{"id": {"operator": "=", "values": [str(i) for i in ids]}}]
+    query_params = {"filters": json.dumps(filters), "pageSize": len(ids)}
+    if ALL_FIELDS not in fields:
+        query_params["select"] = collection_select(fields)
+    res = await client.get("/projects", params=query_params)
+    by_id = {
+        p.get("id"): p for p in res.json().get("_embedded", {}).get("elements", [])
+    }
+    return [by_id[i] for i in ids if i in by_id]
+
+
 # ============================================================================
 # Tool Registration
 # ============================================================================
 
 
-def register(server: FastMCP, settings: Settings | None = None):
+def register(
+    server: FastMCP,
+    settings: Settings | None = None,
+    client: OpenProjectClient | None = None,
+):
     """Register all project tools with the MCP server"""
     settings = settings or Settings()
-    client = OpenProjectClient(settings)
+    client = client or OpenProjectClient(settings)
 
     @server.tool(
         "get_project_memberships",
@@ -99,13 +205,18 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with project_id, optional filters, and pagination
 
         Returns:
-            dict: Collection of membership objects
+            dict: PaginatedOut with membership objects (MembershipLite when
+                compact) in items and an opaque next_cursor when more results
+                exist
 
         Note:
             - Always filters by project_id (route is not project-scoped)
             - Additional filters can be provided (e.g., filter by user)
             - When follow parameter is provided, automatically collects results
-              across pages up to the specified limit
+              across pages up to the specified limit; once the first page
+              reveals the total, the remaining pages are fetched concurrently
+              (up to max_concurrency) and next_cursor resumes right after the
+              last returned membership
             - Each membership includes links to user, project, and roles
         """
         try:
@@ -127,50 +238,112 @@ def register(server: FastMCP, settings: Settings | None = None):
                             }
                         )
 
+            offset, page_size, skip = start_page(
+                params.cursor,
+                params.page_size,
+                settings.page_size_default,
+                settings.page_size_max,
+            )
+
             # Build query parameters
             query_params = {
-                "pageSize": params.page_size,
-                "offset": params.offset,
+                "pageSize": page_size,
+                "offset": offset,
                 "filters": str(filters),
             }
 
-            # If follow parameter is provided, collect across pages
-            if params.follow:
-                all_elements = []
-                current_offset = params.offset
+            lean = params.fields is None and use_compact(params.output, settings)
+            select = (
+                collection_select(MembershipLite.select)
+                if lean
+                else fields_select(params.fields, DEFAULT_MEMBERSHIP_FIELDS)
+            )
+            if select:
+                query_params["select"] = select
+
+            def project(page: dict) -> dict:
+                if lean:
+                    page["items"] = compact(MembershipLite, page["items"], settings)
+                return page
+
+            if not params.follow:
+                # Single page request
+                res = await client.get("/memberships", params=query_params)
+                return project(
+                    page_from_collection(res.json(), offset, page_size, skip)
+                )
+
+            async def fetch_page(page_offset: int) -> dict:
+                res = await client.get(
+                    "/memberships", params={**query_params, "offset": page_offset}
+                )
+                return res.json()
 
-                while len(all_elements) < params.follow:
-                    query_params["offset"] = current_offset
-                    res = await client.get("/memberships", params=query_params)
-                    data = res.json()
+            # The first page reveals the total and the page size the server uses
+            data = await fetch_page(offset)
+            page_size = data.get("pageSize") or page_size
+            total = data.get("total")
+
+            # Fetch the further pages `follow` needs concurrently, in order
+            pending: list[asyncio.Task] = []
+            if total is not None:
+                first_count = len(data.get("_embedded", {}).get("elements", [])) - skip
+                needed = max(0, params.follow - first_count)
+                last_offset = min(
+                    math.ceil(total / page_size),
+                    offset + math.ceil(needed / page_size),
+                )
+                sem = asyncio.Semaphore(settings.max_concurrency)
+
+                async def fetch_bounded(page_offset: int) -> dict:
+                    async with sem:
+                        return await fetch_page(page_offset)
+
+                pending = [
+                    asyncio.ensure_future(fetch_bounded(o))
+                    for o in range(offset + 1, last_offset + 1)
+                ]
 
-                    elements = data.get("_embedded", {}).get("elements", [])
-                    if not elements:
+            items: list = []
+            next_cursor = None
+            try:
+                while True:
+                    page = page_from_collection(data, offset, page_size, skip)
+                    total = page["total"]
+
+                    wanted = params.follow - len(items)
+                    items.extend(page["items"][:wanted])
+                    if len(page["items"]) > wanted:
+                        # Stopped mid-page: resume right after the last item taken
+                        next_cursor = encode_cursor(
+                            {
+                                "offset": offset,
+                                "page_size": page_size,
+                                "skip": skip + wanted,
+                            }
+                        )
                         break
 
-                    all_elements.extend(elements)
-
-                    # Check if we have more pages
-                    if len(all_elements) >= data.get("total", 0):
+                    next_cursor = page["next_cursor"]
+                    if not next_cursor or len(items) >= params.follow:
                         break
-
-                    current_offset += 1
-
-                # Trim to follow limit
-                all_elements = all_elements[: params.follow]
-
-                return {
-                    "_type": "Collection",
-                    "count": len(all_elements),
-                    "total": len(all_elements),
-                    "pageSize": params.page_size,
-                    "offset": params.offset,
-                    "_embedded": {"elements": all_elements},
-                }
-            else:
-                # Single page request
-                res = await client.get("/memberships", params=query_params)
-                return res.json()
+                    offset, skip = offset + 1, 0
+                    # Fall back to sequential fetching if the total was unknown
+                    data = await (pending.pop(0) if pending else fetch_page(offset))
+            finally:
+                # Drop pages that are no longer needed once `follow` is met
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            return project(
+                PaginatedOut(
+                    items=items,
+                    next_cursor=next_cursor,
+                    truncated=next_cursor is not None,
+                    total=total,
+                ).model_dump()
+            )
 
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
@@ -191,7 +364,8 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with name_or_identifier
 
         Returns:
-            dict: Project details {id, identifier, name, href} or disambiguation list
+            dict: Project details {id, identifier, name, href} or disambiguation
+                list; the selected project properties instead when fields is given
 
         Note:
             - Exact identifier match takes precedence
@@ -199,6 +373,11 @@ def register(server: FastMCP, settings: Settings | None = None):
             - Returns single result if unambiguous
             - Returns {"disambiguation_needed": true, "matches": [...]} if multiple matches
             - Returns {"error": "..."} if no matches found
+            - Served from the in-memory project index; only the first call
+              (or a miss on a stale index) goes to the API. fields costs one
+              extra request for the matched projects (at most
+              RESOLVE_FIELDS_MAX_MATCHES of them; truncated and total are
+              set when there were more)
 
         Example responses:
             Single match:
@@ -219,99 +398,32 @@ def register(server: FastMCP, settings: Settings | None = None):
             }
         """
         try:
-            # Get all projects
-            res = await client.get("/projects", params={"pageSize": 1000})
-            projects_data = res.json()
-            projects = projects_data.get("_embedded", {}).get("elements", [])
-
-            # Normalize search term
-            search_term = params.name_or_identifier.lower().strip()
-
-            # First, try exact match on identifier
-            exact_identifier_matches = [
-                p for p in projects if p.get("identifier", "").lower() == search_term
-            ]
-
-            if len(exact_identifier_matches) == 1:
-                project = exact_identifier_matches[0]
-                return {
-                    "id": project.get("id"),
-                    "identifier": project.get("identifier"),
-                    "name": project.get("name"),
-                    "href": project.get("_links", {}).get("self", {}).get("href"),
-                }
-
-            if len(exact_identifier_matches) > 1:
-                return {
-                    "disambiguation_needed": True,
-                    "matches": [
-                        {
-                            "id": p.get("id"),
-                            "identifier": p.get("identifier"),
-                            "name": p.get("name"),
-                            "href": p.get("_links", {}).get("self", {}).get("href"),
-                        }
-                        for p in exact_identifier_matches
-                    ],
-                }
-
-            # Try partial match on name
-            name_matches = [
-                p for p in projects if search_term in p.get("name", "").lower()
-            ]
-
-            if len(name_matches) == 1:
-                project = name_matches[0]
-                return {
-                    "id": project.get("id"),
-                    "identifier": project.get("identifier"),
-                    "name": project.get("name"),
-                    "href": project.get("_links", {}).get("self", {}).get("href"),
-                }
-
-            if len(name_matches) > 1:
-                return {
-                    "disambiguation_needed": True,
-                    "matches": [
-                        {
-                            "id": p.get("id"),
-                            "identifier": p.get("identifier"),
-                            "name": p.get("name"),
-                            "href": p.get("_links", {}).get("self", {}).get("href"),
-                        }
-                        for p in name_matches
-                    ],
-                }
-
-            # Try partial match on identifier
-            identifier_matches = [
-                p for p in projects if search_term in p.get("identifier", "").lower()
-            ]
-
-            if len(identifier_matches) == 1:
-                project = identifier_matches[0]
-                return {
-                    "id": project.get("id"),
-                    "identifier": project.get("identifier"),
-                    "name": project.get("name"),
-                    "href": project.get("_links", {}).get("self", {}).get("href"),
-                }
+            index = client.project_index
+            found = _matches_in(await index.table(), params.name_or_identifier)
+
+            # A project created since the last refresh would miss; look once more
+            if not found and await index.refresh_after_miss():
+                found = _matches_in(await index.table(), params.name_or_identifier)
+
+            total = len(found)
+            if found and params.fields is not None:
+                limit = min(RESOLVE_FIELDS_MAX_MATCHES, settings.page_size_max)
+                ids = [p["id"] for p in found[:limit]]
+                found = await _project_fields(client, ids, params.fields)
+            else:
+                found = [_project_summary(p) for p in found]
 
-            if len(identifier_matches) > 1:
+            if not found:
                 return {
-                    "disambiguation_needed": True,
-                    "matches": [
-                        {
-                            "id": p.get("id"),
-                            "identifier": p.get("identifier"),
-                            "name": p.get("name"),
-                            "href": p.get("_links", {}).get("self", {}).get("href"),
-                        }
-                        for p in identifier_matches
-                    ],
+                    "error": f"No project found matching '{params.name_or_identifier}'"
                 }
-
-            return {"error": f"No project found matching '{params.name_or_identifier}'"}
+            if total == 1:
+                return found[0]
+            result = {"disambiguation_needed": True, "matches": found}
+            if total > len(found):
+                result["truncated"] = True
+                result["total"] = total
+            return result
 
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
@@ -1,11 +1,33 @@
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import httpx
 
 from openproject_mcp.config import Settings
 from openproject_mcp.client import OpenProjectClient
 from openproject_mcp.errors import map_http_error
+from openproject_mcp.models import WorkPackageLite
+from openproject_mcp.utils.cursor import page_from_collection, start_page
+from openproject_mcp.utils.projection import (
+    OutputMode,
+    collection_select,
+    compact,
+    fields_description,
+    fields_select,
+    use_compact,
+)
+
+# Properties list_queries selects unless the caller asks for others
+DEFAULT_QUERY_FIELDS = [
+    "id",
+    "name",
+    "public",
+    "starred",
+    "hidden",
+    "updatedAt",
+    "project",
+    "_links/self",
+]
 
 # ============================================================================
 # Input Models (Request Parameters)
@@ -18,6 +40,17 @@ class ListQueriesIn(BaseModel):
     project_id: Optional[int] = Field(
         None, description="Optional project ID to filter queries", gt=0
     )
+    page_size: Optional[int] = Field(
+        None,
+        description="Results per page (defaults to page_size_default, capped at page_size_max)",
+        gt=0,
+    )
+    cursor: Optional[str] = Field(
+        None, description="Opaque next_cursor from a previous call to continue listing"
+    )
+    fields: Optional[List[str]] = Field(
+        None, description=fields_description(DEFAULT_QUERY_FIELDS)
+    )
 
 
 class RunQueryIn(BaseModel):
@@ -27,6 +60,19 @@ class RunQueryIn(BaseModel):
     overrides: Optional[Dict[str, Any]] = Field(
         None, description="Optional filter overrides to apply to the query"
     )
+    page_size: Optional[int] = Field(
+        None,
+        description="Results per page (defaults to page_size_default, capped at page_size_max)",
+        gt=0,
+    )
+    cursor: Optional[str] = Field(
+        None, description="Opaque next_cursor from a previous call to continue listing"
+    )
+    output: Optional[OutputMode] = Field(
+        None,
+        description="compact: lean projection; full: OpenProject HAL JSON "
+        "(defaults to the server's output_mode)",
+    )
 
 
 # ============================================================================
@@ -74,10 +120,14 @@ class QueryResultsResponse(BaseModel):
 # ============================================================================
 
 
-def register(server: FastMCP, settings: Settings | None = None):
+def register(
+    server: FastMCP,
+    settings: Settings | None = None,
+    client: OpenProjectClient | None = None,
+):
     """Register all query tools with the MCP server"""
     settings = settings or Settings()
-    client = OpenProjectClient(settings)
+    client = client or OpenProjectClient(settings)
 
     @server.tool(
         "list_queries",
@@ -91,20 +141,33 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with optional project_id
 
         Returns:
-            dict: Collection of query objects with metadata
+            dict: PaginatedOut with query objects in items and an opaque
+                next_cursor when more results exist
 
         Note:
             Queries represent saved views/filters in OpenProject.
             They can be project-specific or global.
         """
         try:
+            offset, page_size, skip = start_page(
+                params.cursor,
+                params.page_size,
+                settings.page_size_default,
+                settings.page_size_max,
+            )
+            page_params: Dict[str, Any] = {"pageSize": page_size, "offset": offset}
+            select = fields_select(params.fields, DEFAULT_QUERY_FIELDS)
+            if select:
+                page_params["select"] = select
             if params.project_id:
                 # Get project-specific queries
-                res = await client.get(f"/projects/{params.project_id}/queries")
+                res = await client.get(
+                    f"/projects/{params.project_id}/queries", params=page_params
+                )
             else:
                 # Get all queries
-                res = await client.get("/queries")
-            return res.json()
+                res = await client.get("/queries", params=page_params)
+            return page_from_collection(res.json(), offset, page_size, skip)
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
@@ -124,7 +187,9 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with query_id and optional overrides
 
         Returns:
-            dict: Work packages matching the query criteria
+            dict: PaginatedOut with matching work packages (WorkPackageLite
+                when compact) in items and an opaque next_cursor when more
+                results exist
 
         Example overrides:
             {
@@ -133,6 +198,17 @@ def register(server: FastMCP, settings: Settings | None = None):
             }
         """
         try:
+            offset, page_size, skip = start_page(
+                params.cursor,
+                params.page_size,
+                settings.page_size_default,
+                settings.page_size_max,
+            )
+            page_params: Dict[str, Any] = {"pageSize": page_size, "offset": offset}
+            lean = use_compact(params.output, settings)
+            if lean:
+                page_params["select"] = collection_select(WorkPackageLite.select)
+
             # First, get the query to retrieve its configuration
             query_res = await client.get(f"/queries/{params.query_id}")
             query_data = query_res.json()
@@ -169,12 +245,17 @@ def register(server: FastMCP, settings: Settings | None = None):
                 # Strip /api/v3 prefix if present since client adds it
                 if results_href.startswith("/api/v3"):
                     results_href = results_href[7:]  # Remove "/api/v3"
-                res = await client.get(results_href)
+                res = await client.get(results_href, params=page_params)
             else:
                 # Fall back to posting the query configuration
-                res = await client.post("/queries/default", json=payload)
-
-            return res.json()
+                res = await client.post(
+                    "/queries/default", params=page_params, json=payload
+                )
+
+            page = page_from_collection(res.json(), offset, page_size, skip)
+            if lean:
+                page["items"] = compact(WorkPackageLite, page["items"], settings)
+            return page
 
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
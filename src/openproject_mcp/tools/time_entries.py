@@ -1,12 +1,36 @@
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import httpx
-from datetime import date
+from datetime import date, datetime
 
 from openproject_mcp.config import Settings
 from openproject_mcp.client import OpenProjectClient
 from openproject_mcp.errors import map_http_error
+from openproject_mcp.models import TimeEntryLite
+from openproject_mcp.utils.bulk import bulk_semaphore, run_bounded
+from openproject_mcp.utils.cursor import page_from_collection, start_page
+from openproject_mcp.utils.projection import (
+    OutputMode,
+    collection_select,
+    compact,
+    fields_description,
+    fields_select,
+    use_compact,
+)
+
+# Properties list_time_entries selects unless the caller asks for others
+DEFAULT_TIME_ENTRY_FIELDS = [
+    "id",
+    "hours",
+    "spentOn",
+    "comment",
+    "createdAt",
+    "workPackage",
+    "project",
+    "user",
+    "activity",
+]
 
 # ============================================================================
 # Input Models (Request Parameters)
@@ -35,8 +59,22 @@ class ListTimeEntriesIn(BaseModel):
         description="End date for filtering (YYYY-MM-DD format)",
         pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
-    page_size: int = Field(100, description="Number of results per page", gt=0, le=1000)
-    offset: int = Field(1, description="Page offset for pagination", gt=0)
+    page_size: Optional[int] = Field(
+        None,
+        description="Results per page (defaults to page_size_default, capped at page_size_max)",
+        gt=0,
+    )
+    cursor: Optional[str] = Field(
+        None, description="Opaque next_cursor from a previous call to continue listing"
+    )
+    fields: Optional[List[str]] = Field(
+        None, description=fields_description(DEFAULT_TIME_ENTRY_FIELDS)
+    )
+    output: Optional[OutputMode] = Field(
+        None,
+        description="compact: lean projection; full: OpenProject HAL JSON "
+        "(defaults to the server's output_mode; ignored when fields are given)",
+    )
 
 
 class LogTimeIn(BaseModel):
@@ -70,6 +108,22 @@ class LogTimeIn(BaseModel):
     )
 
 
+class LogTimeBulkIn(BaseModel):
+    """Input parameters for logging several time entries"""
+
+    entries: List[LogTimeIn] = Field(
+        ...,
+        description="Time entries to create, each shaped like log_time params",
+        min_length=1,
+        max_length=500,
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        description="Concurrent requests (defaults to and is capped at max_concurrency)",
+        gt=0,
+    )
+
+
 # ============================================================================
 # Output Models (Response Data - Optional but Recommended)
 # ============================================================================
@@ -108,15 +162,90 @@ class LogTimeResponse(BaseModel):
     _links: Optional[Dict] = None
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _duration(hours: float) -> str:
+    """Decimal hours as an ISO 8601 duration, e.g. 1.5 -> "PT1H30M"."""
+    total_minutes = int(hours * 60)
+    return f"PT{total_minutes // 60}H{total_minutes % 60}M"
+
+
+def _parse_datetime(value: str) -> datetime:
+    # fromisoformat only accepts a trailing "Z" from Python 3.11
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _entry_error(entry: LogTimeIn) -> Optional[str]:
+    """Reason OpenProject would reject the entry, checked without a request."""
+    if int(entry.hours * 60) == 0:
+        return f"hours={entry.hours} is less than one minute"
+    if entry.spent_on:
+        try:
+            date.fromisoformat(entry.spent_on)
+        except ValueError:
+            return f"spent_on={entry.spent_on} is not a valid date"
+    times = {}
+    for name in ("start_time", "end_time"):
+        value = getattr(entry, name)
+        if value:
+            try:
+                times[name] = _parse_datetime(value)
+            except ValueError:
+                return f"{name}={value} is not an ISO datetime"
+    if len(times) == 2:
+        try:
+            if times["end_time"] <= times["start_time"]:
+                return "end_time must be after start_time"
+        except TypeError:
+            return "start_time and end_time must both have or both lack a UTC offset"
+    return None
+
+
+def _time_entry_payload(params: LogTimeIn) -> dict:
+    """Request body for POST /time_entries."""
+    payload = {
+        "_links": {
+            "workPackage": {"href": f"/api/v3/work_packages/{params.wp_id}"},
+            "activity": {
+                "href": f"/api/v3/time_entries/activities/{params.activity_id}"
+            },
+        },
+        "hours": _duration(params.hours),
+        # Default to today
+        "spentOn": params.spent_on or date.today().isoformat(),
+    }
+
+    if params.comment:
+        payload["comment"] = {"raw": params.comment}
+
+    if params.user_id:
+        payload["_links"]["user"] = {"href": f"/api/v3/users/{params.user_id}"}
+
+    if params.start_time:
+        payload["startTime"] = params.start_time
+
+    if params.end_time:
+        payload["endTime"] = params.end_time
+
+    return payload
+
+
 # ============================================================================
 # Tool Registration
 # ============================================================================
 
 
-def register(server: FastMCP, settings: Settings | None = None):
+def register(
+    server: FastMCP,
+    settings: Settings | None = None,
+    client: OpenProjectClient | None = None,
+):
     """Register all time entry tools with the MCP server"""
     settings = settings or Settings()
-    client = OpenProjectClient(settings)
+    client = client or OpenProjectClient(settings)
 
     @server.tool(
         "list_time_entries",
@@ -136,7 +265,9 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with optional filters and pagination
 
         Returns:
-            dict: Collection of time entry objects
+            dict: PaginatedOut with time entry objects (TimeEntryLite when
+                compact) in items and an opaque next_cursor when more results
+                exist
 
         Note:
             Uses entity_type and entity_id filters for work package scoping.
@@ -186,17 +317,36 @@ def register(server: FastMCP, settings: Settings | None = None):
                     {"spent_on": {"operator": "<=d", "values": [params.to_date]}}
                 )
 
+            offset, page_size, skip = start_page(
+                params.cursor,
+                params.page_size,
+                settings.page_size_default,
+                settings.page_size_max,
+            )
+
             # Build query parameters
-            query_params = {
-                "pageSize": params.page_size,
-                "offset": params.offset,
+            query_params: Dict[str, Any] = {
+                "pageSize": page_size,
+                "offset": offset,
             }
 
             if filters:
                 query_params["filters"] = str(filters)
 
+            lean = params.fields is None and use_compact(params.output, settings)
+            select = (
+                collection_select(TimeEntryLite.select)
+                if lean
+                else fields_select(params.fields, DEFAULT_TIME_ENTRY_FIELDS)
+            )
+            if select:
+                query_params["select"] = select
+
             res = await client.get("/time_entries", params=query_params)
-            return res.json()
+            page = page_from_collection(res.json(), offset, page_size, skip)
+            if lean:
+                page["items"] = compact(TimeEntryLite, page["items"], settings)
+            return page
 
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
@@ -233,45 +383,63 @@ def register(server: FastMCP, settings: Settings | None = None):
             }
         """
         try:
-            # Convert decimal hours to ISO 8601 duration format
-            total_minutes = int(params.hours * 60)
-            hours_part = total_minutes // 60
-            minutes_part = total_minutes % 60
-
-            duration = f"PT{hours_part}H{minutes_part}M"
-
-            # Build payload
-            payload = {
-                "_links": {
-                    "workPackage": {"href": f"/api/v3/work_packages/{params.wp_id}"},
-                    "activity": {
-                        "href": f"/api/v3/time_entries/activities/{params.activity_id}"
-                    },
-                },
-                "hours": duration,
-            }
+            payload = _time_entry_payload(params)
+            res = await client.post("/time_entries", json=payload)
+            return res.json()
+
+        except httpx.HTTPStatusError as e:
+            map_http_error(e.response.status_code, e.response.text[:300])
 
-            # Add optional fields
-            if params.spent_on:
-                payload["spentOn"] = params.spent_on
-            else:
-                # Default to today
-                payload["spentOn"] = date.today().isoformat()
+    @server.tool(
+        "log_time_bulk",
+        description="Log several time entries in one call (e.g. filling a timesheet)",
+    )
+    async def log_time_bulk(params: LogTimeBulkIn) -> dict:
+        """
+        Create many time entries concurrently.
 
-            if params.comment:
-                payload["comment"] = {"raw": params.comment}
+        Every entry is checked locally first (duration of at least a minute,
+        real calendar dates, ISO start/end times in order); if any entry is
+        invalid nothing is posted and the problems are listed by index.
+        Valid batches are POSTed to /time_entries with at most `concurrency`
+        requests in flight. A failing entry is reported in its result and
+        does not stop the others.
 
-            if params.user_id:
-                payload["_links"]["user"] = {"href": f"/api/v3/users/{params.user_id}"}
+        Args:
+            params: Validated input with entries (log_time params) and
+                optional concurrency
 
-            if params.start_time:
-                payload["startTime"] = params.start_time
+        Returns:
+            dict: Per-entry results in input order (status created with the
+                time entry, or failed with an error) and counts
+        """
+        invalid = [
+            {"index": i, "error": error}
+            for i, entry in enumerate(params.entries)
+            if (error := _entry_error(entry))
+        ]
+        if invalid:
+            return {
+                "error": f"{len(invalid)} of {len(params.entries)} entries are "
+                "invalid; nothing was logged",
+                "invalid": invalid,
+            }
 
-            if params.end_time:
-                payload["endTime"] = params.end_time
+        payloads = [_time_entry_payload(entry) for entry in params.entries]
+        sem = bulk_semaphore(params.concurrency, settings.max_concurrency)
 
+        async def log_one(payload: dict) -> dict:
             res = await client.post("/time_entries", json=payload)
-            return res.json()
-
-        except httpx.HTTPStatusError as e:
-            map_http_error(e.response.status_code, e.response.text[:300])
+            return {"status": "created", "time_entry": res.json()}
+
+        outcomes = await run_bounded(payloads, log_one, sem)
+        results = [
+            {"index": i, "wp_id": entry.wp_id, **outcome}
+            for i, (entry, outcome) in enumerate(zip(params.entries, outcomes))
+        ]
+        created = sum(r["status"] == "created" for r in results)
+        return {
+            "results": results,
+            "created": created,
+            "failed": len(results) - created,
+        }
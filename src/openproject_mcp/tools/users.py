@@ -1,11 +1,24 @@
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import httpx
 
 from openproject_mcp.config import Settings
 from openproject_mcp.client import OpenProjectClient
 from openproject_mcp.errors import map_http_error
+from openproject_mcp.models import UserLite
+from openproject_mcp.utils.hal import elements
+from openproject_mcp.utils.projection import (
+    OutputMode,
+    collection_select,
+    compact,
+    fields_description,
+    fields_select,
+    use_compact,
+)
+
+# Properties resolve_user selects unless the caller asks for others
+DEFAULT_USER_FIELDS = ["id", "name", "login", "email", "status", "_links/self"]
 
 # ============================================================================
 # Input Models (Request Parameters)
@@ -23,12 +36,25 @@ class ResolveUserIn(BaseModel):
     limit: int = Field(
         10, description="Maximum number of results to return", gt=0, le=100
     )
+    fields: Optional[List[str]] = Field(
+        None, description=fields_description(DEFAULT_USER_FIELDS)
+    )
+    output: Optional[OutputMode] = Field(
+        None,
+        description="compact: lean projection; full: OpenProject HAL JSON "
+        "(defaults to the server's output_mode; ignored when fields are given)",
+    )
 
 
 class GetUserByIdIn(BaseModel):
     """Input parameters for getting a user by ID"""
 
     user_id: int = Field(..., description="User ID to retrieve", gt=0)
+    output: Optional[OutputMode] = Field(
+        None,
+        description="compact: lean projection; full: OpenProject HAL JSON "
+        "(defaults to the server's output_mode)",
+    )
 
 
 # ============================================================================
@@ -66,10 +92,14 @@ class UserCollection(BaseModel):
 # ============================================================================
 
 
-def register(server: FastMCP, settings: Settings | None = None):
+def register(
+    server: FastMCP,
+    settings: Settings | None = None,
+    client: OpenProjectClient | None = None,
+):
     """Register all user tools with the MCP server"""
     settings = settings or Settings()
-    client = OpenProjectClient(settings)
+    client = client or OpenProjectClient(settings)
 
     @server.tool(
         "resolve_user", description="Search for users by name (resolve user identity)"
@@ -85,13 +115,14 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with search_term and limit
 
         Returns:
-            dict: Collection of matching user objects
+            dict: Collection of matching user objects, or {items, total}
+                with UserLite items when compact
 
         Note:
             - Searches using 'any_name_attribute' operator '~' (contains)
             - Filters by type='User' and status='1' (active)
-            - Uses select parameter to limit returned fields (id, name, email)
-            - Falls back to select=* if server doesn't support field selection
+            - Uses select to limit returned fields (DEFAULT_USER_FIELDS unless
+              fields is given; fields=["*"] returns full representations)
             - v3 API may not return 'login' field
         """
         try:
@@ -117,8 +148,23 @@ def register(server: FastMCP, settings: Settings | None = None):
                 "pageSize": params.limit,
             }
 
+            lean = params.fields is None and use_compact(params.output, settings)
+            select = (
+                collection_select(UserLite.select)
+                if lean
+                else fields_select(params.fields, DEFAULT_USER_FIELDS)
+            )
+            if select:
+                query_params["select"] = select
             res = await client.get("/principals", params=query_params)
-            return res.json()
+            if not lean:
+                return res.json()
+
+            data = res.json()
+            return {
+                "items": compact(UserLite, elements(data), settings),
+                "total": data.get("total"),
+            }
 
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
@@ -143,6 +189,8 @@ def register(server: FastMCP, settings: Settings | None = None):
         """
         try:
             res = await client.get(f"/users/{params.user_id}")
+            if use_compact(params.output, settings):
+                return compact(UserLite, [res.json()], settings)[0]
             return res.json()
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
@@ -1,13 +1,14 @@
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 import httpx
 import os
-import mimetypes
 
 from openproject_mcp.config import Settings
 from openproject_mcp.client import OpenProjectClient
 from openproject_mcp.errors import map_http_error
+from openproject_mcp.utils.cursor import page_from_collection, start_page
+from openproject_mcp.utils.upload import MultipartFileUpload, progress_notifier
 
 # ============================================================================
 # Input Models (Request Parameters)
@@ -34,6 +35,14 @@ class ListWikiPageAttachmentsIn(BaseModel):
     """Input parameters for listing wiki page attachments"""
 
     page_id: int = Field(..., description="Wiki page ID", gt=0)
+    page_size: Optional[int] = Field(
+        None,
+        description="Results per page (defaults to page_size_default, capped at page_size_max)",
+        gt=0,
+    )
+    cursor: Optional[str] = Field(
+        None, description="Opaque next_cursor from a previous call to continue listing"
+    )
 
 
 # ============================================================================
@@ -82,10 +91,14 @@ class WikiAttachmentCollection(BaseModel):
 # ============================================================================
 
 
-def register(server: FastMCP, settings: Settings | None = None):
+def register(
+    server: FastMCP,
+    settings: Settings | None = None,
+    client: OpenProjectClient | None = None,
+):
     """Register all wiki tools with the MCP server"""
     settings = settings or Settings()
-    client = OpenProjectClient(settings)
+    client = client or OpenProjectClient(settings)
 
     @server.tool("get_wiki_page", description="Get wiki page details by page ID")
     async def get_wiki_page(params: GetWikiPageIn) -> dict:
@@ -114,7 +127,7 @@ def register(server: FastMCP, settings: Settings | None = None):
             map_http_error(e.response.status_code, e.response.text[:300])
 
     @server.tool("attach_file_to_wiki", description="Attach a file to a wiki page")
-    async def attach_file_to_wiki(params: AttachFileToWikiIn) -> dict:
+    async def attach_file_to_wiki(params: AttachFileToWikiIn, ctx: Context) -> dict:
         """
         Upload and attach a local file to a wiki page.
 
@@ -124,6 +137,7 @@ def register(server: FastMCP, settings: Settings | None = None):
 
         Args:
             params: Validated input with page_id, file_path, and optional description
+            ctx: MCP request context used for progress notifications
 
         Returns:
             dict: Attachment metadata from API response
@@ -135,7 +149,8 @@ def register(server: FastMCP, settings: Settings | None = None):
         Note:
             - Automatically detects MIME type from file extension
             - Falls back to 'application/octet-stream' if type cannot be determined
-            - Removes Content-Type header to let aiohttp set multipart boundary
+            - Streams the file from disk in chunks; memory use is constant
+            - Reports upload progress as MCP progress notifications
             - Description is sent as {"raw": "text"} format
         """
         try:
@@ -143,33 +158,16 @@ def register(server: FastMCP, settings: Settings | None = None):
             if not os.path.exists(params.file_path):
                 raise FileNotFoundError(f"File not found: {params.file_path}")
 
-            # Detect MIME type
-            content_type, _ = mimetypes.guess_type(params.file_path)
-            if not content_type:
-                content_type = "application/octet-stream"
-
-            # Prepare metadata
-            metadata = {"fileName": os.path.basename(params.file_path)}
-
-            if params.description:
-                metadata["description"] = {"raw": params.description}
-
-            # Read file content
-            with open(params.file_path, "rb") as f:
-                file_content = f.read()
-
-            # Upload using multipart/form-data
-            files = {
-                "metadata": (None, str(metadata), "application/json"),
-                "file": (
-                    os.path.basename(params.file_path),
-                    file_content,
-                    content_type,
-                ),
-            }
-
+            # Stream the multipart body from disk instead of reading it whole
+            upload = MultipartFileUpload(
+                params.file_path,
+                params.description,
+                on_progress=progress_notifier(ctx),
+            )
             res = await client.post(
-                f"/wiki_pages/{params.page_id}/attachments", files=files
+                f"/wiki_pages/{params.page_id}/attachments",
+                content=upload,
+                headers=upload.headers,
             )
             return res.json()
 
@@ -189,7 +187,8 @@ def register(server: FastMCP, settings: Settings | None = None):
             params: Validated input with page_id
 
         Returns:
-            dict: Collection of attachments with _embedded.elements array
+            dict: PaginatedOut with attachment objects in items and an opaque
+                next_cursor when more results exist
 
         Note:
             Each attachment object includes:
@@ -204,7 +203,16 @@ def register(server: FastMCP, settings: Settings | None = None):
             404: If wiki page doesn't exist or insufficient permissions
         """
         try:
-            res = await client.get(f"/wiki_pages/{params.page_id}/attachments")
-            return res.json()
+            offset, page_size, skip = start_page(
+                params.cursor,
+                params.page_size,
+                settings.page_size_default,
+                settings.page_size_max,
+            )
+            page_params: Dict[str, Any] = {"pageSize": page_size, "offset": offset}
+            res = await client.get(
+                f"/wiki_pages/{params.page_id}/attachments", params=page_params
+            )
+            return page_from_collection(res.json(), offset, page_size, skip)
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
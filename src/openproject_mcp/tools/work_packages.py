@@ -1,14 +1,61 @@
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Literal
 
 import asyncio
 import json
+import logging
+import random
+import re
+import time
 from urllib.parse import quote
 import httpx
 from openproject_mcp.config import Settings
 from openproject_mcp.client import OpenProjectClient
 from openproject_mcp.errors import map_http_error
+from openproject_mcp.models import ProjectLite, WorkPackageLite
+from openproject_mcp.utils.bulk import bulk_semaphore, error_message, run_bounded
+from openproject_mcp.utils.hal import elements, link_id, link_title, raw
+from openproject_mcp.utils.projection import (
+    OutputMode,
+    collection_select,
+    compact,
+    fields_description,
+    fields_select,
+    use_compact,
+)
+
+log = logging.getLogger(__name__)
+
+# Collection properties iter_collection needs to page a selected collection
+WP_BATCH_COLLECTION = ("total", "pageSize")
+
+# Properties get_work_packages selects unless the caller asks for others
+DEFAULT_WP_FIELDS = [
+    "id",
+    "subject",
+    "lockVersion",
+    "startDate",
+    "dueDate",
+    "updatedAt",
+    "status",
+    "type",
+    "priority",
+    "assignee",
+    "project",
+]
+
+# append_work_package_description: 409 retries, backoff (seconds) and how
+# long a work package's lockVersion from our own update is trusted
+APPEND_CONFLICT_RETRIES = 5
+APPEND_BACKOFF = 0.1
+APPEND_BACKOFF_MAX = 2.0
+LOCK_VERSION_TTL = 30.0
+LOCK_VERSION_CACHE_SIZE = 256
+
+# Custom field values are sent as work package properties or links
+CUSTOM_FIELD = re.compile(r"^customField\d+$")
 
 # ============================================================================
 # Input Models (Request Parameters)
@@ -23,6 +70,41 @@ class AddCommentIn(BaseModel):
     notify: bool = Field(False, description="Send email notifications to watchers")
 
 
+class BulkCommentItem(BaseModel):
+    """One comment of an add_comments_bulk call"""
+
+    id: int = Field(..., description="Work package ID", gt=0)
+    comment: Optional[str] = Field(
+        None,
+        description="Comment text in markdown (defaults to the shared comment)",
+        min_length=1,
+    )
+    notify: Optional[bool] = Field(
+        None, description="Send email notifications (defaults to the shared notify)"
+    )
+
+
+class AddCommentsBulkIn(BaseModel):
+    """Input parameters for adding comments to many work packages"""
+
+    items: List[BulkCommentItem] = Field(
+        ..., description="Work packages to comment on", min_length=1, max_length=1000
+    )
+    comment: Optional[str] = Field(
+        None,
+        description="Comment text used for items without their own",
+        min_length=1,
+    )
+    notify: bool = Field(
+        False, description="Send email notifications for items without their own"
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        description="Concurrent requests (defaults to and is capped at max_concurrency)",
+        gt=0,
+    )
+
+
 class SearchContentIn(BaseModel):
     """Input parameters for searching OpenProject content"""
 
@@ -34,6 +116,11 @@ class SearchContentIn(BaseModel):
     include_attachments: bool = Field(
         False, description="Include attachment content/filenames in search"
     )
+    output: Optional[OutputMode] = Field(
+        None,
+        description="compact: lean projection; full: OpenProject HAL JSON "
+        "(defaults to the server's output_mode)",
+    )
 
 
 class GetWorkPackageStatusesIn(BaseModel):
@@ -69,6 +156,88 @@ class AppendWorkPackageDescriptionIn(BaseModel):
     )
 
 
+class GetWorkPackagesIn(BaseModel):
+    """Input parameters for fetching several work packages by id"""
+
+    ids: List[int] = Field(
+        ..., description="Work package IDs to fetch", min_length=1, max_length=5000
+    )
+    fields: Optional[List[str]] = Field(
+        None,
+        description=fields_description(DEFAULT_WP_FIELDS)
+        + "; explicit fields are returned as selected, whatever the output mode",
+    )
+    output: Optional[OutputMode] = Field(
+        None,
+        description="compact: lean projection; full: OpenProject HAL JSON "
+        "(defaults to the server's output_mode)",
+    )
+
+
+class WorkPackageChanges(BaseModel):
+    """Field changes applied by bulk_update_work_packages"""
+
+    status_id: Optional[int] = Field(None, description="New status ID", gt=0)
+    assignee_id: Optional[int] = Field(
+        None, description="New assignee user ID (0 to unassign)", ge=0
+    )
+    version_id: Optional[int] = Field(
+        None, description="New version ID (0 to clear)", ge=0
+    )
+    custom_fields: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Custom field values keyed customFieldN; use "
+        '{"href": "/api/v3/..."} for list/user/version custom fields',
+    )
+
+
+class WorkPackageUpdate(WorkPackageChanges):
+    """Field changes for one work package"""
+
+    id: int = Field(..., description="Work package ID", gt=0)
+
+
+class BulkUpdateWorkPackagesIn(BaseModel):
+    """Input parameters for updating many work packages"""
+
+    ids: List[int] = Field(
+        default_factory=list,
+        description="Work package IDs that all receive `changes`",
+        max_length=5000,
+    )
+    changes: Optional[WorkPackageChanges] = Field(
+        None, description="Changes applied to every work package in ids"
+    )
+    updates: List[WorkPackageUpdate] = Field(
+        default_factory=list,
+        description="Per-work-package changes, for updates that differ",
+        max_length=5000,
+    )
+    max_conflict_retries: int = Field(
+        3,
+        description="Times a work package is re-read and retried after a 409 conflict",
+        ge=0,
+        le=10,
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        description="Concurrent requests (defaults to and is capped at max_concurrency)",
+        gt=0,
+    )
+
+
+class GetWorkPackageContextIn(BaseModel):
+    """Input parameters for fetching a work package with its related data"""
+
+    wp_id: int = Field(..., description="Work package ID", gt=0)
+    max_activities: int = Field(
+        20, description="Most recent activities to include", ge=0, le=500
+    )
+    max_time_entries: int = Field(
+        50, description="Most recent time entries to include", ge=0, le=500
+    )
+
+
 class ResolveTypeIn(BaseModel):
     """Input parameters for resolving a type name to ID"""
 
@@ -118,15 +287,247 @@ class CollectionResponse(BaseModel):
     _embedded: dict = {"elements": []}
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _empty_collection() -> dict:
+    return {
+        "_type": "Collection",
+        "count": 0,
+        "total": 0,
+        "_embedded": {"elements": []},
+    }
+
+
+def _merge_collections(primary: dict, *others: dict) -> dict:
+    """Append elements from `others` to `primary`, skipping ids already seen."""
+    merged = list(primary["_embedded"]["elements"])
+    seen = {el.get("id") for el in merged}
+    for other in others:
+        for el in other["_embedded"]["elements"]:
+            el_id = el.get("id")
+            if el_id is None or el_id in seen:
+                continue
+            seen.add(el_id)
+            merged.append(el)
+    if len(merged) == len(primary["_embedded"]["elements"]):
+        # Nothing new; keep the server's own count/total
+        return primary
+    return {
+        "_type": "Collection",
+        "count": len(merged),
+        "total": len(merged),
+        "_embedded": {"elements": merged},
+    }
+
+
+async def _post_comment(
+    client: OpenProjectClient, wp_id: int, comment: str, notify: bool
+) -> dict:
+    res = await client.post(
+        f"/work_packages/{wp_id}/activities",
+        params={"notify": "true" if notify else "false"},
+        json={"comment": {"raw": comment}},
+    )
+    return res.json()
+
+
+async def _fetch_work_packages(
+    client: OpenProjectClient,
+    ids: List[int],
+    select: str | List[str] | None,
+    chunk_size: int,
+    sem: asyncio.Semaphore,
+) -> dict[int, dict]:
+    """
+    Work packages by id, fetched with one `id` filter query per chunk of
+    `chunk_size` ids; chunks run concurrently under `sem`. Ids that are
+    missing or not visible are absent from the result. `select` is passed
+    to iter_collection; None fetches full representations.
+    """
+
+    async def fetch_chunk(chunk: list[int]) -> list[dict]:
+        filters = [{"id": {"operator": "=", "values": [str(i) for i in chunk]}}]
+        async with sem:
+            return [
+                wp
+                async for wp in client.iter_collection(
+                    "/work_packages",
+                    params={"filters": json.dumps(filters)},
+                    page_size=len(chunk),
+                    select=select,
+                    prefetch=False,
+                )
+            ]
+
+    chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    pages = await asyncio.gather(*(fetch_chunk(c) for c in chunks))
+    return {wp["id"]: wp for page in pages for wp in page}
+
+
+def _link(resource: str, resource_id: int) -> dict:
+    # Id 0 clears an optional link
+    return {"href": f"/api/v3/{resource}/{resource_id}" if resource_id else None}
+
+
+def _changes_payload(changes: WorkPackageChanges) -> dict:
+    """PATCH body (without lockVersion) for a set of work package changes."""
+    payload: dict = {}
+    links: dict = {}
+    if changes.status_id is not None:
+        links["status"] = _link("statuses", changes.status_id)
+    if changes.assignee_id is not None:
+        links["assignee"] = _link("users", changes.assignee_id)
+    if changes.version_id is not None:
+        links["version"] = _link("versions", changes.version_id)
+    for name, value in (changes.custom_fields or {}).items():
+        if not CUSTOM_FIELD.match(name):
+            raise ValueError(f"{name} is not a custom field (expected customFieldN)")
+        if isinstance(value, dict) and "href" in value:
+            links[name] = value
+        else:
+            payload[name] = value
+    if links:
+        payload["_links"] = links
+    return payload
+
+
+def _compact_context(
+    wp: dict,
+    activities: list,
+    attachments: list,
+    relations: list,
+    time_entries: list,
+) -> dict:
+    """Merge a work package and its related resources into one lean document."""
+    wp_id = wp.get("id")
+    document: dict[str, Any] = {
+        "id": wp_id,
+        "subject": wp.get("subject"),
+        "description": raw(wp, "description"),
+        "lockVersion": wp.get("lockVersion"),
+        "startDate": wp.get("startDate"),
+        "dueDate": wp.get("dueDate"),
+        "percentageDone": wp.get("percentageDone"),
+        "createdAt": wp.get("createdAt"),
+        "updatedAt": wp.get("updatedAt"),
+    }
+    for name in (
+        "project",
+        "type",
+        "status",
+        "priority",
+        "author",
+        "assignee",
+        "responsible",
+        "version",
+        "parent",
+    ):
+        document[name] = link_title(wp, name)
+    document["activities"] = [
+        {
+            "id": a.get("id"),
+            "createdAt": a.get("createdAt"),
+            "user": link_title(a, "user"),
+            "comment": raw(a, "comment"),
+            "details": [d.get("raw") for d in a.get("details") or [] if d.get("raw")],
+        }
+        for a in activities
+    ]
+    document["attachments"] = [
+        {
+            "id": a.get("id"),
+            "fileName": a.get("fileName"),
+            "fileSize": a.get("fileSize"),
+            "contentType": a.get("contentType"),
+            "createdAt": a.get("createdAt"),
+            "author": link_title(a, "author"),
+        }
+        for a in attachments
+    ]
+    related: list[dict] = []
+    for r in relations:
+        outgoing = link_id(r, "from") == wp_id
+        other = "to" if outgoing else "from"
+        related.append(
+            {
+                "id": r.get("id"),
+                "type": r.get("type"),
+                "direction": "outgoing" if outgoing else "incoming",
+                "work_package_id": link_id(r, other),
+                "work_package": link_title(r, other),
+            }
+        )
+    document["relations"] = related
+    document["time_entries"] = [
+        {
+            "id": t.get("id"),
+            "hours": t.get("hours"),
+            "spentOn": t.get("spentOn"),
+            "user": link_title(t, "user"),
+            "activity": link_title(t, "activity"),
+            "comment": raw(t, "comment"),
+        }
+        for t in time_entries
+    ]
+    return document
+
+
+class _LockVersions:
+    """
+    lockVersion and raw description from our own recent updates, per work
+    package. Entries expire after LOCK_VERSION_TTL; expired ones are pruned
+    on every write and at most LOCK_VERSION_CACHE_SIZE are kept (least
+    recently written dropped first), since each holds a whole description.
+    """
+
+    def __init__(
+        self, ttl: float = LOCK_VERSION_TTL, max_entries: int = LOCK_VERSION_CACHE_SIZE
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[float, int, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, wp_id: int) -> tuple[int, str] | None:
+        entry = self._entries.get(wp_id)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1], entry[2]
+
+    def put(self, wp_id: int, lock_version: int, description: str) -> None:
+        now = time.monotonic()
+        self._entries.pop(wp_id, None)
+        self._entries[wp_id] = (now, lock_version, description)
+        # Insertion order is write order, so expired entries come first
+        while self._entries:
+            oldest, (written, _, _) = next(iter(self._entries.items()))
+            if now - written < self.ttl and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[oldest]
+
+    def pop(self, wp_id: int) -> None:
+        self._entries.pop(wp_id, None)
+
+
 # ============================================================================
 # Tool Registration
 # ============================================================================
 
 
-def register(server: FastMCP, settings: Settings | None = None):
+def register(
+    server: FastMCP,
+    settings: Settings | None = None,
+    client: OpenProjectClient | None = None,
+):
     """Register all work package tools with the MCP server"""
     settings = settings or Settings()
-    client = OpenProjectClient(settings)
+    client = client or OpenProjectClient(settings)
+    lock_versions = _LockVersions()
 
     @server.tool("add_comment", description="Add a comment to a work package")
     async def add_comment(params: AddCommentIn) -> dict:
@@ -134,17 +535,67 @@ def register(server: FastMCP, settings: Settings | None = None):
         Add a comment to a work package.
         """
         try:
-            endpoint = f"/work_packages/{params.id}/activities"
-            payload = {"comment": {"raw": params.comment}}
-            res = await client.post(
-                endpoint,
-                params={"notify": "true" if params.notify else "false"},
-                json=payload,
-            )
-            return res.json()
+            return await _post_comment(client, params.id, params.comment, params.notify)
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
+    @server.tool(
+        "add_comments_bulk",
+        description="Add comments to many work packages in one call",
+    )
+    async def add_comments_bulk(params: AddCommentsBulkIn) -> dict:
+        """
+        Post comments to many work packages concurrently.
+
+        Each item uses its own comment/notify or falls back to the shared
+        ones. At most `concurrency` requests are in flight, and every request
+        goes through the client-wide rate limiter. If a comment is still
+        rejected with 429 after the client's retries, no further comments
+        are started; the rest are reported as skipped so the caller can
+        resend just those later.
+
+        Args:
+            params: Validated input with items, optional shared comment and
+                notify, and concurrency
+
+        Returns:
+            dict: Per-item results in input order (status posted with the
+                activity id, failed with an error, or skipped) and counts
+        """
+        missing = [i for i, item in enumerate(params.items) if not item.comment]
+        if params.comment is None and missing:
+            return {
+                "error": "Items without a comment need a shared comment",
+                "indexes": missing,
+            }
+
+        sem = bulk_semaphore(params.concurrency, settings.max_concurrency)
+        throttled = asyncio.Event()
+
+        async def comment_one(item: BulkCommentItem) -> dict:
+            if throttled.is_set():
+                return {
+                    "status": "skipped",
+                    "error": "Not attempted after the server rate limited",
+                }
+            notify = params.notify if item.notify is None else item.notify
+            # Items without their own comment were checked to have a shared one
+            comment = item.comment or params.comment or ""
+            try:
+                activity = await _post_comment(client, item.id, comment, notify)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    throttled.set()
+                raise
+            return {"status": "posted", "activity_id": activity.get("id")}
+
+        outcomes = await run_bounded(params.items, comment_one, sem)
+        results = [{"id": i.id, **r} for i, r in zip(params.items, outcomes)]
+        counts = {"posted": 0, "failed": 0, "skipped": 0}
+        for r in results:
+            counts[r["status"]] += 1
+        return {"results": results, **counts, "rate_limited": throttled.is_set()}
+
     @server.tool(
         "search_content",
         description="Search OpenProject content (work packages, projects, attachments)",
@@ -162,6 +613,7 @@ def register(server: FastMCP, settings: Settings | None = None):
         - Uses the safer '~' operator for text search where appropriate.
         - If include_attachments=True, runs additional attachment-based queries
           and merges results (de-duplicated by WP id).
+        - With compact output the elements are WorkPackageLite / ProjectLite.
         """
         try:
             term = (params.query or "").strip()
@@ -178,6 +630,16 @@ def register(server: FastMCP, settings: Settings | None = None):
                     else {"work_packages": empty, "projects": empty}
                 )
 
+            lean = use_compact(params.output, settings)
+            wp_select = (
+                collection_select(WorkPackageLite.select, ("total",))
+                if lean
+                else collection_select(["subject", "_links/self"], ("total", "self"))
+            )
+            project_select = collection_select(
+                ["identifier", "name"], ("total", "self")
+            )
+
             def ensure_collection(obj: dict) -> dict:
                 obj.setdefault("_embedded", {}).setdefault("elements", [])
                 if "count" not in obj:
@@ -194,94 +656,35 @@ def register(server: FastMCP, settings: Settings | None = None):
                 qs = (
                     f"filters={quote(json.dumps(wp_filters), safe='')}"
                     f"&pageSize={params.limit}"
-                    f"&select=total,elements/id,elements/subject,elements/_links/self,self"
+                    f"&select={wp_select}"
                 )
                 res = await client.get(f"/work_packages?{qs}")
                 return res.json()
 
-            async def fetch_work_packages_attachments() -> dict:
+            async def run_att_filter(filter_id: str) -> dict:
                 """
-                Try attachment searches. Some instances may not support these filters;
-                we catch errors and fall back to an empty collection in that case.
-                We query content and filename separately and merge results (OR semantics).
+                Run one attachment filter. Some instances do not support these
+                filters, and without full-text indexing they can be very slow,
+                so errors and timeouts fall back to an empty collection.
                 """
-
-                # Helper to run a single attachment filter safely
-                async def run_att_filter(filter_id: str) -> dict:
-                    try:
-                        att_filters = [{filter_id: {"operator": "~", "values": [term]}}]
-                        qs = (
-                            f"filters={quote(json.dumps(att_filters), safe='')}"
-                            f"&pageSize={params.limit}"
-                            f"&select=total,elements/id,elements/subject,"
-                            f"elements/_links/self,self"
-                        )
-                        res = await client.get(f"/work_packages?{qs}")
-                        return res.json()
-                    except Exception:
-                        # Unsupported filter on this instance
-                        return {
-                            "_type": "Collection",
-                            "count": 0,
-                            "total": 0,
-                            "_embedded": {"elements": []},
-                        }
-
-                # Run both (content + filename) and merge de-duplicated by id
-                content_res, name_res = await asyncio.gather(
-                    run_att_filter("attachment_content"),
-                    run_att_filter("attachment_file_name"),
+                att_filters = [{filter_id: {"operator": "~", "values": [term]}}]
+                qs = (
+                    f"filters={quote(json.dumps(att_filters), safe='')}"
+                    f"&pageSize={params.limit}"
+                    f"&select={wp_select}"
                 )
-                content_res = ensure_collection(content_res)
-                name_res = ensure_collection(name_res)
-
-                seen = set()
-                merged = []
-                for src in (
-                    content_res["_embedded"]["elements"],
-                    name_res["_embedded"]["elements"],
-                ):
-                    for el in src:
-                        el_id = el.get("id")
-                        if el_id is None or el_id in seen:
-                            continue
-                        seen.add(el_id)
-                        merged.append(el)
-
-                return {
-                    "_type": "Collection",
-                    "count": len(merged),
-                    "total": len(merged),
-                    "_embedded": {"elements": merged},
-                }
-
-            async def get_wps() -> dict:
-                # Always include generic text search
-                base = ensure_collection(await fetch_work_packages_text())
-
-                if not params.include_attachments:
-                    return base
-
-                # Try attachment queries and merge with base (de-dupe)
-                att = ensure_collection(await fetch_work_packages_attachments())
-                if att["count"] == 0:
-                    return base
-
-                seen = {el.get("id") for el in base["_embedded"]["elements"]}
-                merged = list(base["_embedded"]["elements"])
-                for el in att["_embedded"]["elements"]:
-                    el_id = el.get("id")
-                    if el_id is None or el_id in seen:
-                        continue
-                    seen.add(el_id)
-                    merged.append(el)
-
-                return {
-                    "_type": "Collection",
-                    "count": len(merged),
-                    "total": len(merged),
-                    "_embedded": {"elements": merged},
-                }
+                try:
+                    res = await asyncio.wait_for(
+                        client.get(f"/work_packages?{qs}"),
+                        timeout=settings.search_source_timeout,
+                    )
+                    return res.json()
+                except asyncio.TimeoutError:
+                    log.info("search_content: %s filter timed out", filter_id)
+                    return _empty_collection()
+                except Exception:
+                    # Unsupported filter on this instance
+                    return _empty_collection()
 
             async def get_projects() -> dict:
                 proj_filters = [
@@ -290,22 +693,56 @@ def register(server: FastMCP, settings: Settings | None = None):
                 qs = (
                     f"filters={quote(json.dumps(proj_filters), safe='')}"
                     f"&pageSize={params.limit}"
-                    f"&select=total,elements/id,elements/identifier,elements/name,self"
+                    f"&select={project_select}"
                     f"&sortBy={quote(json.dumps([['typeahead','asc']]), safe='')}"
                 )
                 res = await client.get(f"/projects?{qs}")
                 return res.json()
 
-            if params.scope == "work_packages":
-                return ensure_collection(await get_wps())
-            if params.scope == "projects":
-                return ensure_collection(await get_projects())
+            # Launch every sub-query at once; latency is the slowest source,
+            # not the sum of them
+            sources = {}
+            if params.scope != "projects":
+                sources["text"] = fetch_work_packages_text()
+                if params.include_attachments:
+                    for filter_id in ("attachment_content", "attachment_file_name"):
+                        sources[filter_id] = run_att_filter(filter_id)
+            if params.scope != "work_packages":
+                sources["projects"] = get_projects()
+
+            tasks = {name: asyncio.ensure_future(c) for name, c in sources.items()}
+            try:
+                await asyncio.gather(*tasks.values())
+            finally:
+                for task in tasks.values():
+                    task.cancel()
+            results = {name: task.result() for name, task in tasks.items()}
+
+            def finish(collection: dict, model) -> dict:
+                collection = ensure_collection(collection)
+                if lean:
+                    collection["_embedded"]["elements"] = compact(
+                        model, elements(collection), settings
+                    )
+                return collection
 
-            # Both
-            wps, projs = await asyncio.gather(get_wps(), get_projects())
+            if params.scope == "projects":
+                return finish(results["projects"], ProjectLite)
+
+            # Text hits rank first, then attachment content, then file names
+            wps = _merge_collections(
+                ensure_collection(results["text"]),
+                *(
+                    ensure_collection(results[name])
+                    for name in ("attachment_content", "attachment_file_name")
+                    if name in results
+                ),
+            )
+            if params.scope == "work_packages":
+                return finish(wps, WorkPackageLite)
             return {
-                "work_packages": ensure_collection(wps),
-                "projects": ensure_collection(projs),
+                "work_packages": finish(wps, WorkPackageLite),
+                "projects": finish(results["projects"], ProjectLite),
             }
 
         except httpx.HTTPStatusError as e:
@@ -321,6 +758,14 @@ def register(server: FastMCP, settings: Settings | None = None):
         """
         Append markdown text to an existing work package's description.
 
+        The update is guarded by lockVersion. If someone else edited the
+        work package in between (409), the description and lockVersion are
+        re-read with a narrow select and the append is reapplied, with
+        jittered exponential backoff, up to APPEND_CONFLICT_RETRIES times.
+        The lockVersion and description from a successful update are
+        remembered for LOCK_VERSION_TTL seconds, so back-to-back appends
+        skip the initial GET.
+
         Args:
             params: Validated input with wp_id and markdown text
 
@@ -328,33 +773,297 @@ def register(server: FastMCP, settings: Settings | None = None):
             dict: Updated work package data
         """
         try:
-            # First, get the current work package to retrieve existing description
-            get_res = await client.get(f"/work_packages/{params.wp_id}")
-            wp_data = get_res.json()
-
-            # Get current description or empty string
-            current_desc = wp_data.get("description", {}).get("raw", "")
-
-            # Append new markdown
-            new_desc = (
-                current_desc + "\n\n" + params.markdown
-                if current_desc
-                else params.markdown
-            )
+            cached = lock_versions.get(params.wp_id)
+            if cached is not None:
+                lock_version, current_desc = cached
+            else:
+                # Get the current work package to retrieve existing description
+                get_res = await client.get(f"/work_packages/{params.wp_id}")
+                wp_data = get_res.json()
+                lock_version = wp_data.get("lockVersion", 0)
+                current_desc = (wp_data.get("description") or {}).get("raw") or ""
+
+            for attempt in range(APPEND_CONFLICT_RETRIES + 1):
+                # Append new markdown
+                new_desc = (
+                    current_desc + "\n\n" + params.markdown
+                    if current_desc
+                    else params.markdown
+                )
+                payload = {
+                    "description": {"raw": new_desc},
+                    "lockVersion": lock_version,
+                }
+                try:
+                    update_res = await client.patch(
+                        f"/work_packages/{params.wp_id}", json=payload
+                    )
+                    break
+                except httpx.HTTPStatusError as e:
+                    lock_versions.pop(params.wp_id)
+                    if (
+                        e.response.status_code != 409
+                        or attempt == APPEND_CONFLICT_RETRIES
+                    ):
+                        raise
+                delay = min(APPEND_BACKOFF * 2**attempt, APPEND_BACKOFF_MAX)
+                await asyncio.sleep(random.uniform(0, delay))
+                found = await _fetch_work_packages(
+                    client,
+                    [params.wp_id],
+                    ["id", "lockVersion", "description"],
+                    1,
+                    asyncio.Semaphore(1),
+                )
+                if params.wp_id not in found:
+                    map_http_error(404)
+                fresh = found[params.wp_id]
+                lock_version = fresh.get("lockVersion", 0)
+                current_desc = (fresh.get("description") or {}).get("raw") or ""
+
+            updated = update_res.json()
+            if "lockVersion" in updated:
+                lock_versions.put(
+                    params.wp_id,
+                    updated["lockVersion"],
+                    (updated.get("description") or {}).get("raw") or new_desc,
+                )
+            return updated
+        except httpx.HTTPStatusError as e:
+            map_http_error(e.response.status_code, e.response.text[:300])
 
-            # Update the work package
-            payload = {
-                "description": {"raw": new_desc},
-                "lockVersion": wp_data.get("lockVersion", 0),
-            }
+    @server.tool(
+        "get_work_packages",
+        description="Fetch many work packages by id in a few parallel requests",
+    )
+    async def get_work_packages(params: GetWorkPackagesIn) -> dict:
+        """
+        Fetch a set of work packages by id.
+
+        Ids are split into chunks of page_size_max, each fetched with one
+        `id` filter query on /work_packages (with a select projection), and
+        the chunks run concurrently. N ids cost ceil(N / page_size_max)
+        requests instead of N.
+
+        Args:
+            params: Validated input with ids and optional fields
 
-            update_res = await client.patch(
-                f"/work_packages/{params.wp_id}", json=payload
+        Returns:
+            dict: items in request order (duplicates collapsed), plus the
+                ids that were not found or are not visible in missing
+        """
+        ids = list(dict.fromkeys(params.ids))
+        lean = not params.fields and use_compact(params.output, settings)
+        select = (
+            collection_select(WorkPackageLite.select, WP_BATCH_COLLECTION)
+            if lean
+            else fields_select(params.fields, DEFAULT_WP_FIELDS, WP_BATCH_COLLECTION)
+        )
+        sem = asyncio.Semaphore(settings.max_concurrency)
+
+        try:
+            found = await _fetch_work_packages(
+                client, ids, select, settings.page_size_max, sem
             )
-            return update_res.json()
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
+        items = [found[i] for i in ids if i in found]
+        return {
+            "items": compact(WorkPackageLite, items, settings) if lean else items,
+            "missing": [i for i in ids if i not in found],
+            "count": len(found),
+        }
+
+    @server.tool(
+        "bulk_update_work_packages",
+        description="Change status, assignee, version or custom fields of many "
+        "work packages in one call",
+    )
+    async def bulk_update_work_packages(params: BulkUpdateWorkPackagesIn) -> dict:
+        """
+        Apply field changes to many work packages concurrently.
+
+        Current lockVersions are read in batches through the `id` filter
+        used by get_work_packages. The PATCHes then run in parallel, with at
+        most `concurrency` in flight. Work packages that get a 409 because
+        someone edited them in the meantime are collected, re-read in one
+        batch, and retried. This repeats up to max_conflict_retries times.
+        A failure only affects its own work package.
+
+        Args:
+            params: Validated input with ids + changes and/or per-item
+                updates, max_conflict_retries and concurrency
+
+        Returns:
+            dict: Per-work-package results in input order (status updated,
+                conflict, missing or failed, with attempts and the new
+                lockVersion) and counts
+        """
+        if params.ids and params.changes is None:
+            return {"error": "ids need changes to apply"}
+        items: list[tuple[int, WorkPackageChanges]] = []
+        if params.changes is not None:
+            items += [(wp_id, params.changes) for wp_id in params.ids]
+        items += [(u.id, u) for u in params.updates]
+        if not items:
+            return {"error": "Nothing to update (give ids with changes, or updates)"}
+        ids = [wp_id for wp_id, _ in items]
+        if len(set(ids)) != len(ids):
+            return {"error": "Each work package may appear only once"}
+
+        payloads = {}
+        for wp_id, changes in items:
+            try:
+                payloads[wp_id] = _changes_payload(changes)
+            except ValueError as e:
+                return {"error": f"Work package {wp_id}: {e}"}
+            if not payloads[wp_id]:
+                return {"error": f"Work package {wp_id}: no changes given"}
+
+        sem = bulk_semaphore(params.concurrency, settings.max_concurrency)
+        results: dict[int, dict[str, Any]] = {
+            wp_id: {"id": wp_id, "attempts": 0} for wp_id in ids
+        }
+
+        async def patch_one(item: tuple[int, int]) -> dict:
+            wp_id, lock_version = item
+            payload = {**payloads[wp_id], "lockVersion": lock_version}
+            try:
+                res = await client.patch(f"/work_packages/{wp_id}", json=payload)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 409:
+                    raise
+                return {
+                    "status": "conflict",
+                    "error": "Edit conflict: lockVersion is stale",
+                }
+            lock_versions.pop(wp_id)
+            return {"status": "updated", "lockVersion": res.json().get("lockVersion")}
+
+        pending = ids
+        for round_ in range(params.max_conflict_retries + 1):
+            try:
+                current = await _fetch_work_packages(
+                    client, pending, ["id", "lockVersion"], settings.page_size_max, sem
+                )
+            except Exception as e:
+                if round_ == 0:
+                    # Nothing was changed yet, so fail the call as a whole
+                    if isinstance(e, httpx.HTTPStatusError):
+                        map_http_error(e.response.status_code, e.response.text[:300])
+                    raise
+                # Earlier rounds already landed; report instead of losing them
+                log.warning("Re-reading conflicting work packages failed: %s", e)
+                for wp_id in pending:
+                    results[wp_id]["error"] = (
+                        "Edit conflict; re-reading the work package failed: "
+                        + error_message(e)
+                    )
+                break
+            for wp_id in pending:
+                if wp_id not in current:
+                    results[wp_id]["status"] = "missing"
+                    results[wp_id]["error"] = "Work package not found or not visible"
+            visible = [
+                (wp_id, current[wp_id].get("lockVersion", 0))
+                for wp_id in pending
+                if wp_id in current
+            ]
+            for (wp_id, _), outcome in zip(
+                visible, await run_bounded(visible, patch_one, sem)
+            ):
+                results[wp_id]["attempts"] += 1
+                results[wp_id].pop("error", None)
+                results[wp_id].update(outcome)
+            pending = [
+                wp_id for wp_id, _ in visible if results[wp_id]["status"] == "conflict"
+            ]
+            if not pending:
+                break
+
+        counts = {"updated": 0, "conflict": 0, "missing": 0, "failed": 0}
+        for result in results.values():
+            counts[result["status"]] += 1
+        return {"results": [results[wp_id] for wp_id in ids], **counts}
+
+    @server.tool(
+        "get_work_package_context",
+        description="Get a work package together with its activities, attachments, "
+        "relations and time entries in one compact document",
+    )
+    async def get_work_package_context(params: GetWorkPackageContextIn) -> dict:
+        """
+        Fetch everything needed to act on one work package in a single call.
+
+        The work package, its activities, attachments, relations and time
+        entries are requested concurrently and merged into one document with
+        the HAL wrapping, links and HTML renders stripped. If a secondary
+        resource cannot be read (e.g. time tracking is disabled or not
+        permitted) its list is empty and the reason is given in errors;
+        only a failure to read the work package itself fails the call.
+
+        Args:
+            params: Validated input with wp_id, max_activities and
+                max_time_entries
+
+        Returns:
+            dict: Compact work package with activities (most recent last),
+                attachments, relations and time_entries lists
+        """
+        wp_id = params.wp_id
+        time_filters = [{"work_package": {"operator": "=", "values": [str(wp_id)]}}]
+        relation_filters = [{"involved": {"operator": "=", "values": [str(wp_id)]}}]
+        requests = {}
+        if params.max_activities:
+            requests["activities"] = client.get(f"/work_packages/{wp_id}/activities")
+        requests["attachments"] = client.get(f"/work_packages/{wp_id}/attachments")
+        requests["relations"] = client.get(
+            "/relations",
+            params={
+                "filters": json.dumps(relation_filters),
+                "pageSize": settings.page_size_max,
+            },
+        )
+        if params.max_time_entries:
+            requests["time_entries"] = client.get(
+                "/time_entries",
+                params={
+                    "filters": json.dumps(time_filters),
+                    "sortBy": json.dumps([["spent_on", "desc"]]),
+                    "pageSize": params.max_time_entries,
+                },
+            )
+
+        wp_res, *others = await asyncio.gather(
+            client.get(f"/work_packages/{wp_id}"),
+            *requests.values(),
+            return_exceptions=True,
+        )
+        if isinstance(wp_res, httpx.HTTPStatusError):
+            map_http_error(wp_res.response.status_code, wp_res.response.text[:300])
+        if isinstance(wp_res, BaseException):
+            raise wp_res
+
+        parts: dict[str, list[dict]] = {
+            name: []
+            for name in ("activities", "attachments", "relations", "time_entries")
+        }
+        errors: dict[str, str] = {}
+        for name, res in zip(requests, others):
+            if isinstance(res, BaseException):
+                errors[name] = str(res) or type(res).__name__
+                log.info("get_work_package_context: %s unavailable: %s", name, res)
+            else:
+                parts[name] = elements(res.json())
+        if params.max_activities:
+            parts["activities"] = parts["activities"][-params.max_activities :]
+
+        document = _compact_context(wp_res.json(), **parts)
+        if errors:
+            document["errors"] = errors
+        return document
+
     @server.tool(
         "get_work_package_statuses",
         description="Get all available work package statuses",
@@ -369,8 +1078,8 @@ def register(server: FastMCP, settings: Settings | None = None):
             dict: Collection of status objects
         """
         try:
-            res = await client.get("/statuses")
-            return res.json()
+            statuses = await client.reference_data.statuses()
+            return statuses.as_collection()
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
@@ -389,13 +1098,9 @@ def register(server: FastMCP, settings: Settings | None = None):
             dict: Collection of type objects
         """
         try:
-            if params.project_id:
-                # Get types available for a specific project
-                res = await client.get(f"/projects/{params.project_id}/types")
-            else:
-                # Get all types
-                res = await client.get("/types")
-            return res.json()
+            # Project-specific types when project_id is given, else all types
+            types = await client.reference_data.types(params.project_id)
+            return types.as_collection()
         except httpx.HTTPStatusError as e:
             map_http_error(e.response.status_code, e.response.text[:300])
 
@@ -413,17 +1118,10 @@ def register(server: FastMCP, settings: Settings | None = None):
             dict: Status details or disambiguation options
         """
         try:
-            res = await client.get("/statuses")
-            statuses_data = res.json()
-            statuses = statuses_data.get("_embedded", {}).get("elements", [])
-
-            # Normalize search term
-            search_term = params.name.lower().strip()
+            statuses = await client.reference_data.statuses()
 
             # Look for exact match (case-insensitive)
-            exact_matches = [
-                s for s in statuses if s.get("name", "").lower() == search_term
-            ]
+            exact_matches = statuses.exact(params.name)
 
             # If multiple exact matches, return disambiguation
             if len(exact_matches) > 1:
@@ -451,9 +1149,7 @@ def register(server: FastMCP, settings: Settings | None = None):
                 }
 
             # Look for partial matches
-            partial_matches = [
-                s for s in statuses if search_term in s.get("name", "").lower()
-            ]
+            partial_matches = statuses.partial(params.name)
 
             if len(partial_matches) == 1:
                 status = partial_matches[0]
@@ -499,17 +1195,10 @@ def register(server: FastMCP, settings: Settings | None = None):
         """
         try:
             # Get types available for the project
-            res = await client.get(f"/projects/{params.project_id}/types")
-            types_data = res.json()
-            types = types_data.get("_embedded", {}).get("elements", [])
-
-            # Normalize search term
-            search_term = params.name.lower().strip()
+            types = await client.reference_data.types(params.project_id)
 
             # Look for exact match (case-insensitive)
-            exact_matches = [
-                t for t in types if t.get("name", "").lower() == search_term
-            ]
+            exact_matches = types.exact(params.name)
 
             # If multiple exact matches, return disambiguation
             if len(exact_matches) > 1:
@@ -538,9 +1227,7 @@ def register(server: FastMCP, settings: Settings | None = None):
                 }
 
             # Look for partial matches
-            partial_matches = [
-                t for t in types if search_term in t.get("name", "").lower()
-            ]
+            partial_matches = types.partial(params.name)
 
             if len(partial_matches) == 1:
                 type_obj = partial_matches[0]
@@ -567,13 +1254,8 @@ def register(server: FastMCP, settings: Settings | None = None):
                 }
 
             # Check if type exists globally but not in project
-            global_res = await client.get("/types")
-            global_types = global_res.json().get("_embedded", {}).get("elements", [])
-
-            global_match = next(
-                (t for t in global_types if t.get("name", "").lower() == search_term),
-                None,
-            )
+            global_types = await client.reference_data.types()
+            global_match = next(iter(global_types.exact(params.name)), None)
 
             if global_match:
                 return {
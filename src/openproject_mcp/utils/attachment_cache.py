@@ -0,0 +1,246 @@
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+from openproject_mcp.utils.download import PART_SUFFIX, new_hasher
+from openproject_mcp.utils.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from openproject_mcp.client import OpenProjectClient
+    from openproject_mcp.config import Settings
+
+log = logging.getLogger(__name__)
+
+
+def default_cache_dir() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "openproject-mcp", "attachments")
+
+
+def digest_key(digest: dict | None) -> str | None:
+    """Store key for an OpenProject digest, e.g. "md5-0cc175b9...", or None."""
+    if not digest or not digest.get("hash"):
+        return None
+    algorithm = (digest.get("algorithm") or "").lower().replace("-", "")
+    value = digest["hash"].lower()
+    if not algorithm.isalnum() or not value.isalnum():
+        return None
+    return f"{algorithm}-{value}"
+
+
+class ContentStore:
+    """
+    On-disk content-addressed blob store with a total size bound.
+
+    Blobs live at <root>/<h[:2]>/<h[2:4]>/<algorithm>-<hash>, so no
+    directory grows too large. A blob's mtime is its last use; when the
+    store exceeds max_bytes the least recently used blobs are evicted.
+    The usage index is rebuilt from disk on first use, so the bound and
+    LRU order survive restarts.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._index: dict[str, tuple[int, float]] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def path(self, key: str) -> str:
+        value = key.split("-", 1)[1]
+        return os.path.join(self.root, value[:2], value[2:4], key)
+
+    def _scan(self) -> dict[str, tuple[int, float]]:
+        index = {}
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                if name.startswith("."):
+                    continue  # unfinished temp file
+                st = os.stat(os.path.join(dirpath, name))
+                index[name] = (st.st_size, st.st_mtime)
+        return index
+
+    async def _loaded(self) -> dict[str, tuple[int, float]]:
+        if self._index is None:
+            self._index = await asyncio.to_thread(self._scan)
+        return self._index
+
+    @property
+    def size(self) -> int:
+        return sum(size for size, _ in (self._index or {}).values())
+
+    async def get(self, key: str) -> str | None:
+        """Path of the blob for `key`, marking it recently used."""
+        if not self.enabled:
+            return None
+        index = await self._loaded()
+        if key not in index:
+            return None
+        path = self.path(key)
+        try:
+            await asyncio.to_thread(os.utime, path)
+        except FileNotFoundError:
+            index.pop(key, None)
+            return None
+        index[key] = (index[key][0], time.time())
+        return path
+
+    async def put_file(self, key: str, src: str) -> None:
+        """Copy `src` into the store under `key`."""
+
+        def write(f) -> None:
+            with open(src, "rb") as s:
+                shutil.copyfileobj(s, f)
+
+        await self._put(key, os.path.getsize(src), write)
+
+    async def put_bytes(self, key: str, data: bytes | bytearray) -> None:
+        await self._put(key, len(data), lambda f: f.write(data))
+
+    async def _put(self, key: str, size: int, write) -> None:
+        if not self.enabled or size > self.max_bytes:
+            return
+        index = await self._loaded()
+        if key in index:
+            return
+        dest = self.path(key)
+
+        def store() -> None:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), prefix=".")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    write(f)
+                os.replace(tmp, dest)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+        try:
+            await asyncio.to_thread(store)
+        except OSError as e:
+            log.warning("Could not cache attachment %s: %s", key, e)
+            return
+        index[key] = (size, time.time())
+        await self._evict()
+
+    async def _evict(self) -> None:
+        async with self._lock:
+            index = await self._loaded()
+            total = self.size
+            for key, (size, _) in sorted(index.items(), key=lambda kv: kv[1][1]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    await asyncio.to_thread(os.remove, self.path(key))
+                except FileNotFoundError:
+                    pass
+                del index[key]
+                total -= size
+                log.debug("Evicted cached attachment %s", key)
+
+
+class AttachmentCache:
+    """
+    Caches for immutable attachment data.
+
+    Metadata from /attachments/{id} is kept in memory for a TTL; content is
+    kept in a ContentStore keyed by the attachment digest, so the same bytes
+    are stored once no matter which attachment id (or tool) fetched them.
+    """
+
+    def __init__(self, client: "OpenProjectClient", settings: "Settings"):
+        self.client = client
+        self.metadata_ttl = settings.attachment_metadata_ttl
+        self.store = ContentStore(
+            settings.attachment_cache_dir or default_cache_dir(),
+            settings.attachment_cache_max_bytes,
+        )
+        self._metadata: dict[int, tuple[float, dict]] = {}
+        self._loads = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    async def metadata(self, attachment_id: int) -> dict:
+        cached = self._metadata.get(attachment_id)
+        if cached is not None and time.monotonic() - cached[0] < self.metadata_ttl:
+            return cached[1]
+
+        async def load() -> dict:
+            res = await self.client.get(f"/attachments/{attachment_id}")
+            data = res.json()
+            if self.metadata_ttl > 0:
+                self._metadata[attachment_id] = (time.monotonic(), data)
+            return data
+
+        return await self._loads.do(attachment_id, load)
+
+    async def content_path(self, metadata: dict) -> str | None:
+        """Local path of the attachment's bytes if they are cached."""
+        key = digest_key(metadata.get("digest"))
+        path = await self.store.get(key) if key else None
+        if key:
+            if path:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return path
+
+    async def add_file(self, metadata: dict, path: str) -> None:
+        """Cache downloaded bytes; only pass files whose digest was verified."""
+        key = digest_key(metadata.get("digest"))
+        if key:
+            await self.store.put_file(key, path)
+
+    async def add_bytes(self, metadata: dict, data: bytes | bytearray) -> None:
+        """Cache complete attachment bytes if they match the digest."""
+        digest = metadata.get("digest")
+        key = digest_key(digest)
+        hasher = new_hasher(digest)
+        if key is None or hasher is None or digest is None:
+            return
+        hasher.update(data)
+        if hasher.hexdigest() == digest["hash"].lower():
+            await self.store.put_bytes(key, data)
+
+    async def copy_to(self, path: str, dest: str) -> int:
+        """Copy a cached blob to `dest` atomically; returns its size."""
+
+        def copy() -> int:
+            tmp = dest + PART_SUFFIX
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, dest)
+            return os.path.getsize(dest)
+
+        return await asyncio.to_thread(copy)
+
+    async def read(self, path: str, max_bytes: int | None = None) -> bytes:
+        def read() -> bytes:
+            with open(path, "rb") as f:
+                return f.read(-1 if max_bytes is None else max_bytes)
+
+        return await asyncio.to_thread(read)
+
+    def invalidate(self, attachment_id: int | None = None) -> None:
+        """Forget cached metadata (content is immutable and kept)."""
+        if attachment_id is None:
+            self._metadata.clear()
+        else:
+            self._metadata.pop(attachment_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "metadata_entries": len(self._metadata),
+            "stored_bytes": self.store.size,
+        }
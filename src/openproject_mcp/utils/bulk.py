@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+
+def bulk_semaphore(requested: int | None, maximum: int) -> asyncio.Semaphore:
+    """Concurrency limit for a bulk tool: the requested one, capped at maximum."""
+    return asyncio.Semaphore(min(requested or maximum, maximum))
+
+
+def error_message(e: BaseException) -> str:
+    """How a failed item's error is reported in bulk tool results."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"HTTP {e.response.status_code}: {e.response.text[:300]}"
+    return str(e) or type(e).__name__
+
+
+async def run_bounded(
+    items: Iterable[T],
+    action: Callable[[T], Awaitable[dict]],
+    sem: asyncio.Semaphore,
+) -> list[dict]:
+    """
+    Run `action` for every item with at most `sem` in flight.
+
+    Returns one result dict per item, in input order. An exception only
+    fails its own item, whose result becomes {"status": "failed", "error"}.
+    Actions that need to treat some errors differently (e.g. a 409 or 429)
+    catch those themselves and re-raise the rest.
+    """
+
+    async def run_one(item: T) -> dict:
+        async with sem:
+            try:
+                return await action(item)
+            except Exception as e:  # reported per item; keep the batch going
+                return {"status": "failed", "error": error_message(e)}
+
+    return list(await asyncio.gather(*(run_one(item) for item in items)))
@@ -1,6 +1,8 @@
 import base64
 import json
 
+from openproject_mcp.models import PaginatedOut
+
 
 def encode_cursor(d: dict) -> str:
     return base64.urlsafe_b64encode(json.dumps(d).encode()).decode()
@@ -10,5 +12,64 @@ def decode_cursor(s: str) -> dict:
     return json.loads(base64.urlsafe_b64decode(s.encode()).decode())
 
 
-def clamp_page_size(requested: int, default: int, maximum: int) -> int:
+def clamp_page_size(requested: int | None, default: int, maximum: int) -> int:
     return max(1, min(requested or default, maximum))
+
+
+def start_page(
+    cursor: str | None, page_size: int | None, default: int, maximum: int
+) -> tuple[int, int, int]:
+    """
+    Resolve where a list request starts.
+
+    Returns (offset, page_size, skip): the 1-based OpenProject page, its size
+    and how many leading items of that page were already returned. A cursor
+    carries all three so continuing never depends on the caller's page_size.
+    """
+    if not cursor:
+        return 1, clamp_page_size(page_size, default, maximum), 0
+    try:
+        state = decode_cursor(cursor)
+        return (
+            int(state["offset"]),
+            clamp_page_size(int(state["page_size"]), default, maximum),
+            int(state.get("skip", 0)),
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def page_from_collection(
+    collection: dict, offset: int, page_size: int, skip: int = 0
+) -> dict:
+    """
+    Convert one HAL collection page into a PaginatedOut dict.
+
+    Endpoints that ignore pageSize/offset (no pageSize/offset in the
+    response) are paged locally so responses stay bounded either way.
+    """
+    elements = collection.get("_embedded", {}).get("elements", [])
+    total = collection.get("total")
+    if "pageSize" in collection or "offset" in collection:
+        # The server may clamp pageSize; continue with the size it used
+        page_size = collection.get("pageSize") or page_size
+    else:
+        total = len(elements)
+        elements = elements[(offset - 1) * page_size : offset * page_size]
+
+    if total is None:
+        has_more = len(elements) >= page_size
+    else:
+        has_more = offset * page_size < total
+
+    next_cursor = (
+        encode_cursor({"offset": offset + 1, "page_size": page_size})
+        if has_more
+        else None
+    )
+    return PaginatedOut(
+        items=elements[skip:],
+        next_cursor=next_cursor,
+        truncated=has_more,
+        total=total,
+    ).model_dump()
@@ -0,0 +1,469 @@
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from openproject_mcp.client import OpenProjectClient
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+PART_SUFFIX = ".part"
+# Sidecar holding the ETag/Last-Modified the part file was started from
+VALIDATOR_SUFFIX = ".validator"
+
+# Errors after which a download can pick up where it stopped
+RESUMABLE_ERRORS = (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError)
+
+
+class DigestMismatch(Exception):
+    """Downloaded bytes do not match the attachment's digest."""
+
+
+class DownloadTooLarge(Exception):
+    """Attachment exceeds the limit for returning content inline."""
+
+
+class DownloadIncomplete(Exception):
+    """A byte range could not be fetched completely."""
+
+
+def digest_algorithm(digest: dict | None) -> str | None:
+    """hashlib name for an OpenProject digest ({"algorithm", "hash"}), or None."""
+    if not digest or not digest.get("hash"):
+        return None
+    algorithm = (digest.get("algorithm") or "").lower().replace("-", "")
+    if algorithm not in hashlib.algorithms_available:
+        log.debug("Cannot verify digest with algorithm %r", algorithm)
+        return None
+    return algorithm
+
+
+def new_hasher(digest: dict | None):
+    """Hash object for an OpenProject digest, or None if it can't be checked."""
+    algorithm = digest_algorithm(digest)
+    return hashlib.new(algorithm) if algorithm else None
+
+
+def _check_digest(hasher, digest: dict | None) -> bool | None:
+    if hasher is None or digest is None:
+        return None
+    expected = str(digest.get("hash", ""))
+    if hasher.hexdigest() != expected.lower():
+        raise DigestMismatch(
+            f"Digest mismatch: expected {expected}, got {hasher.hexdigest()}"
+        )
+    return True
+
+
+async def _hash_file(path: str, hasher) -> None:
+    # Feed an existing partial file into the hasher before appending to it
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, CHUNK_SIZE):
+            hasher.update(chunk)
+
+
+def _file_size(path: str) -> int:
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def _discard(*paths: str) -> None:
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _validator(res: httpx.Response) -> str | None:
+    # If-Range needs a strong ETag; Last-Modified is the fallback
+    etag = res.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return res.headers.get("Last-Modified")
+
+
+def _read_validator(path: str) -> str | None:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return f.read().strip() or None
+
+
+def _write_validator(path: str, validator: str | None) -> None:
+    if validator is None:
+        _discard(path)
+        return
+    with open(path, "w") as f:
+        f.write(validator)
+
+
+def _resumes_at(res: httpx.Response, offset: int, size: int | None) -> bool:
+    """Whether a 206 continues the part file: same start and same total size."""
+    start, total = _content_range(res.headers.get("Content-Range"))
+    if start != offset:
+        return False
+    return size is None or total == size
+
+
+async def download_to_file(
+    client: "OpenProjectClient",
+    url: str,
+    save_path: str,
+    digest: dict | None = None,
+    attempts: int = 3,
+    size: int | None = None,
+) -> dict:
+    """
+    Stream `url` into `save_path` with bounded memory.
+
+    Bytes go to `save_path + ".part"`, which is renamed into place only
+    after the body is complete, has the expected `size` and the digest (if
+    known) matches. If a part file already exists, e.g. from an interrupted
+    earlier call, the download resumes with a Range request; connection
+    drops mid-body resume the same way up to `attempts` times.
+
+    A part file is only continued if the server confirms it: If-Range
+    carries the validator the part was started from, and the 206 must start
+    at the part's end and report the same total size. Anything else
+    (including a wrong final size after resuming) truncates the part and
+    starts again from byte 0, as does a part that neither a validator nor
+    the digest can vouch for.
+    """
+    part_path = save_path + PART_SUFFIX
+    validator_path = part_path + VALIDATOR_SUFFIX
+    if not _read_validator(validator_path) and new_hasher(digest) is None:
+        # Nothing could tell a leftover part of another version apart
+        _discard(part_path)
+    resumed_from = _file_size(part_path)
+    restarted = False
+    failures = 0
+
+    while True:
+        offset = _file_size(part_path)
+        hasher = new_hasher(digest)
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            validator = _read_validator(validator_path)
+            if validator:
+                headers["If-Range"] = validator
+        stale = False
+        try:
+            async with client.stream("GET", url, headers=headers) as res:
+                if offset and res.status_code == 206:
+                    stale = not _resumes_at(res, offset, size)
+                elif offset:
+                    # Range ignored or If-Range failed; the body is the whole file
+                    offset = resumed_from = 0
+                if not stale:
+                    if not offset:
+                        _write_validator(validator_path, _validator(res))
+                    if hasher is not None and offset:
+                        await _hash_file(part_path, hasher)
+                    mode = "ab" if offset else "wb"
+                    f = await asyncio.to_thread(open, part_path, mode)
+                    try:
+                        async for chunk in res.aiter_bytes():
+                            await asyncio.to_thread(f.write, chunk)
+                            if hasher is not None:
+                                hasher.update(chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 416 or not offset:
+                raise
+            stale = True
+        except RESUMABLE_ERRORS as e:
+            failures += 1
+            if failures >= attempts:
+                raise
+            log.info("Download of %s interrupted (%s); resuming", url, e)
+            continue
+
+        if stale:
+            # Part file belongs to another version of the attachment
+            log.info("Discarding stale part file for %s", url)
+            _discard(part_path, validator_path)
+            resumed_from = 0
+            continue
+
+        written = _file_size(part_path)
+        if size is not None and written != size:
+            _discard(part_path, validator_path)
+            if resumed_from and not restarted:
+                log.info("Resumed download of %s has the wrong size", url)
+                resumed_from, restarted = 0, True
+                continue
+            raise DownloadIncomplete(f"Downloaded {written} of {size} bytes")
+
+        try:
+            verified = _check_digest(hasher, digest)
+        except DigestMismatch:
+            _discard(part_path, validator_path)
+            if resumed_from and not restarted:
+                log.info("Resumed download of %s failed its digest", url)
+                resumed_from, restarted = 0, True
+                continue
+            raise
+        os.replace(part_path, save_path)
+        _discard(validator_path)
+        return {
+            "bytes": os.path.getsize(save_path),
+            "resumed_from": resumed_from,
+            "digest_verified": verified,
+            "mode": "single",
+        }
+
+
+def can_split() -> bool:
+    # Positioned writes need os.pwrite (not available on Windows)
+    return hasattr(os, "pwrite")
+
+
+@dataclass
+class _Segment:
+    index: int
+    start: int
+    end: int | None  # inclusive; None once the server sends the whole file
+    written: int = 0
+    seconds: float = 0.0
+    retries: int = 0
+
+    @property
+    def size(self) -> int | None:
+        return None if self.end is None else self.end - self.start + 1
+
+    def report(self) -> dict:
+        return {
+            "index": self.index,
+            "start": self.start,
+            "end": self.start + self.written - 1,
+            "bytes": self.written,
+            "seconds": round(self.seconds, 3),
+            "retries": self.retries,
+        }
+
+
+def _split(size: int, segments: int) -> list[_Segment]:
+    step = math.ceil(size / segments)
+    return [
+        _Segment(i, start, min(start + step, size) - 1)
+        for i, start in enumerate(range(0, size, step))
+    ]
+
+
+async def _fetch_segment(
+    client: "OpenProjectClient",
+    url: str,
+    fd: int,
+    seg: _Segment,
+    attempts: int,
+    ranged: asyncio.Future | None = None,
+) -> None:
+    """
+    Fetch one byte range into its place in the file, resuming on drops.
+
+    The first segment doubles as the probe: it resolves `ranged` with
+    whether the server answered 206. On a 200 it keeps going and writes
+    the whole body, which becomes the single-stream fallback.
+    """
+    started = time.monotonic()
+    for attempt in range(attempts):
+        pos = seg.start + seg.written
+        end = "" if seg.end is None else seg.end
+        try:
+            async with client.stream(
+                "GET", url, headers={"Range": f"bytes={pos}-{end}"}
+            ) as res:
+                if res.status_code != 206:
+                    if ranged is None or (ranged.done() and ranged.result()):
+                        raise DownloadIncomplete(
+                            f"Server ignored the Range for segment {seg.index}"
+                        )
+                    seg.written, seg.end = 0, None
+                if ranged is not None and not ranged.done():
+                    ranged.set_result(res.status_code == 206)
+                async for chunk in res.aiter_bytes():
+                    if seg.size is not None:
+                        chunk = chunk[: seg.size - seg.written]
+                    await asyncio.to_thread(
+                        os.pwrite, fd, chunk, seg.start + seg.written
+                    )
+                    seg.written += len(chunk)
+        except RESUMABLE_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            seg.retries += 1
+            log.info("Segment %d of %s interrupted (%s)", seg.index, url, e)
+            continue
+        if seg.size is None or seg.written >= seg.size:
+            break
+        seg.retries += 1
+    else:
+        raise DownloadIncomplete(
+            f"Segment {seg.index} ended after {seg.written} of {seg.size} bytes"
+        )
+    seg.seconds = time.monotonic() - started
+
+
+async def _hash_file_digest(path: str, digest: dict | None) -> bool | None:
+    hasher = new_hasher(digest)
+    if hasher is None:
+        return None
+    await _hash_file(path, hasher)
+    return _check_digest(hasher, digest)
+
+
+async def download_segmented(
+    client: "OpenProjectClient",
+    url: str,
+    save_path: str,
+    size: int,
+    segments: int,
+    digest: dict | None = None,
+    attempts: int = 3,
+) -> dict:
+    """
+    Download `size` bytes as concurrent byte ranges into a preallocated file.
+
+    Each segment is written in place with positioned writes, so segments
+    can land in any order. If the server answers the first range with 200,
+    that response is streamed as the whole file instead (single-stream
+    fallback). Segments are retried from where they stopped, but a failed
+    parallel download is not resumable across calls, so its part file is
+    removed. The digest is checked in one sequential pass at the end.
+    """
+    part_path = save_path + PART_SUFFIX
+    parts = _split(size, segments)
+    ranged = asyncio.get_running_loop().create_future()
+    tasks: list[asyncio.Future] = []
+    fd = await asyncio.to_thread(
+        os.open, part_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644
+    )
+    try:
+        await asyncio.to_thread(os.ftruncate, fd, size)
+        tasks.append(
+            asyncio.ensure_future(
+                _fetch_segment(client, url, fd, parts[0], attempts, ranged)
+            )
+        )
+        await asyncio.wait([tasks[0], ranged], return_when=asyncio.FIRST_COMPLETED)
+        if tasks[0].done() and not ranged.done():
+            tasks[0].result()  # failed before the headers arrived
+        if ranged.result():
+            tasks.extend(
+                asyncio.ensure_future(_fetch_segment(client, url, fd, seg, attempts))
+                for seg in parts[1:]
+            )
+        else:
+            parts = parts[:1]
+        await asyncio.gather(*tasks)
+        if not ranged.result():
+            await asyncio.to_thread(os.ftruncate, fd, parts[0].written)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.to_thread(os.close, fd)
+        os.remove(part_path)
+        raise
+    await asyncio.to_thread(os.close, fd)
+
+    try:
+        verified = await _hash_file_digest(part_path, digest)
+    except DigestMismatch:
+        os.remove(part_path)
+        raise
+    os.replace(part_path, save_path)
+    return {
+        "bytes": os.path.getsize(save_path),
+        "resumed_from": 0,
+        "digest_verified": verified,
+        "mode": "parallel" if ranged.result() else "single",
+        "segments": [seg.report() for seg in parts],
+    }
+
+
+async def download_to_memory(
+    client: "OpenProjectClient",
+    url: str,
+    max_bytes: int,
+    digest: dict | None = None,
+) -> bytearray:
+    """Stream `url` into memory, refusing bodies larger than `max_bytes`."""
+    hasher = new_hasher(digest)
+    buf = bytearray()
+    async with client.stream("GET", url) as res:
+        async for chunk in res.aiter_bytes():
+            if len(buf) + len(chunk) > max_bytes:
+                raise DownloadTooLarge(
+                    f"Attachment is larger than {max_bytes} bytes; "
+                    "use save_path to download it to disk"
+                )
+            buf += chunk
+            if hasher is not None:
+                hasher.update(chunk)
+    _check_digest(hasher, digest)
+    return buf
+
+
+def _content_range(content_range: str | None) -> tuple[int | None, int | None]:
+    # "bytes 0-1023/52341" -> (0, 52341); the total is "*" when unknown
+    if not content_range or "/" not in content_range:
+        return None, None
+    span, total = content_range.removeprefix("bytes").rsplit("/", 1)
+    start = span.strip().partition("-")[0]
+    return (
+        int(start) if start.isdigit() else None,
+        int(total) if total.strip().isdigit() else None,
+    )
+
+
+async def download_prefix(
+    client: "OpenProjectClient",
+    url: str,
+    max_bytes: int,
+    use_range: bool = True,
+) -> dict:
+    """
+    Read at most `max_bytes` from the start of `url`.
+
+    Asks for the range when `use_range` is set, but never relies on it:
+    the body is streamed and the connection is dropped as soon as
+    `max_bytes` have arrived, so a server that ignores Range (200 instead
+    of 206) costs one preview's worth of bandwidth, not the whole file.
+    """
+    headers = {"Range": f"bytes=0-{max_bytes - 1}"} if use_range else {}
+    buf = bytearray()
+    truncated = False
+    try:
+        async with client.stream("GET", url, headers=headers) as res:
+            async for chunk in res.aiter_bytes():
+                room = max_bytes - len(buf)
+                if len(chunk) > room:
+                    buf += chunk[:room]
+                    truncated = True
+                    break
+                buf += chunk
+            status = res.status_code
+            _, total = _content_range(res.headers.get("Content-Range"))
+    except httpx.HTTPStatusError as e:
+        # An empty attachment has no satisfiable range
+        if e.response.status_code != 416:
+            raise
+        status, total = 416, None
+
+    if status == 206 and total is not None and total > len(buf):
+        truncated = True
+    return {
+        "content": buf,
+        "status": status,
+        "range_honored": status == 206,
+        "truncated": truncated,
+    }
@@ -0,0 +1,33 @@
+"""Small accessors for OpenProject HAL+JSON resources."""
+
+
+def link(obj: dict, name: str) -> dict:
+    return (obj.get("_links") or {}).get(name) or {}
+
+
+def link_title(obj: dict, name: str) -> str | None:
+    return link(obj, name).get("title")
+
+
+def link_titles(obj: dict, name: str) -> list[str]:
+    """Titles of a multi-valued link such as a membership's roles."""
+    links = (obj.get("_links") or {}).get(name) or []
+    return [
+        item["title"] for item in links if isinstance(item, dict) and item.get("title")
+    ]
+
+
+def link_id(obj: dict, name: str) -> int | None:
+    """Numeric id at the end of a link's href, e.g. /api/v3/users/7 -> 7."""
+    href = link(obj, name).get("href") or ""
+    tail = href.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+def raw(obj: dict, name: str) -> str | None:
+    """Markdown source of a formattable property, without its html render."""
+    return (obj.get(name) or {}).get("raw") or None
+
+
+def elements(collection: dict) -> list:
+    return (collection.get("_embedded") or {}).get("elements") or []
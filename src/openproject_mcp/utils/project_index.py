@@ -0,0 +1,234 @@
+import asyncio
+import json
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable
+
+from openproject_mcp.utils.projection import collection_select
+from openproject_mcp.utils.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from openproject_mcp.client import OpenProjectClient
+    from openproject_mcp.config import Settings
+
+log = logging.getLogger(__name__)
+
+# Don't hit the API again on a miss if the index was refreshed this recently
+MISS_REFRESH_INTERVAL = 30.0
+# Overlap incremental windows to absorb clock skew between us and the server
+CLOCK_SKEW = timedelta(seconds=60)
+# All the index matches on and resolve_project returns; the rest of each
+# project representation would only sit in memory
+INDEX_FIELDS = ["id", "identifier", "name", "updatedAt", "_links/self"]
+
+
+def _fold(value: str | None) -> str:
+    return (value or "").casefold().strip()
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _ProjectTable:
+    """Projects keyed by id with exact-identifier and trigram substring indexes."""
+
+    def __init__(self) -> None:
+        self.projects: dict[int, dict] = {}
+        self.position: dict[int, int] = {}
+        self.by_identifier: dict[str, set[int]] = {}
+        self.grams: dict[str, dict[str, set[int]]] = {"name": {}, "identifier": {}}
+        self.folded: dict[int, dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def _unindex(self, pid: int) -> None:
+        old = self.folded.pop(pid, None)
+        if old is None:
+            return
+        self.by_identifier.get(old["identifier"], set()).discard(pid)
+        for field, text in old.items():
+            for gram in _trigrams(text):
+                self.grams[field].get(gram, set()).discard(pid)
+
+    def upsert(self, project: dict) -> None:
+        pid = project.get("id")
+        if pid is None:
+            return
+        self._unindex(pid)
+        self.projects[pid] = project
+        self.position.setdefault(pid, len(self.position))
+        folded = {
+            "name": _fold(project.get("name")),
+            "identifier": _fold(project.get("identifier")),
+        }
+        self.folded[pid] = folded
+        self.by_identifier.setdefault(folded["identifier"], set()).add(pid)
+        for field, text in folded.items():
+            for gram in _trigrams(text):
+                self.grams[field].setdefault(gram, set()).add(pid)
+
+    def _ordered(self, ids) -> list[dict]:
+        return [self.projects[i] for i in sorted(ids, key=self.position.__getitem__)]
+
+    def exact_identifier(self, term: str) -> list[dict]:
+        return self._ordered(self.by_identifier.get(_fold(term), ()))
+
+    def contains(self, field: str, term: str) -> list[dict]:
+        term = _fold(term)
+        candidates: Iterable[int]
+        if len(term) < 3:
+            candidates = self.projects.keys()
+        else:
+            sets = [self.grams[field].get(g, set()) for g in _trigrams(term)]
+            candidates = set.intersection(*sets)
+        return self._ordered(
+            pid for pid in candidates if term in self.folded[pid][field]
+        )
+
+
+class ProjectIndex:
+    """
+    In-memory directory of every visible project.
+
+    The first lookup pages through /projects (remaining pages concurrently).
+    Afterwards lookups are served from memory; once the index is older than
+    the refresh interval a background refresh pulls only projects whose
+    updatedAt moved, and a periodic full rebuild drops deleted projects.
+    """
+
+    def __init__(self, client: "OpenProjectClient", settings: "Settings"):
+        self.client = client
+        self.page_size = settings.project_index_page_size
+        self.refresh_interval = settings.project_index_refresh_interval
+        self.rebuild_interval = settings.project_index_rebuild_interval
+        self.concurrency = settings.max_concurrency
+        self._table: _ProjectTable | None = None
+        self._loaded_at = 0.0
+        self._refreshed_at = 0.0
+        self._since: datetime | None = None
+        self._loads = SingleFlight()
+        self._background: asyncio.Task | None = None
+
+    async def _fetch_page(self, offset: int) -> dict:
+        params = {
+            "pageSize": self.page_size,
+            "offset": offset,
+            "sortBy": json.dumps([["id", "asc"]]),
+            "select": collection_select(INDEX_FIELDS),
+        }
+        res = await self.client.get("/projects", params=params)
+        return res.json()
+
+    async def _fetch_all(self) -> list[dict]:
+        first = await self._fetch_page(1)
+        elements = first.get("_embedded", {}).get("elements", [])
+        total = first.get("total", len(elements))
+        # The server may clamp pageSize; page maths must use what it used
+        size = first.get("pageSize") or len(elements) or self.page_size
+        pages = math.ceil(total / size) if size else 1
+        if pages <= 1:
+            return elements
+
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(offset: int) -> list[dict]:
+            async with sem:
+                data = await self._fetch_page(offset)
+            return data.get("_embedded", {}).get("elements", [])
+
+        rest = await asyncio.gather(*(fetch(o) for o in range(2, pages + 1)))
+        for page in rest:
+            elements.extend(page)
+        return elements
+
+    async def _rebuild(self) -> _ProjectTable:
+        started = datetime.now(timezone.utc)
+        table = _ProjectTable()
+        for project in await self._fetch_all():
+            table.upsert(project)
+        self._table = table
+        self._since = started
+        self._loaded_at = self._refreshed_at = time.monotonic()
+        log.debug("Project index rebuilt with %d projects", len(table))
+        return table
+
+    async def _refresh_changed(self) -> None:
+        # A rebuild or invalidate() may swap the table while we are fetching;
+        # changes only go into the table they were fetched for
+        table, since_loaded = self._table, self._since
+        if table is None or since_loaded is None:
+            await self._loads.do("rebuild", self._rebuild)
+            return
+        started = datetime.now(timezone.utc)
+        since = (since_loaded - CLOCK_SKEW).isoformat()
+        filters = [{"updatedAt": {"operator": "<>d", "values": [since, ""]}}]
+        # Usually a handful of projects, so stream them instead of fanning out
+        changed = [
+            project
+            async for project in self.client.iter_collection(
+                "/projects",
+                params={"filters": json.dumps(filters)},
+                page_size=self.page_size,
+                select=INDEX_FIELDS,
+            )
+        ]
+        if self._table is not table:
+            log.debug("Project index replaced during refresh; dropping changes")
+            return
+        for project in changed:
+            table.upsert(project)
+        self._since = started
+        self._refreshed_at = time.monotonic()
+        log.debug("Project index refreshed, %d projects changed", len(changed))
+
+    async def refresh(self, full: bool = False) -> None:
+        """Bring the index up to date (incrementally unless full or due)."""
+        now = time.monotonic()
+        if full or self._table is None or now - self._loaded_at > self.rebuild_interval:
+            await self._loads.do("rebuild", self._rebuild)
+        else:
+            await self._loads.do("refresh", self._refresh_changed)
+
+    def _refresh_in_background(self) -> None:
+        if self._background is not None and not self._background.done():
+            return
+
+        async def run():
+            try:
+                await self.refresh()
+            except Exception as e:  # keep serving the current index
+                log.warning("Background project index refresh failed: %s", e)
+
+        self._background = asyncio.ensure_future(run())
+
+    async def table(self) -> _ProjectTable:
+        table = self._table
+        if table is None:
+            return await self._loads.do("rebuild", self._rebuild)
+        if time.monotonic() - self._refreshed_at > self.refresh_interval:
+            self._refresh_in_background()
+        return table
+
+    async def refresh_after_miss(self) -> bool:
+        """Refresh once for a lookup that found nothing; False if too recent."""
+        if time.monotonic() - self._refreshed_at < MISS_REFRESH_INTERVAL:
+            return False
+        await self.refresh()
+        return True
+
+    def invalidate(self) -> None:
+        self._table = None
+
+    def stats(self) -> dict:
+        return {
+            "projects": len(self._table) if self._table is not None else 0,
+            "age_seconds": (
+                round(time.monotonic() - self._refreshed_at, 1)
+                if self._table is not None
+                else None
+            ),
+        }
@@ -0,0 +1,70 @@
+import re
+from typing import Iterable, Literal, Sequence
+
+from openproject_mcp.config import Settings
+
+OutputMode = Literal["compact", "full"]
+
+# Collection properties page_from_collection needs to keep paging
+PAGING_PROPERTIES = ("total", "count", "pageSize", "offset")
+# fields=["*"] asks for full representations (no select at all)
+ALL_FIELDS = "*"
+
+_FIELD = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(/[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+def use_compact(requested: OutputMode | None, settings: Settings) -> bool:
+    """Whether a tool call returns lean projections (per call, else global)."""
+    return (requested or settings.output_mode) == "compact"
+
+
+def collection_select(
+    fields: Sequence[str], collection: Sequence[str] = PAGING_PROPERTIES
+) -> str:
+    """
+    OpenProject `select` keeping the `collection` properties of a collection
+    and only `fields` of each element.
+
+    Fields are element properties ("subject"), links ("status") or nested
+    paths ("_links/self"); each becomes "elements/<field>". "id" is always
+    selected. Raises ValueError for a malformed field.
+    """
+    selected = []
+    for field in ["id", *fields]:
+        field = field.strip().removeprefix("elements/")
+        if not _FIELD.match(field):
+            raise ValueError(f"Invalid field {field!r}")
+        selected.append(f"elements/{field}")
+    return ",".join([*collection, *dict.fromkeys(selected)])
+
+
+def fields_select(
+    fields: Sequence[str] | None,
+    default: Sequence[str],
+    collection: Sequence[str] = PAGING_PROPERTIES,
+) -> str | None:
+    """
+    `select` for a read tool's `fields` parameter: the tool's default field
+    set when fields is None, and None (full representations) for ["*"].
+    """
+    if fields is not None and ALL_FIELDS in fields:
+        return None
+    return collection_select(default if fields is None else fields, collection)
+
+
+def fields_description(default: Sequence[str]) -> str:
+    """Description of a read tool's `fields` parameter."""
+    return (
+        "Properties to return per item (OpenProject select: properties, links "
+        f"or nested paths like '_links/self'), defaults to {', '.join(default)}; "
+        "['*'] returns full representations"
+    )
+
+
+def compact(model, items: Iterable[dict], settings: Settings) -> list[dict]:
+    """Project HAL resources onto a lean model from openproject_mcp.models."""
+    base_url = str(settings.url).rstrip("/")
+    return [
+        model.from_hal(item, base_url).model_dump(mode="json", exclude_none=True)
+        for item in items
+    ]
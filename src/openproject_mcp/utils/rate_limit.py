@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+log = logging.getLogger(__name__)
+
+# Header pairs some servers/proxies send alongside (or instead of) Retry-After
+REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset")
+
+
+def parse_retry_after(value: str | None, maximum: float) -> float | None:
+    """
+    Parse a Retry-After header value into seconds to wait.
+
+    Accepts both forms allowed by RFC 9110 (delay-seconds and HTTP-date).
+    Returns None if the value is missing or unparsable; clamps to [0, maximum].
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, min(delay, maximum))
+
+
+def _parse_reset(value: str, maximum: float) -> float | None:
+    # Reset is either seconds-until-reset or an epoch timestamp
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > 10**9:
+        reset -= time.time()
+    return max(0.0, min(reset, maximum))
+
+
+class RateLimiter:
+    """
+    Client-wide token bucket with AIMD rate adaptation.
+
+    Requests are not metered until the server pushes back: a 429 or an
+    exhausted RateLimit-Remaining quota switches the bucket on at the
+    configured rate. From then on every request takes one token and callers
+    wait in FIFO order when the bucket is empty instead of failing. A 429
+    halves the refill rate (multiplicative decrease) and pauses all callers
+    for Retry-After. Successful responses add `increase` tokens/second back
+    at most once per `increase_interval` seconds (additive increase), so a
+    burst of fast responses right after a 429 cannot undo the backoff at
+    once; back at the configured rate, the bucket switches off again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float = 0.5,
+        increase: float = 1.0,
+        increase_interval: float = 1.0,
+        max_pause: float = 60.0,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = max(1, burst)
+        self.increase = increase
+        self.increase_interval = increase_interval
+        self._adjusted_at = 0.0
+        self.throttled = False
+        self.max_pause = max_pause
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_rate > 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    async def acquire(self) -> None:
+        """Wait for a token; waiters are served in arrival order."""
+        if not self.enabled:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if not self.throttled:
+                    return
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` (e.g. from Retry-After)."""
+        until = time.monotonic() + min(seconds, self.max_pause)
+        self._paused_until = max(self._paused_until, until)
+
+    def _throttle(self, now: float) -> None:
+        # Start metering at the configured rate with an empty bucket
+        if not self.throttled:
+            self.throttled = True
+            self.rate = self.max_rate
+            self._updated = now
+            self._tokens = 0.0
+            self._adjusted_at = now
+
+    def on_success(self) -> None:
+        if not self.throttled:
+            return
+        now = time.monotonic()
+        if now - self._adjusted_at >= self.increase_interval:
+            self._adjusted_at = now
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            if self.rate >= self.max_rate:
+                self.throttled = False
+
+    def on_throttled(self, retry_after: float | None) -> None:
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        self._throttle(now)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._adjusted_at = now
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after is not None:
+            self.pause(retry_after)
+        log.info(
+            "Rate limited by server; rate now %.2f req/s, retry after %s",
+            self.rate,
+            retry_after,
+        )
+
+    def observe(self, headers) -> None:
+        """Pause until the reset time when the server reports no quota left."""
+        if not self.enabled:
+            return
+        remaining = next((headers[h] for h in REMAINING_HEADERS if h in headers), None)
+        reset = next((headers[h] for h in RESET_HEADERS if h in headers), None)
+        if remaining is None or reset is None:
+            return
+        try:
+            if int(float(remaining)) > 0:
+                return
+        except ValueError:
+            return
+        self._throttle(time.monotonic())
+        delay = _parse_reset(reset, self.max_pause)
+        if delay:
+            self.pause(delay)
@@ -0,0 +1,118 @@
+import copy
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from openproject_mcp.utils.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from openproject_mcp.client import OpenProjectClient
+    from openproject_mcp.config import Settings
+
+
+def _fold(name: str | None) -> str:
+    return (name or "").casefold().strip()
+
+
+@dataclass
+class ReferenceSet:
+    """One cached reference collection plus a case-folded name index."""
+
+    collection: dict
+    elements: list[dict]
+    loaded_at: float
+    by_name: dict[str, list[dict]] = field(default_factory=dict)
+
+    @classmethod
+    def from_collection(cls, collection: dict) -> "ReferenceSet":
+        elements = collection.get("_embedded", {}).get("elements", [])
+        by_name: dict[str, list[dict]] = {}
+        for el in elements:
+            by_name.setdefault(_fold(el.get("name")), []).append(el)
+        return cls(
+            collection=collection,
+            elements=elements,
+            loaded_at=time.monotonic(),
+            by_name=by_name,
+        )
+
+    def exact(self, name: str) -> list[dict]:
+        return self.by_name.get(_fold(name), [])
+
+    def partial(self, name: str) -> list[dict]:
+        term = _fold(name)
+        return [el for key, els in self.by_name.items() if term in key for el in els]
+
+    def as_collection(self) -> dict:
+        # Callers get their own copy so the cached payload cannot be mutated
+        return copy.deepcopy(self.collection)
+
+
+class ReferenceDataCache:
+    """
+    In-memory cache for slowly-changing reference collections.
+
+    Statuses and types (global and per project) are fetched once and kept
+    for a per-collection TTL, so name resolution runs against local dicts
+    instead of the API. Concurrent misses for the same collection share a
+    single load.
+    """
+
+    def __init__(self, client: "OpenProjectClient", settings: "Settings"):
+        self.client = client
+        self.ttls = {
+            "statuses": settings.status_cache_ttl,
+            "types": settings.type_cache_ttl,
+        }
+        self._sets: dict[tuple, ReferenceSet] = {}
+        self._loads = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    async def _get(
+        self, key: tuple, load: Callable[[], Awaitable[dict]]
+    ) -> ReferenceSet:
+        cached = self._sets.get(key)
+        ttl = self.ttls[key[0]]
+        if cached is not None and time.monotonic() - cached.loaded_at < ttl:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        async def _load() -> ReferenceSet:
+            ref = ReferenceSet.from_collection(await load())
+            if ttl > 0:
+                self._sets[key] = ref
+            return ref
+
+        return await self._loads.do(key, _load)
+
+    async def _fetch(self, path: str) -> dict:
+        res = await self.client.get(path)
+        return res.json()
+
+    async def statuses(self) -> ReferenceSet:
+        return await self._get(("statuses",), lambda: self._fetch("/statuses"))
+
+    async def types(self, project_id: int | None = None) -> ReferenceSet:
+        if project_id:
+            return await self._get(
+                ("types", project_id),
+                lambda: self._fetch(f"/projects/{project_id}/types"),
+            )
+        return await self._get(("types", None), lambda: self._fetch("/types"))
+
+    def invalidate(self, collection: str | None = None) -> None:
+        """Drop one collection ('statuses', 'types', ...) or everything."""
+        if collection is None:
+            self._sets.clear()
+            return
+        for key in [k for k in self._sets if k[0] == collection]:
+            del self._sets[key]
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._sets),
+        }
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into one execution.
+
+    The first caller for a key (the leader) runs the coroutine; callers that
+    arrive while it is still running await the same result. Once it settles
+    the key is forgotten, so later calls run again. The shared task is
+    shielded so that one cancelled awaiter does not cancel it for the rest;
+    it is only cancelled once every awaiter has gone away.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._waiters: dict[asyncio.Future, int] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+        else:
+            self.leaders += 1
+            fut = asyncio.ensure_future(fn())
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda f: self._forget(key, f))
+        self._waiters[fut] = self._waiters.get(fut, 0) + 1
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            if self._waiters.get(fut) == 1 and not fut.done():
+                fut.cancel()
+            raise
+        finally:
+            remaining = self._waiters.get(fut, 1) - 1
+            if remaining:
+                self._waiters[fut] = remaining
+            else:
+                self._waiters.pop(fut, None)
+
+    def _forget(self, key: Hashable, fut: asyncio.Future) -> None:
+        if self._inflight.get(key) is fut:
+            del self._inflight[key]
+        # Mark the exception retrieved if every awaiter was cancelled
+        if not fut.cancelled():
+            fut.exception()
+
+    def stats(self) -> dict:
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from mcp.server.fastmcp import Context
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# Large enough to keep per-chunk thread hops cheap, small enough for flat RSS
+CHUNK_SIZE = 256 * 1024
+# Emit at most ~100 progress notifications per upload
+PROGRESS_STEPS = 100
+
+
+class MultipartFileUpload:
+    """
+    multipart/form-data body for an OpenProject attachment, streamed from disk.
+
+    The body has the two parts the attachments API expects: a JSON
+    `metadata` part and the binary `file` part. File chunks are read in a
+    worker thread so the event loop never blocks on disk I/O, and memory
+    stays at one chunk regardless of file size. Iterating again reopens the
+    file, so the client can resend the body when it retries a request.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        description: str | None = None,
+        on_progress: ProgressCallback | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.file_path = file_path
+        self.file_name = os.path.basename(file_path)
+        self.file_size = os.path.getsize(file_path)
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+
+        content_type, _ = mimetypes.guess_type(file_path)
+        metadata: dict[str, Any] = {"fileName": self.file_name}
+        if description:
+            metadata["description"] = {"raw": description}
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            'Content-Disposition: form-data; name="metadata"\r\n'
+            "Content-Type: application/json\r\n\r\n"
+            f"{json.dumps(metadata)}\r\n"
+            f"--{self.boundary}\r\n"
+            "Content-Disposition: form-data; "
+            f'name="file"; filename="{_quote(self.file_name)}"\r\n'
+            f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def headers(self) -> dict:
+        # A known length avoids chunked transfer, which some proxies reject
+        length = len(self._head) + self.file_size + len(self._tail)
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+            "Content-Length": str(length),
+        }
+
+    async def _report(self, sent: int) -> None:
+        if self.on_progress is not None:
+            await self.on_progress(sent, self.file_size)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        sent = 0
+        step = max(self.file_size // PROGRESS_STEPS, self.chunk_size)
+        reported = 0
+        await self._report(0)
+        f = await asyncio.to_thread(open, self.file_path, "rb")
+        try:
+            while chunk := await asyncio.to_thread(f.read, self.chunk_size):
+                yield chunk
+                sent += len(chunk)
+                if sent - reported >= step:
+                    reported = sent
+                    await self._report(sent)
+        finally:
+            await asyncio.to_thread(f.close)
+        if reported != sent:
+            await self._report(sent)
+        yield self._tail
+
+
+def _digest_file(path: str, algorithms: set[str]) -> dict[str, str]:
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+
+async def file_digests(path: str, algorithms: set[str]) -> dict[str, str]:
+    """
+    Hex digests of a file for each hashlib algorithm, computed in one
+    streamed pass in a worker thread.
+    """
+    return await asyncio.to_thread(_digest_file, path, algorithms)
+
+
+def _quote(name: str) -> str:
+    # Quoted-string form used by browsers for multipart filenames
+    return name.replace("\\", "\\\\").replace('"', "%22").replace("\r\n", "%0D%0A")
+
+
+def _in_request(ctx: Context) -> bool:
+    # Context.request_context raises ValueError outside of a request
+    try:
+        return ctx.request_context is not None
+    except ValueError:
+        return False
+
+
+def progress_notifier(ctx: Context | None) -> ProgressCallback | None:
+    """
+    Adapt an MCP tool context into an upload progress callback.
+
+    Returns None when the tool is called outside a request (e.g. directly
+    in tests); the context itself drops reports if the client sent no
+    progress token.
+    """
+    if ctx is None or not _in_request(ctx):
+        return None
+
+    async def notify(sent: int, total: int) -> None:
+        await ctx.report_progress(sent, total)
+
+    return notify
@@ -5,9 +5,13 @@ from openproject_mcp.config import Settings
 
 
 @pytest.fixture
-def mock_settings():
+def mock_settings(tmp_path):
     """Mock OpenProject settings"""
-    return Settings(url="https://test.openproject.com", api_key="test_api_key_12345")
+    return Settings(
+        url="https://test.openproject.com",
+        api_key="test_api_key_12345",
+        attachment_cache_dir=str(tmp_path / "attachment-cache"),
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,160 @@
+"""Unit tests for the attachment metadata cache and content store."""
+
+import hashlib
+import os
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+from openproject_mcp.client import OpenProjectClient
+from openproject_mcp.utils.attachment_cache import ContentStore, digest_key
+
+
+def md5(data: bytes) -> dict:
+    return {"algorithm": "md5", "hash": hashlib.md5(data).hexdigest()}
+
+
+def key_for(data: bytes) -> str:
+    return digest_key(md5(data))
+
+
+@pytest_asyncio.fixture
+async def client(mock_settings):
+    """OpenProjectClient closed after each test."""
+    c = OpenProjectClient(mock_settings)
+    yield c
+    await c.aclose()
+
+
+@pytest.fixture
+def base_url(mock_settings):
+    """Base URL for API endpoints."""
+    return str(mock_settings.url).rstrip("/") + "/api/v3"
+
+
+class TestDigestKey:
+    """Test turning OpenProject digests into store keys"""
+
+    def test_key(self):
+        assert digest_key({"algorithm": "MD5", "hash": "ABC123"}) == "md5-abc123"
+
+    @pytest.mark.parametrize(
+        "digest",
+        [None, {}, {"algorithm": "md5"}, {"algorithm": "md5", "hash": "../etc"}],
+    )
+    def test_unusable_digest(self, digest):
+        assert digest_key(digest) is None
+
+
+class TestContentStore:
+    """Test the sharded, size-bounded blob store"""
+
+    @pytest.mark.asyncio
+    async def test_put_and_get_sharded_by_digest(self, tmp_path):
+        store = ContentStore(str(tmp_path), max_bytes=1024)
+        key = key_for(b"hello")
+
+        await store.put_bytes(key, b"hello")
+        path = await store.get(key)
+
+        value = key.split("-", 1)[1]
+        assert path == str(tmp_path / value[:2] / value[2:4] / key)
+        with open(path, "rb") as f:
+            assert f.read() == b"hello"
+
+    @pytest.mark.asyncio
+    async def test_miss(self, tmp_path):
+        store = ContentStore(str(tmp_path), max_bytes=1024)
+
+        assert await store.get(key_for(b"nope")) is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path):
+        store = ContentStore(str(tmp_path), max_bytes=250)
+        blobs = [bytes([i]) * 100 for i in range(3)]
+
+        await store.put_bytes(key_for(blobs[0]), blobs[0])
+        await store.put_bytes(key_for(blobs[1]), blobs[1])
+        time.sleep(0.01)
+        await store.get(key_for(blobs[0]))  # blob 1 is now the oldest
+        await store.put_bytes(key_for(blobs[2]), blobs[2])
+
+        assert await store.get(key_for(blobs[1])) is None
+        assert await store.get(key_for(blobs[0])) is not None
+        assert await store.get(key_for(blobs[2])) is not None
+        assert store.size == 200
+
+    @pytest.mark.asyncio
+    async def test_oversized_blob_is_not_stored(self, tmp_path):
+        store = ContentStore(str(tmp_path), max_bytes=10)
+
+        await store.put_bytes(key_for(b"x" * 11), b"x" * 11)
+
+        assert store.size == 0
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_from_disk(self, tmp_path):
+        await ContentStore(str(tmp_path), max_bytes=1024).put_bytes(
+            key_for(b"kept"), b"kept"
+        )
+
+        store = ContentStore(str(tmp_path), max_bytes=1024)
+
+        assert await store.get(key_for(b"kept")) is not None
+        assert store.size == 4
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, tmp_path):
+        store = ContentStore(str(tmp_path), max_bytes=0)
+
+        await store.put_bytes(key_for(b"data"), b"data")
+
+        assert await store.get(key_for(b"data")) is None
+        assert os.listdir(tmp_path) == []
+
+
+class TestAttachmentCache:
+    """Test the metadata cache and digest-checked content caching"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_metadata_fetched_once(self, client, base_url):
+        route = respx.get(f"{base_url}/attachments/7").mock(
+            return_value=httpx.Response(200, json={"id": 7})
+        )
+
+        first = await client.attachments.metadata(7)
+        second = await client.attachments.metadata(7)
+
+        assert first == second == {"id": 7}
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_invalidate_metadata(self, client, base_url):
+        route = respx.get(f"{base_url}/attachments/7").mock(
+            return_value=httpx.Response(200, json={"id": 7})
+        )
+
+        await client.attachments.metadata(7)
+        client.attachments.invalidate(7)
+        await client.attachments.metadata(7)
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_add_bytes_checks_digest(self, client):
+        cache = client.attachments
+        good = {"digest": md5(b"payload")}
+        bad = {"digest": md5(b"something else")}
+
+        await cache.add_bytes(bad, b"payload")
+        assert await cache.content_path(bad) is None
+
+        await cache.add_bytes(good, b"payload")
+        path = await cache.content_path(good)
+        assert await cache.read(path) == b"payload"
+        assert cache.stats()["hits"] == 1
@@ -96,9 +96,8 @@ class TestListAttachments:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 2
-        assert len(response_data["_embedded"]["elements"]) == 2
-        assert response_data["_embedded"]["elements"][0]["fileName"] == "document.pdf"
+        assert len(response_data["items"]) == 2
+        assert response_data["items"][0]["fileName"] == "document.pdf"
 
     @respx.mock
     @pytest.mark.asyncio
@@ -121,7 +120,7 @@ class TestListAttachments:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 0
+        assert len(response_data["items"]) == 0
 
     @respx.mock
     @pytest.mark.asyncio
@@ -236,6 +235,359 @@ class TestAttachFileToWp:
         assert route.called
         assert "Permission denied" in str(exc_info.value)
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_attach_file_streams_multipart_body(
+        self, server, base_url, temp_file
+    ):
+        """The file is sent as a streamed multipart body with JSON metadata."""
+        import json
+
+        route = respx.post(f"{base_url}/work_packages/456/attachments").mock(
+            return_value=httpx.Response(201, json={"id": 125})
+        )
+
+        await server.call_tool(
+            "attach_file_to_wp",
+            {"params": {"wp_id": 456, "file_path": temp_file, "description": "Log"}},
+        )
+
+        request = route.calls.last.request
+        body = request.content
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert int(request.headers["Content-Length"]) == len(body)
+        assert b"Test file content\nLine 2\nLine 3" in body
+        metadata = json.dumps(
+            {"fileName": os.path.basename(temp_file), "description": {"raw": "Log"}}
+        )
+        assert metadata.encode() in body
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_attach_file_resends_body_on_retry(self, server, base_url, temp_file):
+        """A retried upload sends the complete file again."""
+        route = respx.post(f"{base_url}/work_packages/456/attachments").mock(
+            side_effect=[
+                httpx.Response(503, headers={"Retry-After": "0"}),
+                httpx.Response(201, json={"id": 126}),
+            ]
+        )
+
+        await server.call_tool(
+            "attach_file_to_wp",
+            {"params": {"wp_id": 456, "file_path": temp_file}},
+        )
+
+        assert route.call_count == 2
+        first, second = (call.request.content for call in route.calls)
+        assert first == second
+        assert b"Test file content" in second
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_attach_file_skips_identical_existing(
+        self, server, base_url, temp_file
+    ):
+        """skip_if_exists returns the matching attachment without uploading."""
+        import hashlib
+        import json
+
+        with open(temp_file, "rb") as f:
+            data = f.read()
+        existing = {
+            "id": 77,
+            "fileName": "older-name.txt",
+            "fileSize": len(data),
+            "digest": {"algorithm": "md5", "hash": hashlib.md5(data).hexdigest()},
+        }
+        other = {
+            "id": 78,
+            "fileSize": len(data),
+            "digest": {"algorithm": "md5", "hash": "0" * 32},
+        }
+        respx.get(f"{base_url}/work_packages/456/attachments").mock(
+            return_value=httpx.Response(
+                200, json={"total": 2, "_embedded": {"elements": [other, existing]}}
+            )
+        )
+        upload_route = respx.post(f"{base_url}/work_packages/456/attachments")
+
+        result = await server.call_tool(
+            "attach_file_to_wp",
+            {"params": {"wp_id": 456, "file_path": temp_file, "skip_if_exists": True}},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert not upload_route.called
+        assert response_data["id"] == 77
+        assert response_data["deduplicated"] is True
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_attach_file_uploads_when_no_identical_existing(
+        self, server, base_url, temp_file
+    ):
+        """Attachments of another size are not even hashed against."""
+        import json
+
+        respx.get(f"{base_url}/work_packages/456/attachments").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 77,
+                                "fileSize": 1,
+                                "digest": {"algorithm": "md5", "hash": "0" * 32},
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+        upload_route = respx.post(f"{base_url}/work_packages/456/attachments").mock(
+            return_value=httpx.Response(201, json={"id": 79})
+        )
+
+        result = await server.call_tool(
+            "attach_file_to_wp",
+            {"params": {"wp_id": 456, "file_path": temp_file, "skip_if_exists": True}},
+        )
+
+        assert upload_route.called
+        assert json.loads(result[0].text) == {"id": 79}
+
+
+# ============================================================================
+# Test: attach_files_to_wp
+# ============================================================================
+
+
+class TestAttachFilesToWp:
+    """Test suite for the bulk attach_files_to_wp tool."""
+
+    @pytest.fixture
+    def report_dir(self, tmp_path):
+        for name in ("a.xml", "b.xml", "c.xml", "notes.txt"):
+            (tmp_path / name).write_text(f"contents of {name}")
+        return tmp_path
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_uploads_glob_concurrently(self, server, base_url, report_dir):
+        """Every file matching the glob is uploaded, several at a time."""
+        import asyncio
+        import json
+
+        in_flight = 0
+        peak = 0
+        next_id = iter(range(100, 200))
+
+        async def upload(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return httpx.Response(201, json={"id": next(next_id)})
+
+        route = respx.post(f"{base_url}/work_packages/456/attachments").mock(
+            side_effect=upload
+        )
+
+        result = await server.call_tool(
+            "attach_files_to_wp",
+            {"params": {"wp_id": 456, "glob": str(report_dir / "*.xml")}},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert route.call_count == 3
+        assert peak == 3
+        assert [os.path.basename(r["file_path"]) for r in response_data["results"]] == [
+            "a.xml",
+            "b.xml",
+            "c.xml",
+        ]
+        assert {r["status"] for r in response_data["results"]} == {"uploaded"}
+        assert response_data["uploaded"] == 3
+        assert response_data["bytes_uploaded"] == sum(
+            os.path.getsize(report_dir / n) for n in ("a.xml", "b.xml", "c.xml")
+        )
+        assert response_data["throughput_bytes_per_second"] > 0
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_failures_do_not_abort_batch(self, server, base_url, report_dir):
+        """Missing files and rejected uploads are reported per file."""
+        import json
+
+        def upload(request):
+            if b"b.xml" in request.content:
+                return httpx.Response(422, json={"message": "Too large"})
+            return httpx.Response(201, json={"id": 1})
+
+        respx.post(f"{base_url}/work_packages/456/attachments").mock(side_effect=upload)
+        paths = [
+            str(report_dir / "a.xml"),
+            str(report_dir / "missing.xml"),
+            str(report_dir / "b.xml"),
+        ]
+
+        result = await server.call_tool(
+            "attach_files_to_wp",
+            {"params": {"wp_id": 456, "file_paths": paths, "concurrency": 1}},
+        )
+
+        response_data = json.loads(result[0].text)
+        statuses = [r["status"] for r in response_data["results"]]
+        assert statuses == ["uploaded", "failed", "failed"]
+        assert "File not found" in response_data["results"][1]["error"]
+        assert "Validation failed" in response_data["results"][2]["error"]
+        assert response_data["failed"] == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_skip_if_exists_lists_attachments_once(
+        self, server, base_url, report_dir
+    ):
+        """Deduplication shares one listing of the existing attachments."""
+        import hashlib
+        import json
+
+        data = (report_dir / "a.xml").read_bytes()
+        list_route = respx.get(f"{base_url}/work_packages/456/attachments").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 9,
+                                "fileSize": len(data),
+                                "digest": {
+                                    "algorithm": "md5",
+                                    "hash": hashlib.md5(data).hexdigest(),
+                                },
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+        upload_route = respx.post(f"{base_url}/work_packages/456/attachments").mock(
+            return_value=httpx.Response(201, json={"id": 10})
+        )
+
+        result = await server.call_tool(
+            "attach_files_to_wp",
+            {
+                "params": {
+                    "wp_id": 456,
+                    "file_paths": [
+                        str(report_dir / "a.xml"),
+                        str(report_dir / "notes.txt"),
+                    ],
+                    "skip_if_exists": True,
+                }
+            },
+        )
+
+        response_data = json.loads(result[0].text)
+        assert list_route.call_count == 1
+        assert upload_route.call_count == 1
+        assert [r["status"] for r in response_data["results"]] == [
+            "deduplicated",
+            "uploaded",
+        ]
+        assert response_data["results"][0]["attachment"]["id"] == 9
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_attach(self, server, report_dir):
+        """An empty selection is an error, not an empty success."""
+        import json
+
+        result = await server.call_tool(
+            "attach_files_to_wp",
+            {"params": {"wp_id": 456, "glob": str(report_dir / "*.pdf")}},
+        )
+
+        assert "No files to attach" in json.loads(result[0].text)["error"]
+
+
+class TestListAttachmentsPagination:
+    """Test cursor paging of the (unpaginated) attachments endpoint."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_attachments_paged_locally(self, server, base_url):
+        """Attachments are returned page by page with a next_cursor."""
+        import json
+
+        respx.get(f"{base_url}/work_packages/123/attachments").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "_type": "Collection",
+                    "total": 5,
+                    "count": 5,
+                    "_embedded": {"elements": [{"id": i} for i in range(1, 6)]},
+                },
+            )
+        )
+
+        first = json.loads(
+            (
+                await server.call_tool(
+                    "list_attachments", {"params": {"wp_id": 123, "page_size": 2}}
+                )
+            )[0].text
+        )
+        assert [a["id"] for a in first["items"]] == [1, 2]
+        assert first["total"] == 5
+
+        cursor = first["next_cursor"]
+        ids = []
+        while cursor:
+            page = json.loads(
+                (
+                    await server.call_tool(
+                        "list_attachments", {"params": {"wp_id": 123, "cursor": cursor}}
+                    )
+                )[0].text
+            )
+            ids.extend(a["id"] for a in page["items"])
+            cursor = page["next_cursor"]
+
+        assert ids == [3, 4, 5]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_attachments_selects_fields(self, server, base_url):
+        """The default field set is selected unless fields asks otherwise."""
+        route = respx.get(f"{base_url}/work_packages/123/attachments").mock(
+            return_value=httpx.Response(
+                200, json={"total": 0, "_embedded": {"elements": []}}
+            )
+        )
+
+        await server.call_tool("list_attachments", {"params": {"wp_id": 123}})
+        await server.call_tool(
+            "list_attachments", {"params": {"wp_id": 123, "fields": ["fileName"]}}
+        )
+        await server.call_tool(
+            "list_attachments", {"params": {"wp_id": 123, "fields": ["*"]}}
+        )
+
+        default, narrow, full = [c.request.url.params for c in route.calls]
+        assert "elements/digest" in default["select"]
+        assert narrow["select"] == (
+            "total,count,pageSize,offset,elements/id,elements/fileName"
+        )
+        assert "select" not in full
+
 
 # ============================================================================
 # Test: download_attachment
@@ -343,6 +695,130 @@ class TestDownloadAttachment:
         assert route.called
         assert "Resource not found" in str(exc_info.value)
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_download_attachment_verifies_digest(
+        self, server, base_url, tmp_path
+    ):
+        """The digest from the metadata is checked while streaming to disk."""
+        import hashlib
+        import json
+
+        file_content = b"Test file content"
+        respx.get(f"{base_url}/attachments/123").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": 123,
+                    "fileName": "test.txt",
+                    "digest": {
+                        "algorithm": "md5",
+                        "hash": hashlib.md5(file_content).hexdigest(),
+                    },
+                    "_links": {
+                        "downloadLocation": {"href": "/attachments/123/content"}
+                    },
+                },
+            )
+        )
+        respx.get(f"{base_url}/attachments/123/content").mock(
+            return_value=httpx.Response(200, content=file_content)
+        )
+        save_path = str(tmp_path / "test.txt")
+
+        result = await server.call_tool(
+            "download_attachment",
+            {"params": {"attachment_id": 123, "save_path": save_path}},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["digest_verified"] is True
+        assert response_data["resumed_from"] == 0
+        assert response_data["fileSize"] == len(file_content)
+        assert not os.path.exists(save_path + ".part")
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_download_attachment_too_large_for_inline(
+        self, server, base_url, mock_settings
+    ):
+        """Large attachments must be saved to disk instead of returned inline."""
+        import json
+
+        respx.get(f"{base_url}/attachments/123").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": 123,
+                    "fileSize": mock_settings.download_inline_max_bytes + 1,
+                    "_links": {
+                        "downloadLocation": {"href": "/attachments/123/content"}
+                    },
+                },
+            )
+        )
+        download_route = respx.get(f"{base_url}/attachments/123/content")
+
+        result = await server.call_tool(
+            "download_attachment", {"params": {"attachment_id": 123}}
+        )
+
+        response_data = json.loads(result[0].text)
+        assert "save_path" in response_data["error"]
+        assert not download_route.called
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_download_attachment_parallel_ranges(
+        self, mock_settings, base_url, tmp_path
+    ):
+        """Large attachments are fetched as concurrent ranges with timings."""
+        import json
+
+        settings = mock_settings.model_copy(
+            update={
+                "parallel_download_threshold": 1000,
+                "parallel_download_segments": 2,
+            }
+        )
+        server = FastMCP("test-openproject")
+        attachments.register(server, settings)
+        file_content = bytes(range(256)) * 8
+
+        def ranged(request):
+            start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+            return httpx.Response(206, content=file_content[int(start) : int(end) + 1])
+
+        respx.get(f"{base_url}/attachments/123").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": 123,
+                    "fileSize": len(file_content),
+                    "_links": {
+                        "downloadLocation": {"href": "/attachments/123/content"}
+                    },
+                },
+            )
+        )
+        route = respx.get(f"{base_url}/attachments/123/content").mock(
+            side_effect=ranged
+        )
+        save_path = str(tmp_path / "dump.bin")
+
+        result = await server.call_tool(
+            "download_attachment",
+            {"params": {"attachment_id": 123, "save_path": save_path}},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert route.call_count == 2
+        assert response_data["mode"] == "parallel"
+        assert len(response_data["segments"]) == 2
+        assert response_data["throughput_bytes_per_second"] > 0
+        with open(save_path, "rb") as f:
+            assert f.read() == file_content
+
 
 # ============================================================================
 # Test: get_attachment_content
@@ -457,3 +933,141 @@ class TestGetAttachmentContent:
         assert download_route.called
         response_data = json.loads(result[0].text)
         assert response_data["bytes_retrieved"] == len(file_content)
+        assert response_data["range_requested"] is False
+        assert "Range" not in download_route.calls.last.request.headers
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_attachment_content_range_honored(self, server, base_url):
+        """A 206 response is reported as an honored range."""
+        import json
+
+        respx.get(f"{base_url}/attachments/123").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": 123,
+                    "fileSize": 5000,
+                    "_links": {
+                        "downloadLocation": {"href": "/attachments/123/content"}
+                    },
+                },
+            )
+        )
+        download_route = respx.get(f"{base_url}/attachments/123/content").mock(
+            return_value=httpx.Response(
+                206, content=b"B" * 100, headers={"Content-Range": "bytes 0-99/5000"}
+            )
+        )
+
+        result = await server.call_tool(
+            "get_attachment_content",
+            {"params": {"attachment_id": 123, "max_bytes": 100}},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert download_route.calls.last.request.headers["Range"] == "bytes=0-99"
+        assert response_data["range_honored"] is True
+        assert response_data["truncated"] is True
+        assert response_data["bytes_retrieved"] == 100
+
+
+# ============================================================================
+# Test: local attachment cache
+# ============================================================================
+
+
+class TestAttachmentCaching:
+    """Attachment bytes and metadata are reused across tool calls."""
+
+    @pytest.fixture
+    def routes(self, base_url):
+        import hashlib
+
+        content = b"log line\n" * 50
+        metadata = {
+            "id": 123,
+            "fileName": "app.log",
+            "fileSize": len(content),
+            "digest": {"algorithm": "md5", "hash": hashlib.md5(content).hexdigest()},
+            "_links": {"downloadLocation": {"href": "/attachments/123/content"}},
+        }
+        return (
+            content,
+            respx.get(f"{base_url}/attachments/123").mock(
+                return_value=httpx.Response(200, json=metadata)
+            ),
+            respx.get(f"{base_url}/attachments/123/content").mock(
+                return_value=httpx.Response(200, content=content)
+            ),
+        )
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_repeated_preview_costs_no_requests(self, server, routes):
+        """The second preview is served from memory and the content store."""
+        import json
+
+        content, metadata_route, content_route = routes
+
+        first = json.loads(
+            (
+                await server.call_tool(
+                    "get_attachment_content", {"params": {"attachment_id": 123}}
+                )
+            )[0].text
+        )
+        second = json.loads(
+            (
+                await server.call_tool(
+                    "get_attachment_content",
+                    {"params": {"attachment_id": 123, "max_bytes": 100}},
+                )
+            )[0].text
+        )
+
+        assert metadata_route.call_count == 1
+        assert content_route.call_count == 1
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["range_honored"] is None
+        assert second["truncated"] is True
+        assert base64.b64decode(second["content_base64"]) == content[:100]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_download_fills_cache_for_later_calls(self, server, routes, tmp_path):
+        """A verified download is reused by both attachment tools."""
+        import json
+
+        content, _, content_route = routes
+        first_path = str(tmp_path / "first.log")
+        second_path = str(tmp_path / "second.log")
+
+        await server.call_tool(
+            "download_attachment",
+            {"params": {"attachment_id": 123, "save_path": first_path}},
+        )
+        saved = json.loads(
+            (
+                await server.call_tool(
+                    "download_attachment",
+                    {"params": {"attachment_id": 123, "save_path": second_path}},
+                )
+            )[0].text
+        )
+        inline = json.loads(
+            (
+                await server.call_tool(
+                    "download_attachment", {"params": {"attachment_id": 123}}
+                )
+            )[0].text
+        )
+
+        assert content_route.call_count == 1
+        assert saved["mode"] == "cache"
+        assert saved["network_bytes"] == 0
+        with open(second_path, "rb") as f:
+            assert f.read() == content
+        assert inline["cached"] is True
+        assert base64.b64decode(inline["content_base64"]) == content
@@ -0,0 +1,54 @@
+"""Unit tests for the shared bulk tool scaffolding."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from openproject_mcp.utils.bulk import bulk_semaphore, error_message, run_bounded
+
+
+def status_error(code: int, text: str) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://test.openproject.com/api/v3/x")
+    response = httpx.Response(code, text=text, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestErrorMessage:
+    """Test how per-item errors are reported"""
+
+    def test_http_error_is_truncated(self):
+        assert error_message(status_error(422, "x" * 400)) == "HTTP 422: " + "x" * 300
+
+    def test_other_error(self):
+        assert error_message(ValueError("bad")) == "bad"
+        assert error_message(TimeoutError()) == "TimeoutError"
+
+
+class TestRunBounded:
+    """Test bounded concurrency and per-item failure isolation"""
+
+    def test_semaphore_capped_at_maximum(self):
+        assert bulk_semaphore(50, 4)._value == 4
+        assert bulk_semaphore(None, 4)._value == 4
+        assert bulk_semaphore(2, 4)._value == 2
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_and_failures_isolated(self):
+        active = peak = 0
+
+        async def action(n: int) -> dict:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01 * (5 - n))
+            active -= 1
+            if n == 2:
+                raise status_error(500, "boom")
+            return {"status": "ok", "n": n}
+
+        results = await run_bounded(range(5), action, asyncio.Semaphore(2))
+
+        assert peak == 2
+        assert [r.get("n") for r in results] == [0, 1, None, 3, 4]
+        assert results[2] == {"status": "failed", "error": "HTTP 500: boom"}
@@ -0,0 +1,419 @@
+"""
+Unit tests for OpenProjectClient.
+
+Covers connection pooling and request handling shared by all tool modules.
+Uses respx for HTTP mocking to avoid real API calls.
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+import respx
+import httpx
+
+from openproject_mcp.client import OpenProjectClient
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest_asyncio.fixture
+async def client(mock_settings):
+    """OpenProjectClient closed after each test."""
+    c = OpenProjectClient(mock_settings)
+    yield c
+    await c.aclose()
+
+
+@pytest.fixture
+def base_url(mock_settings):
+    """Base URL for API endpoints."""
+    return str(mock_settings.url).rstrip("/") + "/api/v3"
+
+
+# ============================================================================
+# Test: connection pooling
+# ============================================================================
+
+
+class TestConnectionPool:
+    """Test suite for the shared, long-lived HTTP client."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_requests_reuse_pooled_client(self, client, base_url):
+        """Consecutive requests go through the same httpx.AsyncClient."""
+        respx.get(f"{base_url}/users/1").mock(
+            return_value=httpx.Response(200, json={"id": 1})
+        )
+
+        first = client.open()
+        await client.get("/users/1")
+        await client.get("/users/1")
+
+        assert client.open() is first
+        assert not first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_pool_limits_from_settings(self, mock_settings):
+        """Pool limits are taken from Settings."""
+        mock_settings.pool_max_connections = 7
+        mock_settings.pool_max_keepalive = 3
+        client = OpenProjectClient(mock_settings)
+        try:
+            pool = client.open()._transport._pool
+            assert pool._max_connections == 7
+            assert pool._max_keepalive_connections == 3
+        finally:
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_pool(self, client):
+        """aclose() closes the pool and the next use reopens it."""
+        first = client.open()
+        await client.aclose()
+
+        assert first.is_closed
+        assert client.open() is not first
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self, mock_settings):
+        """The client can be used as an async context manager."""
+        async with OpenProjectClient(mock_settings) as client:
+            http = client.open()
+            assert not http.is_closed
+        assert http.is_closed
+
+
+# ============================================================================
+# Test: HTTP/2 mode
+# ============================================================================
+
+
+class TestHttp2:
+    """Test suite for the opt-in HTTP/2 transport."""
+
+    @pytest.mark.asyncio
+    async def test_http2_disabled_by_default(self, client):
+        """HTTP/1.1 is used unless http2 is enabled."""
+        assert client._use_http2() is False
+
+    @pytest.mark.asyncio
+    async def test_http2_enabled_when_h2_installed(self, mock_settings, monkeypatch):
+        """http2=True negotiates h2 when the h2 package is available."""
+        monkeypatch.setattr("openproject_mcp.client._http2_available", lambda: True)
+        mock_settings.http2 = True
+
+        assert OpenProjectClient(mock_settings)._use_http2() is True
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(
+        self, mock_settings, monkeypatch, caplog
+    ):
+        """Without the h2 package the client warns and stays on HTTP/1.1."""
+        monkeypatch.setattr("openproject_mcp.client._http2_available", lambda: False)
+        mock_settings.http2 = True
+        client = OpenProjectClient(mock_settings)
+
+        try:
+            with caplog.at_level("WARNING", logger="openproject_mcp.client"):
+                client.open()
+            assert client._use_http2() is False
+            assert "h2" in caplog.text
+        finally:
+            await client.aclose()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_protocol_logged_at_debug(self, client, base_url, caplog):
+        """The negotiated protocol version is visible in debug logs."""
+        respx.get(f"{base_url}/users/1").mock(
+            return_value=httpx.Response(200, json={"id": 1})
+        )
+
+        with caplog.at_level("DEBUG", logger="openproject_mcp.client"):
+            await client.get("/users/1")
+
+        assert "GET /users/1 -> 200 (HTTP/1.1)" in caplog.text
+
+
+# ============================================================================
+# Test: rate limiting and Retry-After
+# ============================================================================
+
+
+class TestRateLimiting:
+    """Test suite for Retry-After handling in _request."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_429_honors_retry_after(self, client, base_url):
+        """A 429 with Retry-After pauses for that long, then retries."""
+        route = respx.get(f"{base_url}/statuses").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0.3"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+
+        start = time.monotonic()
+        res = await client.get("/statuses")
+
+        assert res.status_code == 200
+        assert route.call_count == 2
+        assert time.monotonic() - start >= 0.28
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_requests_not_metered_without_throttling(self, client, base_url):
+        """Until the server throttles, the limiter adds no delay."""
+        respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+        count = int(client.limiter.max_rate) + client.limiter.burst + 10
+
+        start = time.monotonic()
+        await asyncio.gather(*(client.get("/statuses") for _ in range(count)))
+
+        assert time.monotonic() - start < 0.5
+        assert client.limiter.throttled is False
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_429_reduces_client_rate(self, client, base_url):
+        """A 429 lowers the shared limiter's rate for all later requests."""
+        respx.get(f"{base_url}/statuses").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        initial = client.limiter.rate
+
+        await client.get("/statuses")
+
+        assert client.limiter.rate < initial
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_503_retry_after_used_instead_of_backoff(
+        self, client, base_url, monkeypatch
+    ):
+        """Retry-After on a 5xx replaces the fixed backoff delay."""
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+            await real_sleep(0)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        respx.get(f"{base_url}/statuses").mock(
+            side_effect=[
+                httpx.Response(503, headers={"Retry-After": "7"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+
+        await client.get("/statuses")
+
+        assert delays == [7.0]
+
+
+# ============================================================================
+# Test: single-flight GET coalescing
+# ============================================================================
+
+
+class TestGetCoalescing:
+    """Test suite for collapsing identical concurrent GETs."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_request(self, client, base_url):
+        """Concurrent GETs for the same URL hit the server once."""
+
+        async def slow(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"_embedded": {"elements": []}})
+
+        route = respx.get(f"{base_url}/statuses").mock(side_effect=slow)
+
+        results = await asyncio.gather(*(client.get("/statuses") for _ in range(4)))
+
+        assert route.call_count == 1
+        assert all(r.json() == {"_embedded": {"elements": []}} for r in results)
+        assert client.singleflight.stats()["coalesced"] == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_param_order_does_not_matter(self, client, base_url):
+        """Params given in a different order are the same request."""
+
+        async def slow(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={})
+
+        route = respx.get(f"{base_url}/projects").mock(side_effect=slow)
+
+        await asyncio.gather(
+            client.get("/projects", params={"pageSize": 10, "offset": 1}),
+            client.get("/projects", params={"offset": 1, "pageSize": 10}),
+        )
+
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_different_headers_not_coalesced(self, client, base_url):
+        """A Range request is not merged with a full download."""
+
+        async def slow(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, content=b"data")
+
+        route = respx.get(f"{base_url}/attachments/1/content").mock(side_effect=slow)
+
+        await asyncio.gather(
+            client.get("/attachments/1/content"),
+            client.get("/attachments/1/content", headers={"Range": "bytes=0-9"}),
+        )
+
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self, mock_settings, base_url):
+        """coalesce_gets=False sends every GET upstream."""
+        mock_settings.coalesce_gets = False
+        client = OpenProjectClient(mock_settings)
+
+        async def slow(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={})
+
+        route = respx.get(f"{base_url}/statuses").mock(side_effect=slow)
+        try:
+            await asyncio.gather(client.get("/statuses"), client.get("/statuses"))
+        finally:
+            await client.aclose()
+
+        assert route.call_count == 2
+
+
+# ============================================================================
+# Test: iter_collection
+# ============================================================================
+
+
+def _collection_page(request, total=5, ids=None):
+    offset = int(request.url.params["offset"])
+    size = int(request.url.params["pageSize"])
+    ids = ids or list(range(1, total + 1))
+    chunk = ids[(offset - 1) * size : offset * size]
+    return httpx.Response(
+        200,
+        json={
+            "total": total,
+            "pageSize": size,
+            "offset": offset,
+            "_embedded": {"elements": [{"id": i} for i in chunk]},
+        },
+    )
+
+
+class TestIterCollection:
+    """Test suite for lazily iterating paginated collections."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_yields_all_elements_across_pages(self, client, base_url):
+        """Every element of every page is yielded in order."""
+        route = respx.get(f"{base_url}/time_entries").mock(side_effect=_collection_page)
+
+        ids = [
+            e["id"] async for e in client.iter_collection("/time_entries", page_size=2)
+        ]
+
+        assert ids == [1, 2, 3, 4, 5]
+        assert route.call_count == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_max_items_stops_fetching(self, client, base_url):
+        """No page beyond the one containing the max_items-th element is read."""
+        route = respx.get(f"{base_url}/time_entries").mock(side_effect=_collection_page)
+
+        ids = [
+            e["id"]
+            async for e in client.iter_collection(
+                "/time_entries", page_size=2, max_items=3
+            )
+        ]
+
+        assert ids == [1, 2, 3]
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page(self, client, base_url):
+        """The next page is requested before the current one is consumed."""
+        route = respx.get(f"{base_url}/time_entries").mock(side_effect=_collection_page)
+
+        iterator = client.iter_collection("/time_entries", page_size=2)
+        await iterator.__anext__()
+        for _ in range(50):
+            if route.call_count == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert route.call_count == 2
+        await iterator.aclose()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_without_prefetch_fetches_on_demand(self, client, base_url):
+        """prefetch=False only requests a page once the previous one is used up."""
+        route = respx.get(f"{base_url}/time_entries").mock(side_effect=_collection_page)
+
+        iterator = client.iter_collection("/time_entries", page_size=2, prefetch=False)
+        await iterator.__anext__()
+        await asyncio.sleep(0.05)
+
+        assert route.call_count == 1
+        await iterator.aclose()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_select_projection(self, client, base_url):
+        """Field lists are translated to OpenProject select syntax."""
+        route = respx.get(f"{base_url}/time_entries").mock(side_effect=_collection_page)
+
+        async for _ in client.iter_collection(
+            "/time_entries", params={"filters": "[]"}, select=["id", "hours"]
+        ):
+            pass
+
+        request = route.calls[0].request
+        assert request.url.params["select"] == (
+            "total,pageSize,elements/id,elements/hours"
+        )
+        assert request.url.params["filters"] == "[]"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_collection_without_total(self, client, base_url):
+        """Without a total, a short page marks the end."""
+        route = respx.get(f"{base_url}/queries").mock(
+            return_value=httpx.Response(
+                200, json={"_embedded": {"elements": [{"id": 1}, {"id": 2}]}}
+            )
+        )
+
+        ids = [e["id"] async for e in client.iter_collection("/queries", page_size=5)]
+
+        assert ids == [1, 2]
+        assert route.call_count == 1
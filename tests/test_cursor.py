@@ -1,5 +1,11 @@
 import pytest
-from openproject_mcp.utils.cursor import encode_cursor, decode_cursor, clamp_page_size
+from openproject_mcp.utils.cursor import (
+    encode_cursor,
+    decode_cursor,
+    clamp_page_size,
+    page_from_collection,
+    start_page,
+)
 
 
 class TestCursorEncoding:
@@ -129,3 +135,61 @@ class TestPaginationHelper:
 
         assert actual_size == max_size
         assert len(mock_items[0:actual_size]) == max_size
+
+
+class TestCollectionPaging:
+    """Test start_page / page_from_collection used by list tools"""
+
+    def test_start_page_defaults(self):
+        assert start_page(None, None, 25, 200) == (1, 25, 0)
+        assert start_page(None, 500, 25, 200) == (1, 200, 0)
+
+    def test_start_page_from_cursor(self):
+        cursor = encode_cursor({"offset": 3, "page_size": 10, "skip": 4})
+        # The cursor's page size wins so offsets stay aligned
+        assert start_page(cursor, 50, 25, 200) == (3, 10, 4)
+
+    def test_start_page_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            start_page("garbage", None, 25, 200)
+        with pytest.raises(ValueError):
+            start_page(encode_cursor({"page_size": 10}), None, 25, 200)
+
+    def test_server_paginated_collection(self):
+        collection = {
+            "total": 45,
+            "pageSize": 20,
+            "offset": 2,
+            "_embedded": {"elements": [{"id": i} for i in range(20)]},
+        }
+        out = page_from_collection(collection, 2, 20)
+        assert len(out["items"]) == 20
+        assert out["total"] == 45
+        assert decode_cursor(out["next_cursor"]) == {"offset": 3, "page_size": 20}
+
+    def test_server_clamped_page_size_is_used(self):
+        collection = {
+            "total": 300,
+            "pageSize": 100,
+            "offset": 1,
+            "_embedded": {"elements": [{"id": i} for i in range(100)]},
+        }
+        out = page_from_collection(collection, 1, 200)
+        assert decode_cursor(out["next_cursor"])["page_size"] == 100
+
+    def test_unpaginated_collection_sliced_locally(self):
+        collection = {"_embedded": {"elements": [{"id": i} for i in range(7)]}}
+        out = page_from_collection(collection, 3, 3)
+        assert out["items"] == [{"id": 6}]
+        assert out["total"] == 7
+        assert out["next_cursor"] is None
+
+    def test_skip_drops_already_returned_items(self):
+        collection = {
+            "total": 4,
+            "pageSize": 4,
+            "offset": 1,
+            "_embedded": {"elements": [{"id": i} for i in range(4)]},
+        }
+        out = page_from_collection(collection, 1, 4, skip=3)
+        assert out["items"] == [{"id": 3}]
@@ -0,0 +1,465 @@
+"""Unit tests for streamed attachment downloads."""
+
+import asyncio
+import hashlib
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+from openproject_mcp.client import OpenProjectClient
+from openproject_mcp.utils.download import (
+    DigestMismatch,
+    DownloadIncomplete,
+    DownloadTooLarge,
+    download_prefix,
+    download_segmented,
+    download_to_file,
+    download_to_memory,
+)
+
+DATA = bytes(range(256)) * 64
+DIGEST = {"algorithm": "md5", "hash": hashlib.md5(DATA).hexdigest()}
+
+
+@pytest_asyncio.fixture
+async def client(mock_settings):
+    """OpenProjectClient closed after each test."""
+    c = OpenProjectClient(mock_settings)
+    yield c
+    await c.aclose()
+
+
+@pytest.fixture
+def base_url(mock_settings):
+    """Base URL for API endpoints."""
+    return str(mock_settings.url).rstrip("/") + "/api/v3"
+
+
+@pytest.fixture
+def save_path(tmp_path):
+    return str(tmp_path / "dump.bin")
+
+
+class BrokenStream(httpx.AsyncByteStream):
+    """Body that drops the connection after `cut` bytes."""
+
+    def __init__(self, data: bytes, cut: int):
+        self.data = data
+        self.cut = cut
+
+    async def __aiter__(self):
+        yield self.data[: self.cut]
+        raise httpx.ReadError("connection reset")
+
+
+def ranged(request):
+    """Serve DATA, honouring a single "bytes=start-[end]" Range header."""
+    header = request.headers.get("Range")
+    if not header:
+        return httpx.Response(200, content=DATA)
+    start, _, end = header.removeprefix("bytes=").partition("-")
+    start, end = int(start), int(end) if end else len(DATA) - 1
+    return httpx.Response(
+        206,
+        content=DATA[start : end + 1],
+        headers={"Content-Range": f"bytes {start}-{end}/{len(DATA)}"},
+    )
+
+
+def write_part(save_path, data: bytes, validator: str | None = None):
+    with open(save_path + ".part", "wb") as f:
+        f.write(data)
+    if validator:
+        with open(save_path + ".part.validator", "w") as f:
+            f.write(validator)
+
+
+class TestDownloadToFile:
+    """Test temp file + rename, resume and digest verification"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_writes_file_and_verifies_digest(self, client, base_url, save_path):
+        respx.get(f"{base_url}/attachments/1/content").mock(side_effect=ranged)
+
+        result = await download_to_file(
+            client, "/attachments/1/content", save_path, digest=DIGEST
+        )
+
+        assert result == {
+            "bytes": len(DATA),
+            "resumed_from": 0,
+            "digest_verified": True,
+            "mode": "single",
+        }
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+        assert not os.path.exists(save_path + ".part")
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resumes_from_part_file(self, client, base_url, save_path):
+        with open(save_path + ".part", "wb") as f:
+            f.write(DATA[:1000])
+        route = respx.get(f"{base_url}/attachments/1/content").mock(side_effect=ranged)
+
+        result = await download_to_file(
+            client, "/attachments/1/content", save_path, digest=DIGEST
+        )
+
+        assert route.calls.last.request.headers["Range"] == "bytes=1000-"
+        assert result["resumed_from"] == 1000
+        assert result["digest_verified"] is True
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_range_ignored_restarts(self, client, base_url, save_path):
+        with open(save_path + ".part", "wb") as f:
+            f.write(b"stale bytes")
+        respx.get(f"{base_url}/attachments/1/content").mock(
+            return_value=httpx.Response(200, content=DATA)
+        )
+
+        result = await download_to_file(
+            client, "/attachments/1/content", save_path, digest=DIGEST
+        )
+
+        assert result["resumed_from"] == 0
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resumes_after_dropped_connection(self, client, base_url, save_path):
+        def flaky(request):
+            if "Range" not in request.headers:
+                return httpx.Response(200, stream=BrokenStream(DATA, 4000))
+            return ranged(request)
+
+        route = respx.get(f"{base_url}/attachments/1/content").mock(side_effect=flaky)
+
+        result = await download_to_file(
+            client, "/attachments/1/content", save_path, digest=DIGEST
+        )
+
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["Range"] == "bytes=4000-"
+        assert result["digest_verified"] is True
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_digest_mismatch_discards_download(self, client, base_url, save_path):
+        respx.get(f"{base_url}/attachments/1/content").mock(
+            return_value=httpx.Response(200, content=b"tampered")
+        )
+
+        with pytest.raises(DigestMismatch):
+            await download_to_file(
+                client, "/attachments/1/content", save_path, digest=DIGEST
+            )
+
+        assert not os.path.exists(save_path)
+        assert not os.path.exists(save_path + ".part")
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_unknown_algorithm_is_not_verified(self, client, base_url, save_path):
+        respx.get(f"{base_url}/attachments/1/content").mock(side_effect=ranged)
+
+        result = await download_to_file(
+            client,
+            "/attachments/1/content",
+            save_path,
+            digest={"algorithm": "crc-unknown", "hash": "abc"},
+        )
+
+        assert result["digest_verified"] is None
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_unverifiable_stale_part_is_not_merged(
+        self, client, base_url, save_path
+    ):
+        # Neither a validator nor a digest vouches for the leftover part
+        write_part(save_path, b"OLDOLDOLD")
+        route = respx.get(f"{base_url}/attachments/1/content").mock(side_effect=ranged)
+
+        result = await download_to_file(
+            client, "/attachments/1/content", save_path, size=len(DATA)
+        )
+
+        assert "Range" not in route.calls.last.request.headers
+        assert result["resumed_from"] == 0
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_sends_if_range_and_restarts_when_changed(
+        self, client, base_url, save_path
+    ):
+        write_part(save_path, b"OLDOLDOLD", validator='"v1"')
+
+        def versioned(request):
+            if request.headers.get("If-Range") == '"v1"':
+                # Changed since: If-Range makes the server send everything
+                return httpx.Response(200, content=DATA, headers={"ETag": '"v2"'})
+            return ranged(request)
+
+        route = respx.get(f"{base_url}/attachments/1/content").mock(
+            side_effect=versioned
+        )
+
+        result = await download_to_file(
+            client, "/attachments/1/content", save_path, size=len(DATA)
+        )
+
+        assert route.calls.last.request.headers["Range"] == "bytes=9-"
+        assert result["resumed_from"] == 0
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+        assert not os.path.exists(save_path + ".part.validator")
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_range_for_another_size_restarts(self, client, base_url, save_path):
+        write_part(save_path, DATA[:1000], validator='"v1"')
+
+        def resized(request):
+            if "Range" not in request.headers:
+                return httpx.Response(200, content=DATA)
+            return httpx.Response(
+                206,
+                content=DATA[1000:],
+                headers={"Content-Range": f"bytes 1000-{len(DATA) - 1}/99999"},
+            )
+
+        route = respx.get(f"{base_url}/attachments/1/content").mock(side_effect=resized)
+
+        result = await download_to_file(
+            client, "/attachments/1/content", save_path, size=len(DATA)
+        )
+
+        # 206 reports a different total, so the part is dropped
+        assert route.call_count == 2
+        assert "Range" not in route.calls.last.request.headers
+        assert result["resumed_from"] == 0
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_wrong_final_size_is_not_renamed(self, client, base_url, save_path):
+        respx.get(f"{base_url}/attachments/1/content").mock(
+            return_value=httpx.Response(200, content=DATA[:100])
+        )
+
+        with pytest.raises(DownloadIncomplete):
+            await download_to_file(
+                client, "/attachments/1/content", save_path, size=len(DATA)
+            )
+
+        assert not os.path.exists(save_path)
+        assert not os.path.exists(save_path + ".part")
+
+
+class TestDownloadToMemory:
+    """Test the bounded in-memory download"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_returns_content(self, client, base_url):
+        respx.get(f"{base_url}/attachments/1/content").mock(side_effect=ranged)
+
+        content = await download_to_memory(
+            client, "/attachments/1/content", len(DATA), digest=DIGEST
+        )
+
+        assert content == DATA
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_refuses_oversized_body(self, client, base_url):
+        respx.get(f"{base_url}/attachments/1/content").mock(side_effect=ranged)
+
+        with pytest.raises(DownloadTooLarge):
+            await download_to_memory(client, "/attachments/1/content", 100)
+
+
+class CountingStream(httpx.AsyncByteStream):
+    """Body of `chunks` x `size` bytes that records how much was pulled."""
+
+    def __init__(self, chunks: int, size: int):
+        self.chunks = chunks
+        self.size = size
+        self.sent = 0
+
+    async def __aiter__(self):
+        for _ in range(self.chunks):
+            self.sent += self.size
+            yield b"x" * self.size
+
+
+class TestDownloadPrefix:
+    """Test the early-terminating preview read"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_stops_reading_when_range_ignored(self, client, base_url):
+        body = CountingStream(chunks=1000, size=1024)
+        route = respx.get(f"{base_url}/attachments/1/content").mock(
+            return_value=httpx.Response(200, stream=body)
+        )
+
+        preview = await download_prefix(client, "/attachments/1/content", 4096)
+
+        assert route.calls.last.request.headers["Range"] == "bytes=0-4095"
+        assert len(preview["content"]) == 4096
+        assert preview["truncated"] is True
+        assert preview["range_honored"] is False
+        assert body.sent < 10 * 1024
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_honoured_range_reports_truncation(self, client, base_url):
+        def partial(request):
+            return httpx.Response(
+                206,
+                content=DATA[:100],
+                headers={"Content-Range": f"bytes 0-99/{len(DATA)}"},
+            )
+
+        respx.get(f"{base_url}/attachments/1/content").mock(side_effect=partial)
+
+        preview = await download_prefix(client, "/attachments/1/content", 100)
+
+        assert preview["content"] == DATA[:100]
+        assert preview["status"] == 206
+        assert preview["range_honored"] is True
+        assert preview["truncated"] is True
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_small_file_is_not_truncated(self, client, base_url):
+        respx.get(f"{base_url}/attachments/1/content").mock(
+            return_value=httpx.Response(200, content=b"short")
+        )
+
+        preview = await download_prefix(client, "/attachments/1/content", 100)
+
+        assert preview["content"] == b"short"
+        assert preview["truncated"] is False
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_empty_file_unsatisfiable_range(self, client, base_url):
+        respx.get(f"{base_url}/attachments/1/content").mock(
+            return_value=httpx.Response(416)
+        )
+
+        preview = await download_prefix(client, "/attachments/1/content", 100)
+
+        assert preview["content"] == b""
+        assert preview["truncated"] is False
+
+
+class TestDownloadSegmented:
+    """Test parallel range-split downloads"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_segments_fetched_concurrently(self, client, base_url, save_path):
+        in_flight = 0
+        peak = 0
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return ranged(request)
+
+        route = respx.get(f"{base_url}/attachments/1/content").mock(side_effect=slow)
+
+        result = await download_segmented(
+            client, "/attachments/1/content", save_path, len(DATA), 4, digest=DIGEST
+        )
+
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+        ranges = sorted(call.request.headers["Range"] for call in route.calls)
+        assert ranges == [
+            "bytes=0-4095",
+            "bytes=12288-16383",
+            "bytes=4096-8191",
+            "bytes=8192-12287",
+        ]
+        assert peak == 3  # the first segment probes, the rest overlap
+        assert result["mode"] == "parallel"
+        assert result["digest_verified"] is True
+        assert [seg["bytes"] for seg in result["segments"]] == [4096] * 4
+        assert not os.path.exists(save_path + ".part")
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_stream(self, client, base_url, save_path):
+        route = respx.get(f"{base_url}/attachments/1/content").mock(
+            return_value=httpx.Response(200, content=DATA)
+        )
+
+        result = await download_segmented(
+            client, "/attachments/1/content", save_path, len(DATA), 4, digest=DIGEST
+        )
+
+        assert route.call_count == 1
+        assert result["mode"] == "single"
+        assert result["segments"][0]["bytes"] == len(DATA)
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_segment_resumes_after_drop(self, client, base_url, save_path):
+        dropped = False
+
+        def flaky(request):
+            nonlocal dropped
+            if request.headers["Range"] == "bytes=4096-8191" and not dropped:
+                dropped = True
+                return httpx.Response(206, stream=BrokenStream(DATA[4096:], 1000))
+            return ranged(request)
+
+        route = respx.get(f"{base_url}/attachments/1/content").mock(side_effect=flaky)
+
+        result = await download_segmented(
+            client, "/attachments/1/content", save_path, len(DATA), 4, digest=DIGEST
+        )
+
+        assert "bytes=5096-8191" in [c.request.headers["Range"] for c in route.calls]
+        assert result["segments"][1]["retries"] == 1
+        with open(save_path, "rb") as f:
+            assert f.read() == DATA
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_failure_removes_part_file(self, client, base_url, save_path):
+        def picky(request):
+            if request.headers["Range"].startswith("bytes=0-"):
+                return ranged(request)
+            return httpx.Response(200, content=DATA)
+
+        respx.get(f"{base_url}/attachments/1/content").mock(side_effect=picky)
+
+        with pytest.raises(DownloadIncomplete):
+            await download_segmented(
+                client, "/attachments/1/content", save_path, len(DATA), 4
+            )
+
+        assert not os.path.exists(save_path)
+        assert not os.path.exists(save_path + ".part")
@@ -0,0 +1,198 @@
+"""
+Unit tests for the in-memory project index.
+
+Uses respx for HTTP mocking to avoid real API calls.
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+import respx
+
+from openproject_mcp.client import OpenProjectClient
+
+
+def project(pid, identifier, name):
+    return {
+        "id": pid,
+        "identifier": identifier,
+        "name": name,
+        "_links": {"self": {"href": f"/api/v3/projects/{pid}"}},
+    }
+
+
+def page(elements, total, offset, page_size=2):
+    return {
+        "_type": "Collection",
+        "total": total,
+        "count": len(elements),
+        "pageSize": page_size,
+        "offset": offset,
+        "_embedded": {"elements": elements},
+    }
+
+
+ALL_PROJECTS = [
+    project(1, "alpha", "Alpha Platform"),
+    project(2, "beta", "Beta Mobile"),
+    project(3, "gamma", "Gamma Platform"),
+    project(4, "delta", "Delta Ops"),
+    project(5, "epsilon", "Epsilon"),
+]
+
+
+@pytest.fixture
+def base_url(mock_settings):
+    """Base URL for API endpoints."""
+    return str(mock_settings.url).rstrip("/") + "/api/v3"
+
+
+@pytest.fixture
+def index(mock_settings):
+    """Project index of a fresh client."""
+    return OpenProjectClient(mock_settings).project_index
+
+
+def paged_projects(request):
+    offset = int(request.url.params["offset"])
+    start = (offset - 1) * 2
+    return httpx.Response(
+        200, json=page(ALL_PROJECTS[start : start + 2], len(ALL_PROJECTS), offset)
+    )
+
+
+class TestProjectIndexLoad:
+    """Test the initial full load"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_loads_every_page(self, index, base_url):
+        route = respx.get(f"{base_url}/projects").mock(side_effect=paged_projects)
+
+        table = await index.table()
+
+        assert route.call_count == 3
+        assert len(table) == 5
+        offsets = sorted(int(c.request.url.params["offset"]) for c in route.calls)
+        assert offsets == [1, 2, 3]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_loads_only_indexed_fields(self, index, base_url):
+        route = respx.get(f"{base_url}/projects").mock(side_effect=paged_projects)
+
+        await index.table()
+
+        select = route.calls[0].request.url.params["select"].split(",")
+        assert "total" in select and "pageSize" in select
+        assert "elements/_links/self" in select
+        assert "elements/description" not in select
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_remaining_pages_fetched_concurrently(self, index, base_url):
+        active = peak = 0
+
+        async def slow(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return paged_projects(request)
+
+        respx.get(f"{base_url}/projects").mock(side_effect=slow)
+
+        await index.table()
+
+        assert peak == 2  # pages 2 and 3 in parallel after page 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_lookups_after_load_are_offline(self, index, base_url):
+        route = respx.get(f"{base_url}/projects").mock(side_effect=paged_projects)
+
+        await index.table()
+        table = await index.table()
+
+        assert route.call_count == 3
+        assert [p["id"] for p in table.exact_identifier("GAMMA")] == [3]
+        assert [p["id"] for p in table.contains("name", "platform")] == [1, 3]
+        assert [p["id"] for p in table.contains("identifier", "ta")] == [2, 4]
+        assert table.contains("name", "nothing") == []
+
+
+class TestProjectIndexRefresh:
+    """Test incremental refresh and rebuild"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_stale_index_refreshes_changed_projects(self, index, base_url):
+        renamed = project(2, "beta", "Beta Web")
+
+        def handler(request):
+            if "filters" in request.url.params:
+                return httpx.Response(200, json=page([renamed], 1, 1))
+            return paged_projects(request)
+
+        route = respx.get(f"{base_url}/projects").mock(side_effect=handler)
+        await index.table()
+        index._refreshed_at = time.monotonic() - index.refresh_interval - 1
+
+        # Stale lookups are answered from memory while the refresh runs
+        await index.table()
+        await index._background
+
+        filters = json.loads(route.calls[-1].request.url.params["filters"])
+        assert "updatedAt" in filters[0]
+        table = await index.table()
+        assert [p["id"] for p in table.contains("name", "web")] == [2]
+        assert table.contains("name", "mobile") == []
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_invalidate_during_refresh_drops_changes(self, index, base_url):
+        invalidated = asyncio.Event()
+
+        async def handler(request):
+            if "filters" in request.url.params:
+                index.invalidate()
+                invalidated.set()
+                return httpx.Response(
+                    200, json=page([project(9, "late", "Late")], 1, 1)
+                )
+            return paged_projects(request)
+
+        respx.get(f"{base_url}/projects").mock(side_effect=handler)
+        old = await index.table()
+
+        await index.refresh()
+
+        assert invalidated.is_set()
+        assert old.exact_identifier("late") == []
+        assert index._table is None
+        # The next lookup rebuilds instead of dereferencing None
+        assert len(await index.table()) == 5
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_rebuild_drops_deleted_projects(self, index, base_url):
+        route = respx.get(f"{base_url}/projects").mock(side_effect=paged_projects)
+        await index.table()
+
+        route.mock(return_value=httpx.Response(200, json=page(ALL_PROJECTS[:1], 1, 1)))
+        await index.refresh(full=True)
+
+        assert len(await index.table()) == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_miss_refresh_is_rate_limited(self, index, base_url):
+        route = respx.get(f"{base_url}/projects").mock(side_effect=paged_projects)
+        await index.table()
+
+        assert await index.refresh_after_miss() is False
+        assert route.call_count == 3
@@ -0,0 +1,240 @@
+"""Unit tests for compact output projections."""
+
+import json
+
+import pytest
+
+from openproject_mcp.models import (
+    MembershipLite,
+    ProjectLite,
+    TimeEntryLite,
+    UserLite,
+    WorkPackageLite,
+)
+from openproject_mcp.utils.projection import (
+    collection_select,
+    compact,
+    fields_select,
+    use_compact,
+)
+
+
+def full_work_package(wp_id: int) -> dict:
+    """A work package as OpenProject renders it, links and html included."""
+    links = {
+        name: {"href": f"/api/v3/{name}s/{i}", "title": f"{name.title()} {i}"}
+        for i, name in enumerate(
+            ["status", "type", "priority", "assignee", "author", "project"], 1
+        )
+    }
+    links.update(
+        {
+            name: {"href": f"/api/v3/work_packages/{wp_id}/{name}", "method": "post"}
+            for name in (
+                "update",
+                "schema",
+                "updateImmediately",
+                "delete",
+                "logTime",
+                "move",
+                "copy",
+                "pdf",
+                "atom",
+                "availableRelationCandidates",
+                "customFields",
+                "configureForm",
+                "activities",
+                "attachments",
+                "addAttachment",
+                "relations",
+                "revisions",
+                "watchers",
+                "addWatcher",
+                "removeWatcher",
+                "addRelation",
+                "addChild",
+                "changeParent",
+                "addComment",
+                "previewMarkup",
+                "timeEntries",
+                "ancestors",
+                "fileLinks",
+            )
+        }
+    )
+    text = "Steps to reproduce, expected and actual behaviour. " * 8
+    return {
+        "_type": "WorkPackage",
+        "id": wp_id,
+        "lockVersion": 3,
+        "subject": f"Crash when saving report {wp_id}",
+        "description": {"format": "markdown", "raw": text, "html": f"<p>{text}</p>"},
+        "scheduleManually": False,
+        "startDate": "2025-01-06",
+        "dueDate": "2025-01-10",
+        "derivedStartDate": None,
+        "derivedDueDate": None,
+        "estimatedTime": "PT8H",
+        "derivedEstimatedTime": "PT8H",
+        "spentTime": "PT2H",
+        "percentageDone": 30,
+        "createdAt": "2025-01-02T09:00:00Z",
+        "updatedAt": "2025-01-08T16:30:00Z",
+        "_links": {"self": {"href": f"/api/v3/work_packages/{wp_id}"}, **links},
+    }
+
+
+class TestUseCompact:
+    """Test the per-call and global output switch"""
+
+    @pytest.mark.parametrize(
+        "requested, default, expected",
+        [
+            (None, "full", False),
+            (None, "compact", True),
+            ("compact", "full", True),
+            ("full", "compact", False),
+        ],
+    )
+    def test_call_overrides_setting(self, mock_settings, requested, default, expected):
+        settings = mock_settings.model_copy(update={"output_mode": default})
+
+        assert use_compact(requested, settings) is expected
+
+
+class TestCollectionSelect:
+    """Test building OpenProject select strings"""
+
+    def test_keeps_paging_properties(self):
+        assert collection_select(["id", "subject"]) == (
+            "total,count,pageSize,offset,elements/id,elements/subject"
+        )
+
+    def test_id_always_selected_once(self):
+        assert collection_select(["name", "id"], ("total",)) == (
+            "total,elements/id,elements/name"
+        )
+
+    def test_nested_links_and_element_prefix(self):
+        assert collection_select(["_links/self", "elements/status"], ("total",)) == (
+            "total,elements/id,elements/_links/self,elements/status"
+        )
+
+    @pytest.mark.parametrize("field", ["", "a,b", "../x", "name/", "*"])
+    def test_rejects_malformed_fields(self, field):
+        with pytest.raises(ValueError, match="Invalid field"):
+            collection_select([field])
+
+
+class TestFieldsSelect:
+    """Test resolving a read tool's fields parameter"""
+
+    def test_default_fields(self):
+        assert (
+            fields_select(None, ["name"], ("total",))
+            == "total,elements/id,elements/name"
+        )
+
+    def test_requested_fields_replace_default(self):
+        assert fields_select(["login"], ["name"], ("total",)) == (
+            "total,elements/id,elements/login"
+        )
+
+    def test_star_means_no_select(self):
+        assert fields_select(["*"], ["name"]) is None
+
+
+class TestLiteModels:
+    """Test projecting HAL resources onto the lean models"""
+
+    def test_work_package(self, mock_settings):
+        [wp] = compact(WorkPackageLite, [full_work_package(7)], mock_settings)
+
+        assert wp == {
+            "id": 7,
+            "subject": "Crash when saving report 7",
+            "status": "Status 1",
+            "type": "Type 2",
+            "assignee": "Assignee 4",
+            "project": "Project 6",
+            "due_date": "2025-01-10",
+            "updated_at": "2025-01-08T16:30:00Z",
+            "url": "https://test.openproject.com/work_packages/7",
+        }
+
+    def test_compact_list_is_an_order_of_magnitude_smaller(self, mock_settings):
+        full = [full_work_package(i) for i in range(1, 101)]
+
+        lean = compact(WorkPackageLite, full, mock_settings)
+
+        assert len(json.dumps(lean)) * 10 < len(json.dumps(full))
+
+    def test_project(self, mock_settings):
+        [project] = compact(
+            ProjectLite,
+            [{"id": 3, "identifier": "web", "name": "Website", "active": True}],
+            mock_settings,
+        )
+
+        assert project["url"] == "https://test.openproject.com/projects/web"
+
+    def test_user(self, mock_settings):
+        [user] = compact(
+            UserLite,
+            [{"id": 5, "name": "Ada", "status": "active", "_links": {"self": {}}}],
+            mock_settings,
+        )
+
+        assert user == {"id": 5, "name": "Ada", "status": "active"}
+
+    def test_membership(self, mock_settings):
+        membership = {
+            "id": 11,
+            "_links": {
+                "project": {"href": "/api/v3/projects/3", "title": "Website"},
+                "principal": {"href": "/api/v3/users/5", "title": "Ada"},
+                "roles": [
+                    {"href": "/api/v3/roles/3", "title": "Member"},
+                    {"href": "/api/v3/roles/4", "title": "Reviewer"},
+                ],
+            },
+        }
+
+        [lean] = compact(MembershipLite, [membership], mock_settings)
+
+        assert lean == {
+            "id": 11,
+            "project": "Website",
+            "principal_id": 5,
+            "principal": "Ada",
+            "roles": ["Member", "Reviewer"],
+        }
+
+    def test_time_entry(self, mock_settings):
+        entry = {
+            "id": 21,
+            "hours": "PT1H30M",
+            "spentOn": "2025-01-10",
+            "comment": {"format": "plain", "raw": "Review", "html": "<p>Review</p>"},
+            "_links": {
+                "workPackage": {"href": "/api/v3/work_packages/7", "title": "Crash"},
+                "user": {"href": "/api/v3/users/5", "title": "Ada"},
+                "activity": {
+                    "href": "/api/v3/time_entries/activities/1",
+                    "title": "Dev",
+                },
+            },
+        }
+
+        [lean] = compact(TimeEntryLite, [entry], mock_settings)
+
+        assert lean == {
+            "id": 21,
+            "hours": "PT1H30M",
+            "spent_on": "2025-01-10",
+            "work_package_id": 7,
+            "work_package": "Crash",
+            "user": "Ada",
+            "activity": "Dev",
+            "comment": "Review",
+        }
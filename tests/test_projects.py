@@ -12,7 +12,7 @@ from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 
 from openproject_mcp.tools import projects
-
+from openproject_mcp.utils.cursor import decode_cursor, encode_cursor
 
 # ============================================================================
 # Fixtures
@@ -100,8 +100,7 @@ class TestGetProjectMemberships:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 3
-        assert len(response_data["_embedded"]["elements"]) == 3
+        assert len(response_data["items"]) == 3
 
     @respx.mock
     @pytest.mark.asyncio
@@ -127,15 +126,20 @@ class TestGetProjectMemberships:
             return_value=httpx.Response(200, json=expected_response)
         )
 
+        cursor = encode_cursor({"offset": 2, "page_size": 2})
         result = await server.call_tool(
             "get_project_memberships",
-            {"params": {"project_id": 123, "page_size": 2, "offset": 2}},
+            {"params": {"project_id": 123, "cursor": cursor}},
         )
 
         assert route.called
+        assert route.calls[0].request.url.params["offset"] == "2"
+        assert route.calls[0].request.url.params["pageSize"] == "2"
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 2
-        assert response_data["offset"] == 2
+        assert len(response_data["items"]) == 2
+        assert response_data["total"] == 5
+        next_page = decode_cursor(response_data["next_cursor"])
+        assert next_page == {"offset": 3, "page_size": 2}
 
     @respx.mock
     @pytest.mark.asyncio
@@ -180,12 +184,11 @@ class TestGetProjectMemberships:
             "_embedded": {"elements": [{"id": 5, "_type": "Membership"}]},
         }
 
+        pages = {"1": page1_response, "2": page2_response, "3": page3_response}
         route = respx.get(f"{base_url}/memberships").mock(
-            side_effect=[
-                httpx.Response(200, json=page1_response),
-                httpx.Response(200, json=page2_response),
-                httpx.Response(200, json=page3_response),
-            ]
+            side_effect=lambda request: httpx.Response(
+                200, json=pages[request.url.params["offset"]]
+            )
         )
 
         result = await server.call_tool(
@@ -194,8 +197,7 @@ class TestGetProjectMemberships:
 
         assert route.call_count == 3
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 5
-        assert len(response_data["_embedded"]["elements"]) == 5
+        assert len(response_data["items"]) == 5
 
     @respx.mock
     @pytest.mark.asyncio
@@ -246,8 +248,58 @@ class TestGetProjectMemberships:
 
         assert route.call_count == 2
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 5  # Trimmed to 5
-        assert len(response_data["_embedded"]["elements"]) == 5
+        assert len(response_data["items"]) == 5  # Trimmed to 5
+        # Resumes on page 2 after the two memberships already returned
+        next_page = decode_cursor(response_data["next_cursor"])
+        assert next_page == {"offset": 2, "page_size": 3, "skip": 2}
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_memberships_follow_fetches_pages_concurrently(
+        self, server, base_url
+    ):
+        """Test pages after the first are fetched in parallel but kept in order."""
+        import asyncio
+        import json
+
+        active = peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            offset = int(request.url.params["offset"])
+            active += 1
+            peak = max(peak, active)
+            # Later pages answer first to prove results are re-ordered
+            await asyncio.sleep(0.05 / offset)
+            active -= 1
+            ids = [offset * 10 + i for i in range(2)]
+            return httpx.Response(
+                200,
+                json={
+                    "total": 10,
+                    "pageSize": 2,
+                    "offset": offset,
+                    "_embedded": {"elements": [{"id": i} for i in ids]},
+                },
+            )
+
+        route = respx.get(f"{base_url}/memberships").mock(side_effect=handler)
+
+        result = await server.call_tool(
+            "get_project_memberships", {"params": {"project_id": 123, "follow": 7}}
+        )
+
+        # 7 members need 4 pages of 2; page 5 is never requested
+        assert route.call_count == 4
+        assert peak >= 3
+        response_data = json.loads(result[0].text)
+        ids = [m["id"] for m in response_data["items"]]
+        assert ids == [10, 11, 20, 21, 30, 31, 40]
+        assert decode_cursor(response_data["next_cursor"]) == {
+            "offset": 4,
+            "page_size": 2,
+            "skip": 1,
+        }
 
     @respx.mock
     @pytest.mark.asyncio
@@ -272,7 +324,7 @@ class TestGetProjectMemberships:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 0
+        assert len(response_data["items"]) == 0
 
     @respx.mock
     @pytest.mark.asyncio
@@ -307,6 +359,101 @@ class TestGetProjectMemberships:
         assert "Permission denied" in str(exc_info.value)
 
 
+class TestGetProjectMembershipsCompact:
+    """Test compact output for get_project_memberships."""
+
+    @pytest.fixture
+    def compact_server(self, mock_settings):
+        settings = mock_settings.model_copy(update={"output_mode": "compact"})
+        server = FastMCP("test-openproject")
+        projects.register(server, settings)
+        return server
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_global_compact_output(self, compact_server, base_url):
+        """Test the output_mode setting applies when the call does not choose."""
+        import json
+
+        route = respx.get(f"{base_url}/memberships").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "pageSize": 25,
+                    "offset": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 4,
+                                "_links": {
+                                    "principal": {
+                                        "href": "/api/v3/users/5",
+                                        "title": "Ada",
+                                    },
+                                    "roles": [{"title": "Member"}],
+                                },
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+
+        result = await compact_server.call_tool(
+            "get_project_memberships", {"params": {"project_id": 1}}
+        )
+
+        assert "elements/roles" in route.calls[0].request.url.params["select"]
+        assert json.loads(result[0].text)["items"] == [
+            {"id": 4, "principal_id": 5, "principal": "Ada", "roles": ["Member"]}
+        ]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_call_can_ask_for_full_output(self, compact_server, base_url):
+        """Test output=full overrides a compact default."""
+        import json
+
+        route = respx.get(f"{base_url}/memberships").mock(
+            return_value=httpx.Response(
+                200, json={"total": 1, "_embedded": {"elements": [{"id": 4}]}}
+            )
+        )
+
+        result = await compact_server.call_tool(
+            "get_project_memberships",
+            {"params": {"project_id": 1, "output": "full"}},
+        )
+
+        # Default field set rather than the lean projection's
+        select = route.calls[0].request.url.params["select"]
+        assert "elements/createdAt" in select
+        assert json.loads(result[0].text)["items"] == [{"id": 4}]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fields_override_compact(self, compact_server, base_url):
+        """Test fields returns exactly the selected properties."""
+        import json
+
+        membership = {"id": 4, "_links": {"roles": [{"title": "Member"}]}}
+        route = respx.get(f"{base_url}/memberships").mock(
+            return_value=httpx.Response(
+                200, json={"total": 1, "_embedded": {"elements": [membership]}}
+            )
+        )
+
+        result = await compact_server.call_tool(
+            "get_project_memberships",
+            {"params": {"project_id": 1, "fields": ["roles"]}},
+        )
+
+        select = route.calls[0].request.url.params["select"]
+        assert select.endswith("elements/id,elements/roles")
+        assert json.loads(result[0].text)["items"] == [membership]
+
+
 # ============================================================================
 # Test: resolve_project
 # ============================================================================
@@ -560,3 +707,126 @@ class TestResolveProject:
 
         assert route.called
         assert "Authentication failed" in str(exc_info.value)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolve_project_uses_index(self, server, base_url):
+        """Repeat resolutions are answered without another API call."""
+        import json
+
+        projects_response = {
+            "_embedded": {
+                "elements": [
+                    {
+                        "id": 1,
+                        "identifier": "alpha",
+                        "name": "Alpha Project",
+                        "_links": {"self": {"href": "/api/v3/projects/1"}},
+                    },
+                    {
+                        "id": 2,
+                        "identifier": "beta",
+                        "name": "Beta Project",
+                        "_links": {"self": {"href": "/api/v3/projects/2"}},
+                    },
+                ]
+            }
+        }
+
+        route = respx.get(f"{base_url}/projects").mock(
+            return_value=httpx.Response(200, json=projects_response)
+        )
+
+        await server.call_tool(
+            "resolve_project", {"params": {"name_or_identifier": "alpha"}}
+        )
+        result = await server.call_tool(
+            "resolve_project", {"params": {"name_or_identifier": "beta"}}
+        )
+
+        assert route.call_count == 1
+        response_data = json.loads(result[0].text)
+        assert response_data["id"] == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolve_project_fields(self, server, base_url):
+        """Test fields fetches the selected properties of the matches."""
+        import json
+
+        index_page = {
+            "total": 2,
+            "_embedded": {
+                "elements": [
+                    {"id": 1, "identifier": "web-app", "name": "Web App"},
+                    {"id": 2, "identifier": "web-site", "name": "Web Site"},
+                ]
+            },
+        }
+        selected = {
+            "total": 2,
+            "_embedded": {
+                "elements": [
+                    {"id": 2, "_links": {"parent": {"title": "Web"}}},
+                    {"id": 1, "_links": {"parent": {"title": "Web"}}},
+                ]
+            },
+        }
+        route = respx.get(f"{base_url}/projects").mock(
+            side_effect=[
+                httpx.Response(200, json=index_page),
+                httpx.Response(200, json=selected),
+            ]
+        )
+
+        result = await server.call_tool(
+            "resolve_project",
+            {"params": {"name_or_identifier": "web", "fields": ["_links/parent"]}},
+        )
+
+        params = route.calls[1].request.url.params
+        assert json.loads(params["filters"])[0]["id"]["values"] == ["1", "2"]
+        assert params["select"].endswith("elements/id,elements/_links/parent")
+        response_data = json.loads(result[0].text)
+        assert response_data["disambiguation_needed"] is True
+        assert [p["id"] for p in response_data["matches"]] == [1, 2]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolve_project_fields_caps_matches(self, server, base_url):
+        """Test a broad term does not turn into an unbounded id filter."""
+        import json
+
+        index_page = {
+            "total": 30,
+            "_embedded": {
+                "elements": [
+                    {"id": i, "identifier": f"team-{i}", "name": f"Team {i}"}
+                    for i in range(1, 31)
+                ]
+            },
+        }
+
+        def handler(request):
+            if "filters" not in request.url.params:
+                return httpx.Response(200, json=index_page)
+            filters = json.loads(request.url.params["filters"])
+            ids = [int(i) for i in filters[0]["id"]["values"]]
+            return httpx.Response(
+                200, json={"_embedded": {"elements": [{"id": i} for i in ids]}}
+            )
+
+        route = respx.get(f"{base_url}/projects").mock(side_effect=handler)
+
+        result = await server.call_tool(
+            "resolve_project",
+            {"params": {"name_or_identifier": "team", "fields": ["name"]}},
+        )
+
+        params = route.calls[1].request.url.params
+        assert len(json.loads(params["filters"])[0]["id"]["values"]) == 25
+        assert params["pageSize"] == "25"
+        response_data = json.loads(result[0].text)
+        assert len(response_data["matches"]) == 25
+        assert response_data["truncated"] is True
+        assert response_data["total"] == 30
@@ -94,12 +94,8 @@ class TestListQueries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 3
-        assert len(response_data["_embedded"]["elements"]) == 3
-        assert (
-            response_data["_embedded"]["elements"][0]["name"]
-            == "All open work packages"
-        )
+        assert len(response_data["items"]) == 3
+        assert response_data["items"][0]["name"] == "All open work packages"
 
     @respx.mock
     @pytest.mark.asyncio
@@ -137,7 +133,7 @@ class TestListQueries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 2
+        assert len(response_data["items"]) == 2
 
     @respx.mock
     @pytest.mark.asyncio
@@ -160,7 +156,7 @@ class TestListQueries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 0
+        assert len(response_data["items"]) == 0
 
     @respx.mock
     @pytest.mark.asyncio
@@ -190,6 +186,28 @@ class TestListQueries:
         assert route.called
         assert "Authentication failed" in str(exc_info.value)
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_queries_fields(self, server, base_url):
+        """Test fields narrows the select, invalid fields are rejected."""
+        route = respx.get(f"{base_url}/queries").mock(
+            return_value=httpx.Response(
+                200, json={"total": 0, "_embedded": {"elements": []}}
+            )
+        )
+
+        await server.call_tool("list_queries", {"params": {}})
+        await server.call_tool("list_queries", {"params": {"fields": ["name"]}})
+        with pytest.raises(ToolError, match="Invalid field"):
+            await server.call_tool(
+                "list_queries", {"params": {"fields": ["name,filters"]}}
+            )
+
+        default, narrow = [c.request.url.params["select"] for c in route.calls]
+        assert "elements/starred" in default
+        assert narrow.endswith("elements/id,elements/name")
+        assert route.call_count == 2
+
 
 # ============================================================================
 # Test: run_query
@@ -240,8 +258,7 @@ class TestRunQuery:
         assert query_route.called
         assert results_route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 2
-        assert len(response_data["_embedded"]["elements"]) == 2
+        assert len(response_data["items"]) == 2
 
     @respx.mock
     @pytest.mark.asyncio
@@ -413,8 +430,7 @@ class TestRunQuery:
         assert query_route.called
         assert results_route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 0
-        assert len(response_data["_embedded"]["elements"]) == 0
+        assert len(response_data["items"]) == 0
 
     @respx.mock
     @pytest.mark.asyncio
@@ -458,4 +474,53 @@ class TestRunQuery:
         assert query_route.called
         assert results_route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 5
+        assert len(response_data["items"]) == 5
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_run_query_compact(self, server, base_url):
+        """Test compact output selects and returns lean work packages."""
+        import json
+
+        respx.get(f"{base_url}/queries/7").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": 7,
+                    "_links": {"results": {"href": "/api/v3/queries/7/results"}},
+                },
+            )
+        )
+        results_route = respx.get(f"{base_url}/queries/7/results").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 1,
+                                "subject": "Task 1",
+                                "description": {"raw": "x", "html": "<p>x</p>"},
+                                "_links": {"status": {"title": "New"}},
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+
+        result = await server.call_tool(
+            "run_query", {"params": {"query_id": 7, "output": "compact"}}
+        )
+
+        select = results_route.calls[0].request.url.params["select"]
+        assert "elements/subject" in select
+        assert json.loads(result[0].text)["items"] == [
+            {
+                "id": 1,
+                "subject": "Task 1",
+                "status": "New",
+                "url": "https://test.openproject.com/work_packages/1",
+            }
+        ]
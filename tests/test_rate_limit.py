@@ -0,0 +1,123 @@
+"""Unit tests for the adaptive client rate limiter."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from openproject_mcp.utils import rate_limit
+from openproject_mcp.utils.rate_limit import RateLimiter, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing"""
+
+    def test_delay_seconds(self):
+        assert parse_retry_after("3", maximum=60) == 3.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(when, usegmt=True), maximum=60)
+        assert 28 <= delay <= 30
+
+    def test_clamped_to_maximum(self):
+        assert parse_retry_after("3600", maximum=60) == 60
+
+    def test_past_date_is_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", maximum=60) == 0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value, maximum=60) is None
+
+
+class TestRateLimiter:
+    """Test token bucket and AIMD behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_unthrottled_until_server_pushes_back(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(50)))
+        assert time.monotonic() - start < 0.1
+        assert limiter.throttled is False
+
+    @pytest.mark.asyncio
+    async def test_requests_queue_once_throttled(self):
+        limiter = RateLimiter(rate=40, burst=1)
+        limiter.on_throttled(None)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+        # Empty bucket after the 429, then 3 at 20/s
+        assert time.monotonic() - start >= 0.14
+
+    def test_throttle_halves_rate_and_success_recovers(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+        limiter = RateLimiter(rate=8, burst=1, min_rate=1, increase=2)
+        limiter.on_throttled(None)
+        assert limiter.rate == 4
+        limiter.on_throttled(None)
+        limiter.on_throttled(None)
+        limiter.on_throttled(None)
+        assert limiter.rate == 1  # floored at min_rate
+
+        now[0] += 1
+        limiter.on_success()
+        assert limiter.rate == 3
+        for _ in range(10):
+            now[0] += 1
+            limiter.on_success()
+        assert limiter.rate == 8  # capped at configured rate
+        assert limiter.throttled is False  # and no longer metered
+
+    def test_burst_of_successes_after_429_recovers_slowly(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+        limiter = RateLimiter(rate=10, burst=1, increase=1)
+        limiter.on_throttled(None)
+
+        # Dozens of fast responses inside one interval: still backed off
+        for _ in range(50):
+            now[0] += 0.01
+            limiter.on_success()
+        assert limiter.rate == 5
+
+        now[0] += 0.51
+        limiter.on_success()
+        assert limiter.rate == 6
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_callers(self):
+        limiter = RateLimiter(rate=100, burst=10)
+        limiter.on_throttled(0.2)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_headers_pause(self):
+        limiter = RateLimiter(rate=100, burst=10)
+        limiter.observe({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.2"})
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.18
+        assert limiter.throttled is True
+        assert limiter.rate == 100
+
+    def test_remaining_quota_does_not_pause(self):
+        limiter = RateLimiter(rate=100, burst=10)
+        limiter.observe({"RateLimit-Remaining": "5", "RateLimit-Reset": "30"})
+        assert limiter._paused_until == 0.0
+        assert limiter.throttled is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_limiter_never_waits(self):
+        limiter = RateLimiter(rate=0, burst=1)
+        limiter.on_throttled(30)
+        start = time.monotonic()
+        for _ in range(50):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.1
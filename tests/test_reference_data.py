@@ -0,0 +1,141 @@
+"""
+Unit tests for the reference-data cache.
+
+Uses respx for HTTP mocking to avoid real API calls.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from openproject_mcp.client import OpenProjectClient
+
+STATUSES = {
+    "_type": "Collection",
+    "_embedded": {
+        "elements": [
+            {"id": 1, "name": "New"},
+            {"id": 7, "name": "In Progress"},
+            {"id": 12, "name": "Closed"},
+        ]
+    },
+}
+
+
+@pytest.fixture
+def base_url(mock_settings):
+    """Base URL for API endpoints."""
+    return str(mock_settings.url).rstrip("/") + "/api/v3"
+
+
+@pytest.fixture
+def cache(mock_settings):
+    """Reference-data cache of a fresh client."""
+    return OpenProjectClient(mock_settings).reference_data
+
+
+class TestReferenceDataCache:
+    """Test TTL caching, name lookup and invalidation"""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_statuses_fetched_once(self, cache, base_url):
+        route = respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json=STATUSES)
+        )
+
+        await cache.statuses()
+        await cache.statuses()
+
+        assert route.call_count == 1
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, cache, base_url):
+        route = respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json=STATUSES)
+        )
+
+        await asyncio.gather(*(cache.statuses() for _ in range(5)))
+
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_case_folded_lookup(self, cache, base_url):
+        respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json=STATUSES)
+        )
+
+        statuses = await cache.statuses()
+
+        assert [s["id"] for s in statuses.exact("  in PROGRESS ")] == [7]
+        assert [s["id"] for s in statuses.partial("s")] == [7, 12]
+        assert statuses.exact("Rejected") == []
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, mock_settings, base_url):
+        mock_settings.status_cache_ttl = 0
+        cache = OpenProjectClient(mock_settings).reference_data
+        route = respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json=STATUSES)
+        )
+
+        await cache.statuses()
+        await cache.statuses()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_types_cached_per_project(self, cache, base_url):
+        project_route = respx.get(f"{base_url}/projects/5/types").mock(
+            return_value=httpx.Response(200, json={"_embedded": {"elements": []}})
+        )
+        global_route = respx.get(f"{base_url}/types").mock(
+            return_value=httpx.Response(200, json={"_embedded": {"elements": []}})
+        )
+
+        await cache.types(5)
+        await cache.types()
+        await cache.types(5)
+        await cache.types()
+
+        assert project_route.call_count == 1
+        assert global_route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_invalidate_one_collection(self, cache, base_url):
+        status_route = respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json=STATUSES)
+        )
+        type_route = respx.get(f"{base_url}/types").mock(
+            return_value=httpx.Response(200, json={"_embedded": {"elements": []}})
+        )
+        await cache.statuses()
+        await cache.types()
+
+        cache.invalidate("statuses")
+        await cache.statuses()
+        await cache.types()
+
+        assert status_route.call_count == 2
+        assert type_route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_as_collection_returns_copy(self, cache, base_url):
+        respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json=STATUSES)
+        )
+
+        first = (await cache.statuses()).as_collection()
+        first["_embedded"]["elements"].clear()
+        second = (await cache.statuses()).as_collection()
+
+        assert len(second["_embedded"]["elements"]) == 3
@@ -0,0 +1,67 @@
+"""
+Unit tests for server construction.
+
+Checks that all tool modules share one OpenProjectClient whose lifetime
+is bound to the FastMCP lifespan.
+"""
+
+import pytest
+
+from openproject_mcp import server as server_module
+from openproject_mcp.client import OpenProjectClient
+
+
+class TestBuildServer:
+    """Test suite for build_server."""
+
+    @pytest.mark.asyncio
+    async def test_tool_modules_share_one_client(self, mock_settings, monkeypatch):
+        """Every register() call receives the same client instance."""
+        seen = []
+
+        def spy(module):
+            original = module.register
+
+            def _register(server, settings=None, client=None):
+                seen.append(client)
+                return original(server, settings, client)
+
+            monkeypatch.setattr(module, "register", _register)
+
+        for module in (
+            server_module.work_packages,
+            server_module.attachments,
+            server_module.queries,
+            server_module.time_entries,
+            server_module.users,
+            server_module.wiki,
+            server_module.projects,
+        ):
+            spy(module)
+
+        server_module.build_server(mock_settings)
+
+        assert len(seen) == 7
+        assert isinstance(seen[0], OpenProjectClient)
+        assert all(c is seen[0] for c in seen)
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_client(self, mock_settings, monkeypatch):
+        """The pooled client is opened on startup and closed on shutdown."""
+        clients = []
+        original_init = OpenProjectClient.__init__
+
+        def _init(self, settings):
+            original_init(self, settings)
+            clients.append(self)
+
+        monkeypatch.setattr(OpenProjectClient, "__init__", _init)
+        server = server_module.build_server(mock_settings)
+        (client,) = clients
+
+        async with server.settings.lifespan(server):
+            http = client._client
+            assert http is not None and not http.is_closed
+
+        assert http.is_closed
+        assert client._client is None
@@ -0,0 +1,103 @@
+"""Unit tests for the single-flight request coalescer."""
+
+import asyncio
+
+import pytest
+
+from openproject_mcp.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test collapsing of concurrent calls by key"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+        assert results == ["done"] * 5
+        assert calls == 1
+        assert flight.stats() == {"leaders": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def work(v):
+            await asyncio.sleep(0.01)
+            return v
+
+        a, b = await asyncio.gather(
+            flight.do("a", lambda: work(1)), flight.do("b", lambda: work(2))
+        )
+
+        assert (a, b) == (1, 2)
+        assert flight.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+
+        async def work():
+            return object()
+
+        first = await flight.do("k", work)
+        second = await flight.do("k", work)
+
+        assert first is not second
+        assert flight.leaders == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_waiters(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", work), flight.do("k", work), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "ok"
+
+    @pytest.mark.asyncio
+    async def test_work_cancelled_when_last_waiter_leaves(self):
+        flight = SingleFlight()
+        finished = False
+
+        async def work():
+            nonlocal finished
+            await asyncio.sleep(0.05)
+            finished = True
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(flight.do("k", work), timeout=0.01)
+        await asyncio.sleep(0.06)
+
+        assert not finished
+        assert flight.stats()["in_flight"] == 0
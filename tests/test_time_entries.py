@@ -13,6 +13,7 @@ from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 
 from openproject_mcp.tools import time_entries
+from openproject_mcp.utils.cursor import decode_cursor, encode_cursor
 
 
 # ============================================================================
@@ -87,8 +88,7 @@ class TestListTimeEntries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 3
-        assert len(response_data["_embedded"]["elements"]) == 3
+        assert len(response_data["items"]) == 3
 
     @respx.mock
     @pytest.mark.asyncio
@@ -118,7 +118,7 @@ class TestListTimeEntries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 2
+        assert len(response_data["items"]) == 2
 
     @respx.mock
     @pytest.mark.asyncio
@@ -145,7 +145,7 @@ class TestListTimeEntries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 1
+        assert len(response_data["items"]) == 1
 
     @respx.mock
     @pytest.mark.asyncio
@@ -175,7 +175,7 @@ class TestListTimeEntries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 5
+        assert len(response_data["items"]) == 5
 
     @respx.mock
     @pytest.mark.asyncio
@@ -206,7 +206,7 @@ class TestListTimeEntries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 2
+        assert len(response_data["items"]) == 2
 
     @respx.mock
     @pytest.mark.asyncio
@@ -288,7 +288,7 @@ class TestListTimeEntries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 1
+        assert len(response_data["items"]) == 1
 
     @respx.mock
     @pytest.mark.asyncio
@@ -300,20 +300,124 @@ class TestListTimeEntries:
             "_type": "Collection",
             "count": 50,
             "total": 150,
-            "_embedded": {"elements": [{"id": i} for i in range(1, 51)]},
+            "pageSize": 50,
+            "offset": 2,
+            "_embedded": {"elements": [{"id": i} for i in range(51, 101)]},
         }
 
         route = respx.get(f"{base_url}/time_entries").mock(
             return_value=httpx.Response(200, json=expected_response)
         )
 
+        cursor = encode_cursor({"offset": 2, "page_size": 50})
         result = await server.call_tool(
-            "list_time_entries", {"params": {"page_size": 50, "offset": 2}}
+            "list_time_entries", {"params": {"cursor": cursor}}
         )
 
         assert route.called
+        assert route.calls[0].request.url.params["offset"] == "2"
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 50
+        assert len(response_data["items"]) == 50
+        assert response_data["total"] == 150
+        assert decode_cursor(response_data["next_cursor"])["offset"] == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_time_entries_page_size_clamped(
+        self, server, base_url, mock_settings
+    ):
+        """Test requested page size is capped at page_size_max."""
+        route = respx.get(f"{base_url}/time_entries").mock(
+            return_value=httpx.Response(200, json={"_embedded": {"elements": []}})
+        )
+
+        await server.call_tool("list_time_entries", {"params": {"page_size": 5000}})
+
+        page_size = route.calls[0].request.url.params["pageSize"]
+        assert page_size == str(mock_settings.page_size_max)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_time_entries_last_page(self, server, base_url):
+        """Test no next_cursor is returned on the last page."""
+        import json
+
+        respx.get(f"{base_url}/time_entries").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 3,
+                    "pageSize": 25,
+                    "offset": 1,
+                    "_embedded": {"elements": [{"id": 1}, {"id": 2}, {"id": 3}]},
+                },
+            )
+        )
+
+        result = await server.call_tool("list_time_entries", {"params": {}})
+
+        response_data = json.loads(result[0].text)
+        assert response_data["next_cursor"] is None
+        assert response_data["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_list_time_entries_invalid_cursor(self, server):
+        """Test a malformed cursor is rejected."""
+        with pytest.raises(ToolError):
+            await server.call_tool(
+                "list_time_entries", {"params": {"cursor": "not-a-cursor"}}
+            )
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_time_entries_compact(self, server, base_url):
+        """Test compact output selects and returns lean time entries."""
+        import json
+
+        route = respx.get(f"{base_url}/time_entries").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "pageSize": 25,
+                    "offset": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 1,
+                                "hours": "PT2H",
+                                "spentOn": "2025-01-10",
+                                "_links": {
+                                    "workPackage": {
+                                        "href": "/api/v3/work_packages/9",
+                                        "title": "Login bug",
+                                    },
+                                    "user": {"title": "Ada"},
+                                },
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+
+        result = await server.call_tool(
+            "list_time_entries", {"params": {"output": "compact"}}
+        )
+
+        select = route.calls[0].request.url.params["select"]
+        assert select.startswith("total,count,pageSize,offset,")
+        assert "elements/spentOn" in select
+        assert json.loads(result[0].text)["items"] == [
+            {
+                "id": 1,
+                "hours": "PT2H",
+                "spent_on": "2025-01-10",
+                "work_package_id": 9,
+                "work_package": "Login bug",
+                "user": "Ada",
+            }
+        ]
 
     @respx.mock
     @pytest.mark.asyncio
@@ -336,7 +440,7 @@ class TestListTimeEntries:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 0
+        assert len(response_data["items"]) == 0
 
     @respx.mock
     @pytest.mark.asyncio
@@ -352,6 +456,29 @@ class TestListTimeEntries:
         assert route.called
         assert "Authentication failed" in str(exc_info.value)
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_time_entries_fields(self, server, base_url):
+        """Test fields selects exactly those properties, even in compact mode."""
+        import json
+
+        entry = {"id": 9, "hours": "PT1H", "_links": {"user": {"title": "Ada"}}}
+        route = respx.get(f"{base_url}/time_entries").mock(
+            return_value=httpx.Response(
+                200, json={"total": 1, "_embedded": {"elements": [entry]}}
+            )
+        )
+
+        result = await server.call_tool(
+            "list_time_entries",
+            {"params": {"fields": ["hours", "user"], "output": "compact"}},
+        )
+
+        assert route.calls[0].request.url.params["select"] == (
+            "total,count,pageSize,offset,elements/id,elements/hours,elements/user"
+        )
+        assert json.loads(result[0].text)["items"] == [entry]
+
 
 # ============================================================================
 # Test: log_time
@@ -611,3 +738,139 @@ class TestLogTime:
             await server.call_tool("log_time", {"params": {"wp_id": 456, "hours": 0.0}})
 
         assert "validation" in str(exc_info.value).lower()
+
+
+# ============================================================================
+# Test: log_time_bulk
+# ============================================================================
+
+
+class TestLogTimeBulk:
+    """Test suite for log_time_bulk tool."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_log_time_bulk_creates_all(self, server, base_url):
+        """Test every entry is posted and results keep input order."""
+        import json
+
+        def created(request):
+            payload = json.loads(request.content)
+            wp = payload["_links"]["workPackage"]["href"].rsplit("/", 1)[1]
+            return httpx.Response(201, json={"id": int(wp) * 10, **payload})
+
+        route = respx.post(f"{base_url}/time_entries").mock(side_effect=created)
+
+        result = await server.call_tool(
+            "log_time_bulk",
+            {
+                "params": {
+                    "entries": [
+                        {"wp_id": 1, "hours": 1.5, "spent_on": "2025-01-13"},
+                        {"wp_id": 2, "hours": 8, "comment": "Release"},
+                        {"wp_id": 3, "hours": 0.25, "activity_id": 4},
+                    ]
+                }
+            },
+        )
+
+        data = json.loads(result[0].text)
+        assert route.call_count == 3
+        assert data["created"] == 3 and data["failed"] == 0
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert [r["time_entry"]["id"] for r in data["results"]] == [10, 20, 30]
+        assert [r["time_entry"]["hours"] for r in data["results"]] == [
+            "PT1H30M",
+            "PT8H0M",
+            "PT0H15M",
+        ]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_log_time_bulk_invalid_entries_post_nothing(self, server, base_url):
+        """Test local validation rejects the whole batch before any request."""
+        import json
+
+        route = respx.post(f"{base_url}/time_entries").mock(
+            return_value=httpx.Response(201, json={"id": 1})
+        )
+
+        result = await server.call_tool(
+            "log_time_bulk",
+            {
+                "params": {
+                    "entries": [
+                        {"wp_id": 1, "hours": 1.0},
+                        {"wp_id": 2, "hours": 1.0, "spent_on": "2025-02-30"},
+                        {"wp_id": 3, "hours": 0.001},
+                        {
+                            "wp_id": 4,
+                            "hours": 1.0,
+                            "start_time": "2025-01-10T11:00:00Z",
+                            "end_time": "2025-01-10T09:00:00Z",
+                        },
+                    ]
+                }
+            },
+        )
+
+        data = json.loads(result[0].text)
+        assert not route.called
+        assert "nothing was logged" in data["error"]
+        assert [e["index"] for e in data["invalid"]] == [1, 2, 3]
+        assert "spent_on" in data["invalid"][0]["error"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_log_time_bulk_reports_failures_per_entry(self, server, base_url):
+        """Test a rejected entry does not stop the rest of the batch."""
+        import json
+
+        def maybe_forbidden(request):
+            payload = json.loads(request.content)
+            if payload["_links"]["workPackage"]["href"].endswith("/2"):
+                return httpx.Response(403, json={"message": "Forbidden"})
+            return httpx.Response(201, json={"id": 1})
+
+        respx.post(f"{base_url}/time_entries").mock(side_effect=maybe_forbidden)
+
+        result = await server.call_tool(
+            "log_time_bulk",
+            {"params": {"entries": [{"wp_id": i, "hours": 1.0} for i in (1, 2, 3)]}},
+        )
+
+        data = json.loads(result[0].text)
+        assert data["created"] == 2 and data["failed"] == 1
+        assert data["results"][1]["status"] == "failed"
+        assert "Permission denied" in data["results"][1]["error"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_log_time_bulk_bounded_concurrency(self, server, base_url):
+        """Test no more than `concurrency` requests are in flight."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(201, json={"id": 1})
+
+        respx.post(f"{base_url}/time_entries").mock(side_effect=slow)
+
+        await server.call_tool(
+            "log_time_bulk",
+            {
+                "params": {
+                    "entries": [{"wp_id": i, "hours": 1.0} for i in range(1, 11)],
+                    "concurrency": 3,
+                }
+            },
+        )
+
+        assert peak == 3
@@ -0,0 +1,143 @@
+"""Unit tests for the streamed multipart attachment upload body."""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from openproject_mcp.utils.upload import (
+    MultipartFileUpload,
+    file_digests,
+    progress_notifier,
+)
+
+
+@pytest.fixture
+def binary_file():
+    """A file spanning several upload chunks."""
+    data = os.urandom(10 * 1024 + 123)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".bin") as f:
+        f.write(data)
+    yield f.name, data
+    os.unlink(f.name)
+
+
+async def _collect(upload) -> bytes:
+    return b"".join([chunk async for chunk in upload])
+
+
+class TestMultipartFileUpload:
+    """Test the body layout, streaming and progress reporting"""
+
+    @pytest.mark.asyncio
+    async def test_body_has_metadata_and_file_parts(self, binary_file):
+        path, data = binary_file
+        upload = MultipartFileUpload(path, "Build log", chunk_size=4096)
+
+        body = await _collect(upload)
+
+        boundary = upload.boundary.encode()
+        parts = body.split(b"--" + boundary)
+        assert parts[0] == b"" and parts[-1] == b"--\r\n"
+        meta_head, meta_body = parts[1].split(b"\r\n\r\n", 1)
+        assert b'name="metadata"' in meta_head
+        assert json.loads(meta_body) == {
+            "fileName": os.path.basename(path),
+            "description": {"raw": "Build log"},
+        }
+        file_head, file_body = parts[2].split(b"\r\n\r\n", 1)
+        assert f'filename="{os.path.basename(path)}"'.encode() in file_head
+        assert b"Content-Type: application/octet-stream" in file_head
+        assert file_body == data + b"\r\n"
+
+    @pytest.mark.asyncio
+    async def test_content_length_matches_body(self, binary_file):
+        path, _ = binary_file
+        upload = MultipartFileUpload(path)
+
+        body = await _collect(upload)
+
+        assert int(upload.headers["Content-Length"]) == len(body)
+        assert upload.headers["Content-Type"].endswith(upload.boundary)
+
+    @pytest.mark.asyncio
+    async def test_file_is_read_in_chunks(self, binary_file):
+        path, data = binary_file
+        upload = MultipartFileUpload(path, chunk_size=4096)
+
+        chunks = [chunk async for chunk in upload]
+
+        # head, three file chunks, tail
+        assert len(chunks) == 5
+        assert max(len(c) for c in chunks[1:-1]) == 4096
+
+    @pytest.mark.asyncio
+    async def test_body_can_be_sent_again(self, binary_file):
+        path, _ = binary_file
+        upload = MultipartFileUpload(path)
+
+        assert await _collect(upload) == await _collect(upload)
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_up_to_file_size(self, binary_file):
+        path, data = binary_file
+        reports = []
+
+        async def on_progress(sent, total):
+            reports.append((sent, total))
+
+        upload = MultipartFileUpload(path, on_progress=on_progress, chunk_size=4096)
+        await _collect(upload)
+
+        assert reports[0] == (0, len(data))
+        assert reports[-1] == (len(data), len(data))
+        assert [s for s, _ in reports] == sorted(s for s, _ in reports)
+
+
+class TestFileDigests:
+    """Test hashing local files for upload deduplication"""
+
+    @pytest.mark.asyncio
+    async def test_several_algorithms_in_one_pass(self, binary_file):
+        import hashlib
+
+        path, data = binary_file
+
+        digests = await file_digests(path, {"md5", "sha256"})
+
+        assert digests == {
+            "md5": hashlib.md5(data).hexdigest(),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+
+
+class TestProgressNotifier:
+    """Test adapting the MCP context into a progress callback"""
+
+    def test_no_context(self):
+        assert progress_notifier(None) is None
+
+    def test_context_outside_request(self):
+        class OutsideRequest:
+            @property
+            def request_context(self):
+                raise ValueError("Context is not available outside of a request")
+
+        assert progress_notifier(OutsideRequest()) is None
+
+    @pytest.mark.asyncio
+    async def test_reports_to_context(self):
+        class InRequest:
+            request_context = object()
+
+            def __init__(self):
+                self.reports = []
+
+            async def report_progress(self, progress, total=None):
+                self.reports.append((progress, total))
+
+        ctx = InRequest()
+        await progress_notifier(ctx)(512, 1024)
+
+        assert ctx.reports == [(512, 1024)]
@@ -284,6 +284,101 @@ class TestResolveUser:
 # ============================================================================
 
 
+class TestUserCompactOutput:
+    """Test compact output for user tools."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolve_user_fields(self, server, base_url):
+        """Test fields replaces the default select, ["*"] drops it."""
+        route = respx.get(f"{base_url}/principals").mock(
+            return_value=httpx.Response(
+                200, json={"total": 0, "_embedded": {"elements": []}}
+            )
+        )
+
+        await server.call_tool("resolve_user", {"params": {"search_term": "ada"}})
+        await server.call_tool(
+            "resolve_user",
+            {"params": {"search_term": "ada", "fields": ["login", "_links/self"]}},
+        )
+        await server.call_tool(
+            "resolve_user", {"params": {"search_term": "ada", "fields": ["*"]}}
+        )
+
+        default, narrow, full = [c.request.url.params for c in route.calls]
+        assert "elements/email" in default["select"]
+        assert narrow["select"].endswith(
+            "elements/id,elements/login,elements/_links/self"
+        )
+        assert "select" not in full
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolve_user_compact(self, server, base_url):
+        """Test compact search returns lean users and narrows the select."""
+        import json
+
+        route = respx.get(f"{base_url}/principals").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 5,
+                                "name": "Ada Lovelace",
+                                "_links": {"self": {"href": "/api/v3/users/5"}},
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+
+        result = await server.call_tool(
+            "resolve_user", {"params": {"search_term": "ada", "output": "compact"}}
+        )
+
+        assert "elements/name" in route.calls[0].request.url.params["select"]
+        assert json.loads(result[0].text) == {
+            "items": [{"id": 5, "name": "Ada Lovelace"}],
+            "total": 1,
+        }
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_user_by_id_compact(self, server, base_url):
+        """Test a single user is projected too."""
+        import json
+
+        respx.get(f"{base_url}/users/5").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": 5,
+                    "name": "Ada Lovelace",
+                    "login": "ada",
+                    "status": "active",
+                    "avatar": "https://example.com/a.png",
+                    "_links": {"self": {"href": "/api/v3/users/5"}},
+                },
+            )
+        )
+
+        result = await server.call_tool(
+            "get_user_by_id", {"params": {"user_id": 5, "output": "compact"}}
+        )
+
+        assert json.loads(result[0].text) == {
+            "id": 5,
+            "name": "Ada Lovelace",
+            "login": "ada",
+            "status": "active",
+        }
+
+
 class TestGetUserById:
     """Test suite for get_user_by_id tool."""
 
@@ -15,7 +15,6 @@ from mcp.server.fastmcp.exceptions import ToolError
 
 from openproject_mcp.tools import wiki
 
-
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -374,9 +373,10 @@ class TestListWikiPageAttachments:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 2
-        assert len(response_data["_embedded"]["elements"]) == 2
-        assert response_data["_embedded"]["elements"][0]["fileName"] == "document.pdf"
+        assert response_data["total"] == 2
+        assert len(response_data["items"]) == 2
+        assert response_data["items"][0]["fileName"] == "document.pdf"
+        assert response_data["next_cursor"] is None
 
     @respx.mock
     @pytest.mark.asyncio
@@ -401,7 +401,8 @@ class TestListWikiPageAttachments:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["count"] == 0
+        assert response_data["total"] == 0
+        assert response_data["items"] == []
 
     @respx.mock
     @pytest.mark.asyncio
@@ -441,7 +442,52 @@ class TestListWikiPageAttachments:
 
         assert route.called
         response_data = json.loads(result[0].text)
-        assert response_data["_embedded"]["elements"][0]["digest"]["algorithm"] == "md5"
+        assert response_data["items"][0]["digest"]["algorithm"] == "md5"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_list_attachments_paged_locally(self, server, base_url):
+        """Attachments are returned page by page with a next_cursor."""
+        import json
+
+        respx.get(f"{base_url}/wiki_pages/123/attachments").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "_type": "Collection",
+                    "total": 5,
+                    "count": 5,
+                    "_embedded": {"elements": [{"id": i} for i in range(1, 6)]},
+                },
+            )
+        )
+
+        first = json.loads(
+            (
+                await server.call_tool(
+                    "list_wiki_page_attachments",
+                    {"params": {"page_id": 123, "page_size": 2}},
+                )
+            )[0].text
+        )
+        assert [a["id"] for a in first["items"]] == [1, 2]
+        assert first["total"] == 5
+
+        cursor = first["next_cursor"]
+        ids = []
+        while cursor:
+            page = json.loads(
+                (
+                    await server.call_tool(
+                        "list_wiki_page_attachments",
+                        {"params": {"page_id": 123, "cursor": cursor}},
+                    )
+                )[0].text
+            )
+            ids.extend(a["id"] for a in page["items"])
+            cursor = page["next_cursor"]
+
+        assert ids == [3, 4, 5]
 
     @respx.mock
     @pytest.mark.asyncio
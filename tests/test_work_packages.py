@@ -5,6 +5,7 @@ Tests the add_comment tool and placeholders for unimplemented tools.
 Uses respx for HTTP mocking to avoid real API calls.
 """
 
+import asyncio
 import pytest
 import respx
 import httpx
@@ -15,7 +16,7 @@ from mcp.server.fastmcp.exceptions import ToolError
 
 from openproject_mcp.tools import work_packages
 
-from tests.helpers.mocks import mock_activity
+from tests.helpers.mocks import mock_activity, mock_work_package
 
 # ============================================================================
 # Fixtures
@@ -320,6 +321,141 @@ class TestAddComment:
         assert len(response_data["comment"]["raw"]) == 5000
 
 
+class TestAddCommentsBulk:
+    """Test suite for add_comments_bulk tool."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_posts_with_shared_and_per_item_values(self, server, base_url):
+        """Test items fall back to the shared comment and notify."""
+
+        def created(request):
+            wp_id = int(request.url.path.split("/")[-2])
+            body = json.loads(request.content)
+            return httpx.Response(
+                201, json=mock_activity(wp_id * 10, body["comment"]["raw"])
+            )
+
+        route = respx.post(url__regex=rf"{base_url}/work_packages/\d+/activities").mock(
+            side_effect=created
+        )
+
+        result = await server.call_tool(
+            "add_comments_bulk",
+            {
+                "params": {
+                    "comment": "Released in 2.4",
+                    "items": [
+                        {"id": 1},
+                        {"id": 2, "comment": "Hotfix in 2.4.1", "notify": True},
+                    ],
+                }
+            },
+        )
+
+        data = json.loads(result[0].text)
+        assert data["posted"] == 2 and data["failed"] == 0
+        assert [r["activity_id"] for r in data["results"]] == [10, 20]
+        sent = {
+            call.request.url.path: (
+                json.loads(call.request.content)["comment"]["raw"],
+                call.request.url.params["notify"],
+            )
+            for call in route.calls
+        }
+        assert sent == {
+            "/api/v3/work_packages/1/activities": ("Released in 2.4", "false"),
+            "/api/v3/work_packages/2/activities": ("Hotfix in 2.4.1", "true"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_requires_a_comment_for_every_item(self, server):
+        """Test items without text are rejected when there is no shared comment."""
+        result = await server.call_tool(
+            "add_comments_bulk",
+            {"params": {"items": [{"id": 1, "comment": "ok"}, {"id": 2}]}},
+        )
+
+        data = json.loads(result[0].text)
+        assert data["indexes"] == [1]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_failures_reported_per_item(self, server, base_url):
+        """Test a missing work package does not stop the batch."""
+        respx.post(f"{base_url}/work_packages/1/activities").mock(
+            return_value=httpx.Response(201, json=mock_activity(1, "x"))
+        )
+        respx.post(f"{base_url}/work_packages/2/activities").mock(
+            return_value=httpx.Response(404, json={"message": "Not found"})
+        )
+
+        result = await server.call_tool(
+            "add_comments_bulk",
+            {"params": {"comment": "x", "items": [{"id": 1}, {"id": 2}]}},
+        )
+
+        data = json.loads(result[0].text)
+        assert [r["status"] for r in data["results"]] == ["posted", "failed"]
+        assert "Resource not found" in data["results"][1]["error"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_stops_starting_items_once_rate_limited(self, server, base_url):
+        """Test a persistent 429 skips the comments not yet started."""
+        route = respx.post(url__regex=rf"{base_url}/work_packages/\d+/activities").mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "0"})
+        )
+
+        result = await server.call_tool(
+            "add_comments_bulk",
+            {
+                "params": {
+                    "comment": "x",
+                    "items": [{"id": i} for i in range(1, 6)],
+                    "concurrency": 1,
+                }
+            },
+        )
+
+        data = json.loads(result[0].text)
+        assert data["rate_limited"] is True
+        assert data["failed"] == 1 and data["skipped"] == 4
+        assert route.call_count == 3  # one item, retried by the client
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, server, base_url):
+        """Test no more than `concurrency` comments are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(201, json=mock_activity(1, "x"))
+
+        respx.post(url__regex=rf"{base_url}/work_packages/\d+/activities").mock(
+            side_effect=slow
+        )
+
+        await server.call_tool(
+            "add_comments_bulk",
+            {
+                "params": {
+                    "comment": "x",
+                    "items": [{"id": i} for i in range(1, 11)],
+                    "concurrency": 4,
+                }
+            },
+        )
+
+        assert peak == 4
+
+
 class TestSearchContent:
     """Test suite for search_content tool."""
 
@@ -468,6 +604,62 @@ class TestSearchContent:
         assert response_data["work_packages"]["count"] == 2
         assert response_data["projects"]["count"] == 1
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search_compact(self, server, base_url):
+        """Test compact output projects both work packages and projects."""
+        wp_route = respx.get(f"{base_url}/work_packages").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 1,
+                                "subject": "Login bug",
+                                "_links": {"status": {"title": "New"}},
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+        respx.get(f"{base_url}/projects").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "_embedded": {
+                        "elements": [{"id": 2, "identifier": "web", "name": "Web"}]
+                    },
+                },
+            )
+        )
+
+        result = await server.call_tool(
+            "search_content", {"params": {"query": "login", "output": "compact"}}
+        )
+
+        data = json.loads(result[0].text)
+        assert "elements/status" in wp_route.calls[0].request.url.params["select"]
+        assert data["work_packages"]["_embedded"]["elements"] == [
+            {
+                "id": 1,
+                "subject": "Login bug",
+                "status": "New",
+                "url": "https://test.openproject.com/work_packages/1",
+            }
+        ]
+        assert data["projects"]["_embedded"]["elements"] == [
+            {
+                "id": 2,
+                "identifier": "web",
+                "name": "Web",
+                "url": "https://test.openproject.com/projects/web",
+            }
+        ]
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_search_with_attachments(self, server, base_url):
@@ -889,6 +1081,119 @@ class TestSearchContent:
 
         assert "Authentication failed" in str(exc_info.value)
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search_all_sources_run_concurrently(self, server, base_url):
+        """Text, both attachment filters and projects are in flight together."""
+        in_flight = 0
+        peak = 0
+
+        def wp(id_):
+            return {"id": id_, "subject": f"WP {id_}"}
+
+        responses = {
+            "subjectOrId": [wp(1)],
+            "attachment_content": [wp(2)],
+            "attachment_file_name": [wp(3)],
+            "name_and_identifier": [{"id": 9, "identifier": "demo"}],
+        }
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            filters = unquote(request.url.params.get("filters", ""))
+            key = next(k for k in responses if k in filters)
+            return httpx.Response(200, json={"_embedded": {"elements": responses[key]}})
+
+        respx.get(f"{base_url}/work_packages").mock(side_effect=slow)
+        respx.get(f"{base_url}/projects").mock(side_effect=slow)
+
+        result = await server.call_tool(
+            "search_content",
+            {"params": {"query": "test", "include_attachments": True}},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert peak == 4
+        assert response_data["work_packages"]["count"] == 3
+        assert response_data["projects"]["count"] == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search_merge_preserves_ranking(self, server, base_url):
+        """Text hits come first, then content hits, then file name hits."""
+        responses = {
+            "subjectOrId": [{"id": 5}, {"id": 2}],
+            "attachment_content": [{"id": 2}, {"id": 7}, {"id": 1}],
+            "attachment_file_name": [{"id": 1}, {"id": 4}, {"id": 5}],
+        }
+
+        def mock_response(request):
+            filters = unquote(request.url.params.get("filters", ""))
+            key = next(k for k in responses if k in filters)
+            return httpx.Response(200, json={"_embedded": {"elements": responses[key]}})
+
+        respx.get(f"{base_url}/work_packages").mock(side_effect=mock_response)
+
+        result = await server.call_tool(
+            "search_content",
+            {
+                "params": {
+                    "query": "test",
+                    "scope": "work_packages",
+                    "include_attachments": True,
+                }
+            },
+        )
+
+        response_data = json.loads(result[0].text)
+        ids = [el["id"] for el in response_data["_embedded"]["elements"]]
+        assert ids == [5, 2, 7, 1, 4]
+        assert response_data["count"] == 5
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search_slow_attachment_filter_times_out(
+        self, mock_settings, base_url
+    ):
+        """A slow attachment filter is dropped instead of stalling the search."""
+        settings = mock_settings.model_copy(update={"search_source_timeout": 0.05})
+        server = FastMCP("test-openproject")
+        work_packages.register(server, settings)
+
+        async def mock_response(request):
+            filters = unquote(request.url.params.get("filters", ""))
+            if "subjectOrId" in filters:
+                return httpx.Response(
+                    200, json={"_embedded": {"elements": [{"id": 1}]}}
+                )
+            if "attachment_content" in filters:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json={"_embedded": {"elements": [{"id": 2}]}})
+
+        respx.get(f"{base_url}/work_packages").mock(side_effect=mock_response)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await server.call_tool(
+            "search_content",
+            {
+                "params": {
+                    "query": "test",
+                    "scope": "work_packages",
+                    "include_attachments": True,
+                }
+            },
+        )
+
+        assert loop.time() - started < 1
+        response_data = json.loads(result[0].text)
+        ids = [el["id"] for el in response_data["_embedded"]["elements"]]
+        assert ids == [1, 2]
+
 
 # ============================================================================
 # Test: get_work_package_statuses
@@ -1310,11 +1615,607 @@ class TestResolveType:
         assert len(response_data["matches"]) == 2
 
 
+class TestReferenceDataCaching:
+    """Test that status/type tools answer repeat calls from the cache."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolve_status_fetches_once(self, server, base_url):
+        """Repeat resolutions and listings reuse one /statuses fetch."""
+        statuses_response = {
+            "_embedded": {
+                "elements": [
+                    {"id": 1, "name": "New", "isClosed": False, "isDefault": True},
+                    {"id": 2, "name": "Closed", "isClosed": True, "isDefault": False},
+                ]
+            }
+        }
+        route = respx.get(f"{base_url}/statuses").mock(
+            return_value=httpx.Response(200, json=statuses_response)
+        )
+
+        await server.call_tool("resolve_status", {"params": {"name": "new"}})
+        result = await server.call_tool("resolve_status", {"params": {"name": "Clo"}})
+        await server.call_tool("get_work_package_statuses", {"params": {}})
+
+        assert route.call_count == 1
+        assert json.loads(result[0].text)["id"] == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolve_type_reuses_project_and_global_types(self, server, base_url):
+        """A miss fetches project and global types once; repeats hit the cache."""
+        project_route = respx.get(f"{base_url}/projects/123/types").mock(
+            return_value=httpx.Response(200, json={"_embedded": {"elements": []}})
+        )
+        global_route = respx.get(f"{base_url}/types").mock(
+            return_value=httpx.Response(
+                200, json={"_embedded": {"elements": [{"id": 5, "name": "Epic"}]}}
+            )
+        )
+
+        for _ in range(3):
+            await server.call_tool(
+                "resolve_type", {"params": {"project_id": 123, "name": "Epic"}}
+            )
+
+        assert project_route.call_count == 1
+        assert global_route.call_count == 1
+
+
+# ============================================================================
+# Test: get_work_packages
+# ============================================================================
+
+
+class TestGetWorkPackages:
+    """Test suite for the batch get_work_packages tool."""
+
+    @pytest.fixture
+    def small_page_server(self, mock_settings):
+        settings = mock_settings.model_copy(update={"page_size_max": 2})
+        server = FastMCP("test-openproject")
+        work_packages.register(server, settings)
+        return server
+
+    @staticmethod
+    def by_id_filter(existing):
+        in_flight = 0
+
+        async def respond(request):
+            nonlocal in_flight
+            in_flight += 1
+            respond.peak = max(respond.peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            filters = json.loads(request.url.params["filters"])
+            wanted = [int(i) for i in filters[0]["id"]["values"]]
+            # The server answers in its own order, not ours
+            found = sorted(i for i in wanted if i in existing)
+            return httpx.Response(
+                200,
+                json={
+                    "total": len(found),
+                    "pageSize": int(request.url.params["pageSize"]),
+                    "_embedded": {
+                        "elements": [{"id": i, "subject": f"WP {i}"} for i in found]
+                    },
+                },
+            )
+
+        respond.peak = 0
+        return respond
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_chunks_in_parallel_and_keeps_request_order(
+        self, small_page_server, base_url
+    ):
+        """Ids are fetched in page-sized chunks and returned as requested."""
+        respond = self.by_id_filter({1, 3, 5, 7})
+        route = respx.get(f"{base_url}/work_packages").mock(side_effect=respond)
+
+        result = await small_page_server.call_tool(
+            "get_work_packages", {"params": {"ids": [5, 3, 9, 1, 7, 3]}}
+        )
+
+        response_data = json.loads(result[0].text)
+        assert [wp["id"] for wp in response_data["items"]] == [5, 3, 1, 7]
+        assert response_data["missing"] == [9]
+        assert route.call_count == 3
+        assert respond.peak == 3
+        select = route.calls.last.request.url.params["select"]
+        assert "elements/subject" in select
+        assert "elements/status" in select
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_custom_fields_projection(self, server, base_url):
+        """Requested fields become the select projection (id always included)."""
+        route = respx.get(f"{base_url}/work_packages").mock(
+            side_effect=self.by_id_filter({4})
+        )
+
+        await server.call_tool(
+            "get_work_packages", {"params": {"ids": [4], "fields": ["subject"]}}
+        )
+
+        assert route.calls.last.request.url.params["select"] == (
+            "total,pageSize,elements/id,elements/subject"
+        )
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_all_fields_skips_select(self, server, base_url):
+        """fields=["*"] fetches full representations without a select."""
+        route = respx.get(f"{base_url}/work_packages").mock(
+            side_effect=self.by_id_filter({1})
+        )
+
+        result = await server.call_tool(
+            "get_work_packages", {"params": {"ids": [1], "fields": ["*"]}}
+        )
+
+        assert "select" not in route.calls.last.request.url.params
+        assert json.loads(result[0].text)["items"] == [{"id": 1, "subject": "WP 1"}]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_compact_output(self, server, base_url):
+        """Compact output selects and returns WorkPackageLite items."""
+        route = respx.get(f"{base_url}/work_packages").mock(
+            side_effect=self.by_id_filter({4})
+        )
+
+        result = await server.call_tool(
+            "get_work_packages", {"params": {"ids": [4], "output": "compact"}}
+        )
+
+        assert "elements/assignee" in route.calls.last.request.url.params["select"]
+        assert json.loads(result[0].text)["items"] == [
+            {
+                "id": 4,
+                "subject": "WP 4",
+                "url": "https://test.openproject.com/work_packages/4",
+            }
+        ]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_work_packages_unauthorized(self, server, base_url):
+        """HTTP errors are mapped like the other tools."""
+        respx.get(f"{base_url}/work_packages").mock(
+            return_value=httpx.Response(401, json={"message": "Unauthorized"})
+        )
+
+        with pytest.raises(ToolError) as exc_info:
+            await server.call_tool("get_work_packages", {"params": {"ids": [1]}})
+
+        assert "Authentication failed" in str(exc_info.value)
+
+
+# ============================================================================
+# Test: bulk_update_work_packages
+# ============================================================================
+
+
+class FakeWorkPackages:
+    """In-memory work packages enforcing lockVersion like OpenProject."""
+
+    def __init__(self, lock_versions, edited_by_others=()):
+        self.lock_versions = dict(lock_versions)
+        # Ids another user edits just before our first PATCH lands
+        self.edited_by_others = set(edited_by_others)
+        self.patches = []
+
+    def collection(self, request):
+        filters = json.loads(request.url.params["filters"])
+        wanted = [int(i) for i in filters[0]["id"]["values"]]
+        found = [
+            {"id": i, "lockVersion": self.lock_versions[i]}
+            for i in wanted
+            if i in self.lock_versions
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "total": len(found),
+                "pageSize": int(request.url.params["pageSize"]),
+                "_embedded": {"elements": found},
+            },
+        )
+
+    def patch(self, request):
+        wp_id = int(request.url.path.rsplit("/", 1)[1])
+        body = json.loads(request.content)
+        self.patches.append((wp_id, body))
+        if wp_id in self.edited_by_others:
+            self.edited_by_others.discard(wp_id)
+            self.lock_versions[wp_id] += 1
+        if body["lockVersion"] != self.lock_versions[wp_id]:
+            return httpx.Response(409, json={"message": "Conflict"})
+        self.lock_versions[wp_id] += 1
+        return httpx.Response(
+            200, json={"id": wp_id, "lockVersion": self.lock_versions[wp_id]}
+        )
+
+    def mock(self, base_url):
+        reads = respx.get(f"{base_url}/work_packages").mock(side_effect=self.collection)
+        respx.patch(url__regex=rf"{base_url}/work_packages/\d+").mock(
+            side_effect=self.patch
+        )
+        return reads
+
+
+class TestBulkUpdateWorkPackages:
+    """Test suite for bulk_update_work_packages tool."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_reads_lock_versions_in_one_batch(self, server, base_url):
+        """Test one collection read feeds every PATCH."""
+        fake = FakeWorkPackages({1: 3, 2: 7, 3: 1})
+        reads = fake.mock(base_url)
+
+        result = await server.call_tool(
+            "bulk_update_work_packages",
+            {"params": {"ids": [1, 2, 3], "changes": {"status_id": 12}}},
+        )
+
+        data = json.loads(result[0].text)
+        assert reads.call_count == 1
+        assert data["updated"] == 3
+        assert [r["lockVersion"] for r in data["results"]] == [4, 8, 2]
+        assert sorted((wp, body["lockVersion"]) for wp, body in fake.patches) == [
+            (1, 3),
+            (2, 7),
+            (3, 1),
+        ]
+        assert fake.patches[0][1]["_links"] == {
+            "status": {"href": "/api/v3/statuses/12"}
+        }
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_builds_payload_per_item(self, server, base_url):
+        """Test per-item changes, clearing links and custom fields."""
+        fake = FakeWorkPackages({1: 1, 2: 1})
+        fake.mock(base_url)
+
+        await server.call_tool(
+            "bulk_update_work_packages",
+            {
+                "params": {
+                    "updates": [
+                        {"id": 1, "assignee_id": 0, "version_id": 9},
+                        {
+                            "id": 2,
+                            "custom_fields": {
+                                "customField3": "ABC-1",
+                                "customField4": {"href": "/api/v3/users/5"},
+                            },
+                        },
+                    ]
+                }
+            },
+        )
+
+        bodies = dict(fake.patches)
+        assert bodies[1]["_links"] == {
+            "assignee": {"href": None},
+            "version": {"href": "/api/v3/versions/9"},
+        }
+        assert bodies[2]["customField3"] == "ABC-1"
+        assert bodies[2]["_links"] == {"customField4": {"href": "/api/v3/users/5"}}
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_conflicts_are_reread_and_retried(self, server, base_url):
+        """Test a 409 re-reads only the conflicting ids and retries them."""
+        fake = FakeWorkPackages({1: 1, 2: 1, 3: 1}, edited_by_others=[2, 3])
+        reads = fake.mock(base_url)
+
+        result = await server.call_tool(
+            "bulk_update_work_packages",
+            {"params": {"ids": [1, 2, 3], "changes": {"status_id": 4}}},
+        )
+
+        data = json.loads(result[0].text)
+        assert data["updated"] == 3 and data["conflict"] == 0
+        assert [r["attempts"] for r in data["results"]] == [1, 2, 2]
+        assert reads.call_count == 2
+        retried = json.loads(reads.calls[1].request.url.params["filters"])
+        assert retried[0]["id"]["values"] == ["2", "3"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_conflict_retries_are_bounded(self, server, base_url):
+        """Test a work package that keeps conflicting is reported, not looped."""
+        respx.patch(f"{base_url}/work_packages/1").mock(
+            return_value=httpx.Response(409, json={"message": "Conflict"})
+        )
+        FakeWorkPackages({1: 1}).mock(base_url)
+
+        result = await server.call_tool(
+            "bulk_update_work_packages",
+            {
+                "params": {
+                    "ids": [1],
+                    "changes": {"status_id": 4},
+                    "max_conflict_retries": 2,
+                }
+            },
+        )
+
+        data = json.loads(result[0].text)
+        assert data["results"][0]["status"] == "conflict"
+        assert data["results"][0]["attempts"] == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            httpx.Response(403, json={"message": "Forbidden"}),
+            httpx.ConnectError("connection refused"),
+        ],
+    )
+    async def test_failed_reread_keeps_results(self, server, base_url, failure):
+        """Test a re-read failing after a 409 still reports every item."""
+        fake = FakeWorkPackages({1: 1, 2: 1}, edited_by_others=[2])
+        reads = fake.mock(base_url)
+        reads.side_effect = [fake.collection, failure]
+
+        result = await server.call_tool(
+            "bulk_update_work_packages",
+            {"params": {"ids": [1, 2], "changes": {"status_id": 4}}},
+        )
+
+        data = json.loads(result[0].text)
+        assert data["updated"] == 1 and data["conflict"] == 1
+        assert data["results"][0]["status"] == "updated"
+        assert data["results"][1]["status"] == "conflict"
+        assert "re-reading the work package failed" in data["results"][1]["error"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_missing_and_failed_reported_per_item(self, server, base_url):
+        """Test invisible ids and rejected PATCHes do not stop the batch."""
+        respx.patch(f"{base_url}/work_packages/2").mock(
+            return_value=httpx.Response(422, json={"message": "Invalid status"})
+        )
+        FakeWorkPackages({1: 1, 2: 1}).mock(base_url)
+
+        result = await server.call_tool(
+            "bulk_update_work_packages",
+            {"params": {"ids": [1, 2, 3], "changes": {"status_id": 4}}},
+        )
+
+        data = json.loads(result[0].text)
+        assert [r["status"] for r in data["results"]] == [
+            "updated",
+            "failed",
+            "missing",
+        ]
+        assert "Validation failed" in data["results"][1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_custom_field(self, server):
+        """Test payloads are checked before any request."""
+        result = await server.call_tool(
+            "bulk_update_work_packages",
+            {"params": {"updates": [{"id": 1, "custom_fields": {"subject": "x"}}]}},
+        )
+
+        assert "not a custom field" in json.loads(result[0].text)["error"]
+
+
+# ============================================================================
+# Test: get_work_package_context
+# ============================================================================
+
+
+class TestGetWorkPackageContext:
+    """Test suite for get_work_package_context tool."""
+
+    @staticmethod
+    def collection(*elements):
+        return httpx.Response(
+            200,
+            json={
+                "_type": "Collection",
+                "total": len(elements),
+                "count": len(elements),
+                "_embedded": {"elements": list(elements)},
+            },
+        )
+
+    def mock_all(self, base_url, delay=0.0):
+        async def later(response):
+            await asyncio.sleep(delay)
+            return response
+
+        wp = mock_work_package(123, "Crash on login")
+        wp["_links"]["assignee"] = {"href": "/api/v3/users/7", "title": "Ada"}
+        wp["lockVersion"] = 4
+        routes = {
+            "wp": respx.get(f"{base_url}/work_packages/123").mock(
+                side_effect=lambda request: later(httpx.Response(200, json=wp))
+            ),
+            "activities": respx.get(f"{base_url}/work_packages/123/activities").mock(
+                side_effect=lambda request: later(
+                    self.collection(
+                        *(mock_activity(i, f"Comment {i}") for i in range(1, 6))
+                    )
+                )
+            ),
+            "attachments": respx.get(f"{base_url}/work_packages/123/attachments").mock(
+                side_effect=lambda request: later(
+                    self.collection(
+                        {
+                            "id": 9,
+                            "fileName": "trace.log",
+                            "fileSize": 2048,
+                            "_links": {"author": {"title": "Ada"}},
+                        }
+                    )
+                )
+            ),
+            "relations": respx.get(f"{base_url}/relations").mock(
+                side_effect=lambda request: later(
+                    self.collection(
+                        {
+                            "id": 3,
+                            "type": "blocks",
+                            "_links": {
+                                "from": {
+                                    "href": "/api/v3/work_packages/50",
+                                    "title": "Auth rewrite",
+                                },
+                                "to": {"href": "/api/v3/work_packages/123"},
+                            },
+                        }
+                    )
+                )
+            ),
+            "time_entries": respx.get(f"{base_url}/time_entries").mock(
+                side_effect=lambda request: later(
+                    self.collection(
+                        {
+                            "id": 11,
+                            "hours": "PT1H30M",
+                            "spentOn": "2025-01-10",
+                            "_links": {"user": {"title": "Ada"}},
+                        }
+                    )
+                )
+            ),
+        }
+        return routes
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_merges_all_resources(self, server, base_url):
+        """Test the merged document is compact and complete."""
+        routes = self.mock_all(base_url)
+
+        result = await server.call_tool(
+            "get_work_package_context",
+            {"params": {"wp_id": 123, "max_activities": 2}},
+        )
+
+        data = json.loads(result[0].text)
+        assert all(route.call_count == 1 for route in routes.values())
+        assert data["subject"] == "Crash on login"
+        assert data["description"] == "Test description"
+        assert data["status"] == "New" and data["assignee"] == "Ada"
+        assert data["lockVersion"] == 4
+        assert [a["comment"] for a in data["activities"]] == ["Comment 4", "Comment 5"]
+        assert data["attachments"][0]["fileName"] == "trace.log"
+        assert data["relations"] == [
+            {
+                "id": 3,
+                "type": "blocks",
+                "direction": "incoming",
+                "work_package_id": 50,
+                "work_package": "Auth rewrite",
+            }
+        ]
+        assert data["time_entries"][0]["hours"] == "PT1H30M"
+        assert "_links" not in data and "errors" not in data
+
+        filters = json.loads(
+            routes["time_entries"].calls[0].request.url.params["filters"]
+        )
+        assert filters == [{"work_package": {"operator": "=", "values": ["123"]}}]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently(self, server, base_url):
+        """Test the five requests overlap instead of running back to back."""
+        self.mock_all(base_url, delay=0.1)
+
+        started = asyncio.get_running_loop().time()
+        await server.call_tool("get_work_package_context", {"params": {"wp_id": 123}})
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert elapsed < 0.3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_secondary_failure_is_reported(self, server, base_url):
+        """Test an unreadable part leaves an empty list and an error entry."""
+        routes = self.mock_all(base_url)
+        routes["time_entries"].mock(
+            return_value=httpx.Response(403, json={"message": "Forbidden"})
+        )
+
+        result = await server.call_tool(
+            "get_work_package_context", {"params": {"wp_id": 123}}
+        )
+
+        data = json.loads(result[0].text)
+        assert data["time_entries"] == []
+        assert data["errors"] == {"time_entries": "Permission denied"}
+        assert len(data["activities"]) == 5
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_work_package_not_found(self, server, base_url):
+        """Test a missing work package fails the whole call."""
+        routes = self.mock_all(base_url)
+        routes["wp"].mock(
+            return_value=httpx.Response(404, json={"message": "Not found"})
+        )
+
+        with pytest.raises(ToolError) as exc_info:
+            await server.call_tool(
+                "get_work_package_context", {"params": {"wp_id": 123}}
+            )
+
+        assert "Resource not found" in str(exc_info.value)
+
+
 # ============================================================================
 # Test: append_work_package_description
 # ============================================================================
 
 
+class TestLockVersionCache:
+    """Test the bounded lockVersion cache behind append_work_package_description"""
+
+    def test_get_returns_fresh_entry(self):
+        cache = work_packages._LockVersions()
+        cache.put(1, 3, "text")
+
+        assert cache.get(1) == (3, "text")
+        assert cache.get(2) is None
+
+    def test_expired_entries_pruned_on_write(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(work_packages.time, "monotonic", lambda: now[0])
+        cache = work_packages._LockVersions(ttl=30.0)
+        cache.put(1, 1, "a")
+        cache.put(2, 1, "b")
+
+        now[0] += 31
+        assert cache.get(1) is None
+        cache.put(3, 1, "c")
+
+        assert len(cache) == 1
+
+    def test_size_is_capped_least_recently_written_first(self):
+        cache = work_packages._LockVersions(max_entries=2)
+        cache.put(1, 1, "a")
+        cache.put(2, 1, "b")
+        cache.put(1, 2, "a2")
+        cache.put(3, 1, "c")
+
+        assert len(cache) == 2
+        assert cache.get(2) is None
+        assert cache.get(1) == (2, "a2")
+
+
 class TestAppendWorkPackageDescription:
     """Test suite for append_work_package_description tool."""
 
@@ -1432,3 +2333,135 @@ class TestAppendWorkPackageDescription:
 
         assert get_route.called
         assert patch_route.called
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_append_description_retries_after_conflict(
+        self, server, base_url, monkeypatch
+    ):
+        """Test a 409 re-reads with a narrow select and reapplies the append."""
+        monkeypatch.setattr(work_packages, "APPEND_BACKOFF", 0)
+
+        get_route = respx.get(f"{base_url}/work_packages/123").mock(
+            return_value=httpx.Response(
+                200, json={"id": 123, "description": {"raw": "Old"}, "lockVersion": 5}
+            )
+        )
+        reread_route = respx.get(f"{base_url}/work_packages").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "pageSize": 1,
+                    "_embedded": {
+                        "elements": [
+                            {
+                                "id": 123,
+                                "description": {"raw": "Old\n\nOther bot"},
+                                "lockVersion": 6,
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+        patch_route = respx.patch(f"{base_url}/work_packages/123").mock(
+            side_effect=[
+                httpx.Response(409, json={"message": "Conflict"}),
+                httpx.Response(
+                    200,
+                    json={
+                        "id": 123,
+                        "description": {"raw": "Old\n\nOther bot\n\nNew"},
+                        "lockVersion": 7,
+                    },
+                ),
+            ]
+        )
+
+        result = await server.call_tool(
+            "append_work_package_description",
+            {"params": {"wp_id": 123, "markdown": "New"}},
+        )
+
+        assert get_route.call_count == 1
+        select = reread_route.calls.last.request.url.params["select"]
+        assert "elements/lockVersion" in select
+        assert "elements/description" in select
+        retry = json.loads(patch_route.calls.last.request.content)
+        assert retry == {
+            "description": {"raw": "Old\n\nOther bot\n\nNew"},
+            "lockVersion": 6,
+        }
+        assert json.loads(result[0].text)["lockVersion"] == 7
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_append_description_conflict_retries_are_capped(
+        self, server, base_url, monkeypatch
+    ):
+        """Test a work package that keeps conflicting raises an edit conflict."""
+        monkeypatch.setattr(work_packages, "APPEND_BACKOFF", 0)
+        monkeypatch.setattr(work_packages, "APPEND_CONFLICT_RETRIES", 2)
+
+        respx.get(f"{base_url}/work_packages/123").mock(
+            return_value=httpx.Response(200, json={"id": 123, "lockVersion": 5})
+        )
+        respx.get(f"{base_url}/work_packages").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "total": 1,
+                    "pageSize": 1,
+                    "_embedded": {"elements": [{"id": 123, "lockVersion": 5}]},
+                },
+            )
+        )
+        patch_route = respx.patch(f"{base_url}/work_packages/123").mock(
+            return_value=httpx.Response(409, json={"message": "Conflict"})
+        )
+
+        with pytest.raises(ToolError) as exc_info:
+            await server.call_tool(
+                "append_work_package_description",
+                {"params": {"wp_id": 123, "markdown": "New"}},
+            )
+
+        assert patch_route.call_count == 3
+        assert "Edit conflict" in str(exc_info.value)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_back_to_back_appends_skip_the_get(self, server, base_url):
+        """Test the lockVersion from our own update is reused."""
+        get_route = respx.get(f"{base_url}/work_packages/123").mock(
+            return_value=httpx.Response(
+                200, json={"id": 123, "description": {"raw": ""}, "lockVersion": 1}
+            )
+        )
+
+        def patched(request):
+            body = json.loads(request.content)
+            return httpx.Response(
+                200,
+                json={
+                    "id": 123,
+                    "description": body["description"],
+                    "lockVersion": body["lockVersion"] + 1,
+                },
+            )
+
+        patch_route = respx.patch(f"{base_url}/work_packages/123").mock(
+            side_effect=patched
+        )
+
+        for line in ("one", "two", "three"):
+            result = await server.call_tool(
+                "append_work_package_description",
+                {"params": {"wp_id": 123, "markdown": line}},
+            )
+
+        assert get_route.call_count == 1
+        sent = [json.loads(c.request.content) for c in patch_route.calls]
+        assert [body["lockVersion"] for body in sent] == [1, 2, 3]
+        assert json.loads(result[0].text)["description"]["raw"] == "one\n\ntwo\n\nthree"